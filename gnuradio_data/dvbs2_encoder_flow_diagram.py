@@ -26,7 +26,14 @@
 ##################################################
 
 
+import functools
+import os
+import shlex
+import sys
+import traceback
 from argparse import ArgumentParser
+from multiprocessing import Pool
+from typing import NamedTuple, Optional
 
 # pylint: disable=import-error
 import gnuradio  # type: ignore
@@ -35,6 +42,8 @@ from gnuradio import blocks, dtv, gr  # type: ignore
 
 # pylint: enable=import-error
 
+import dvbs2_encoder_model
+
 CODE_RATES = {
     dtv.C1_2: 1.0 / 2,
     dtv.C1_3: 1.0 / 3,
@@ -150,8 +159,13 @@ class UnknownFrameLength(Exception):
         )
 
 
+DUMP_FORMATS = ("floating_point", "fixed_point")
+
+
 class dvbs2_encoder(gr.top_block):
-    def __init__(self, constellation, frame_type, code_rate):
+    def __init__(
+        self, constellation, frame_type, code_rate, frames=1, dump_formats=DUMP_FORMATS
+    ):
         gr.top_block.__init__(self, "Dvbs2 Tx")
 
         ##################################################
@@ -172,6 +186,7 @@ class dvbs2_encoder(gr.top_block):
         ##################################################
         self.frame_type = frame_type
         self.constellation = constellation
+        self.dump_formats = dump_formats
         self.symbol_rate = symbol_rate = 5000000
         self.taps = taps = 32
         self.samp_rate = samp_rate = symbol_rate * 2
@@ -270,7 +285,8 @@ class dvbs2_encoder(gr.top_block):
         self.input_data_unpacked_sink.set_unbuffered(False)
 
         self.analog_random_source_x_0 = blocks.vector_source_b(
-            list(map(int, numpy.random.randint(0, 255, self.frame_length))), False
+            list(map(int, numpy.random.randint(0, 255, frames * self.frame_length))),
+            False,
         )
 
         # Create filter coefficients and apply to the FIR filters. We'll also
@@ -476,11 +492,17 @@ class dvbs2_encoder(gr.top_block):
         return length
 
     def dumpComplexAndFixedPoint(self, source, basename, size):
-        sink_complex = blocks.file_sink(
-            gr.sizeof_gr_complex * 1, basename + "_floating_point.bin", False
-        )
-        sink_complex.set_unbuffered(False)
-        self.connect((source, 0), (sink_complex, 0))
+        # Stick to GNU Radio's C++ blocks, a Python block would serialize
+        # every dump on the GIL
+        if "floating_point" in self.dump_formats:
+            sink_complex = blocks.file_sink(
+                gr.sizeof_gr_complex * 1, basename + "_floating_point.bin", False
+            )
+            sink_complex.set_unbuffered(False)
+            self.connect((source, 0), (sink_complex, 0))
+
+        if "fixed_point" not in self.dump_formats:
+            return
 
         data_width = 1 << (8 * size - 1)
         complex_to_float = blocks.complex_to_float(1)
@@ -538,32 +560,166 @@ def argument_parser():
             "C9_10",
         ),
     )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for the random input data"
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=1,
+        help="Number of frames to stream through the flow graph",
+    )
+    parser.add_argument(
+        "--dump-formats",
+        nargs="+",
+        choices=DUMP_FORMATS,
+        default=DUMP_FORMATS,
+        help="Formats to write complex streams in",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Run the jobs listed in MANIFEST ('-' for stdin) instead of a "
+        "single config. Each line is 'frame_type constellation code_rate "
+        "output_dir [seed [frames]]', empty lines and lines starting with '#' "
+        "are ignored",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes used in batch mode",
+    )
+
+    return parser.parse_args()
+
+
+class BatchJob(NamedTuple):
+    frame_type: str
+    constellation: str
+    code_rate: str
+    path: str
+    seed: Optional[int] = None
+    frames: int = 1
+
+
+def readManifest(fd):
+    "Parses batch jobs from a manifest file object"
+    jobs = []
+    for lineno, line in enumerate(fd, 1):
+        fields = shlex.split(line, comments=True)
+        if not fields:
+            continue
+        if not 4 <= len(fields) <= 6:
+            raise ValueError(f"Malformed batch job at line {lineno}: {repr(line)}")
+        frame_type, constellation, code_rate, path, *extra = fields
+        for name in (frame_type, constellation, code_rate):
+            if not hasattr(dtv, name):
+                raise ValueError(f"Unknown value {repr(name)} at line {lineno}")
+        jobs += [BatchJob(frame_type, constellation, code_rate, path, *map(int, extra))]
+    return jobs
+
+
+def runFlowGraph(  # pylint: disable=too-many-arguments
+    frame_type,
+    constellation,
+    code_rate,
+    seed=None,
+    frames=1,
+    dump_formats=DUMP_FORMATS,
+):
+    "Builds and runs the flow graph for a config, writing files to the CWD"
+    if seed is not None:
+        numpy.random.seed(seed)
+
+    tb = dvbs2_encoder(
+        constellation=getattr(dtv, constellation),
+        frame_type=getattr(dtv, frame_type),
+        code_rate=getattr(dtv, code_rate),
+        frames=frames,
+        dump_formats=dump_formats,
+    )
+    tb.start()
+    tb.wait()
 
-    args = parser.parse_args()
+    dvbs2_encoder_model.writeFrameIndex(
+        frame_type, constellation, code_rate, frames=frames
+    )
 
-    args.frame_type = getattr(dtv, args.frame_type)
-    args.constellation = getattr(dtv, args.constellation)
-    args.code_rate = getattr(dtv, args.code_rate)
 
-    return args
+def _runBatchJob(job, dump_formats=DUMP_FORMATS):
+    """
+    Runs a single batch job on a worker. Returns None on success or a
+    description of the error otherwise
+    """
+    cwd = os.getcwd()
+    try:
+        if not os.path.exists(job.path):
+            os.makedirs(job.path)
+        # File sinks write to the current directory
+        os.chdir(job.path)
+        runFlowGraph(
+            job.frame_type,
+            job.constellation,
+            job.code_rate,
+            job.seed,
+            job.frames,
+            dump_formats,
+        )
+    except Exception:  # pylint: disable=broad-except
+        return f"Job {job} failed:\n{traceback.format_exc()}"
+    finally:
+        os.chdir(cwd)
+    return None
+
+
+def runBatch(jobs, workers, dump_formats=DUMP_FORMATS):
+    """
+    Runs jobs on a pool of long lived workers, so that Python and GNU Radio
+    start up costs are paid once per worker instead of once per job. Returns
+    the number of failed jobs
+    """
+    errors = 0
+    # Forked workers inherit the already imported GNU Radio modules
+    with Pool(max(1, min(workers, len(jobs)))) as pool:
+        for job, error in zip(
+            jobs,
+            pool.imap(functools.partial(_runBatchJob, dump_formats=dump_formats), jobs),
+        ):
+            if error is None:
+                print(f"Finished {job.path}", flush=True)
+            else:
+                print(error, file=sys.stderr, flush=True)
+                errors += 1
+    return errors
 
 
 def writeCoefficientsToFile(data):
-    with open("polyphase_coefficients.bin", "w") as fd:
-        for coeff in data:
-            fd.write(str(coeff / 2) + "\n")
+    dvbs2_encoder_model.writeCoefficientsToFile(data, "polyphase_coefficients.bin")
 
 
-def main(top_block_cls=dvbs2_encoder, options=None):
+def main():
     args = argument_parser()
 
-    tb = top_block_cls(
-        constellation=args.constellation,
-        frame_type=args.frame_type,
-        code_rate=args.code_rate,
-    )
-    tb.start()
-    tb.wait()
+    if args.batch is None:
+        runFlowGraph(
+            args.frame_type,
+            args.constellation,
+            args.code_rate,
+            seed=args.seed,
+            frames=args.frames,
+            dump_formats=args.dump_formats,
+        )
+        return
+
+    if args.batch == "-":
+        jobs = readManifest(sys.stdin)
+    else:
+        with open(args.batch, "r") as fd:
+            jobs = readManifest(fd)
+
+    if jobs and runBatch(jobs, args.workers, args.dump_formats):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,1046 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"""
+NumPy model of the DVB-S2 Tx chain built by dvbs2_encoder_flow_diagram.py.
+Writes the same set of files as the GNU Radio flow graph, but runs in-process
+and does not depend on GNU Radio being installed.
+
+Stages mirror GNU Radio's gr-dtv blocks and complex values use the same single
+precision arithmetic. Use --check-gnuradio to compare the output of the model
+with the flow graph's (pass --all-configs to check every config). The
+modulated_pilots_* dumps are not compared, GNU Radio filters them using FFTW
+and this model uses a direct convolution.
+"""
+
+import logging
+import math
+import os
+import os.path as p
+import struct
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from functools import lru_cache
+
+import numpy  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+ROOT = p.abspath(p.join(p.dirname(__file__), ".."))
+
+# Files with real values (polyphase filter coefficients and modulation tables)
+# have a 12 byte header ("REAL", format version, 3 reserved bytes and the
+# number of values as a little endian uint32) followed by the values as
+# little endian float64. See read_real_table in
+# testbench/dvb_sim_utils_pkg.vhd
+REAL_TABLE_MAGIC = b"REAL"
+REAL_TABLE_VERSION = 1
+REAL_TABLE_HEADER = struct.Struct("<4sB3xI")
+
+FECFRAME_LENGTH = {"FECFRAME_NORMAL": 64_800, "FECFRAME_SHORT": 16_200}
+
+BBFRAME_LENGTH = {
+    "FECFRAME_NORMAL": {
+        "C1_4": 16008,
+        "C1_3": 21408,
+        "C2_5": 25728,
+        "C1_2": 32208,
+        "C3_5": 38688,
+        "C2_3": 43040,
+        "C3_4": 48408,
+        "C4_5": 51648,
+        "C5_6": 53840,
+        "C8_9": 57472,
+        "C9_10": 58192,
+    },
+    "FECFRAME_SHORT": {
+        "C1_4": 3072,
+        "C1_3": 5232,
+        "C2_5": 6312,
+        "C1_2": 7032,
+        "C3_5": 9552,
+        "C2_3": 10632,
+        "C3_4": 11712,
+        "C4_5": 12432,
+        "C5_6": 13152,
+        "C8_9": 14232,
+        "C9_10": 14412,
+    },
+}
+
+# BCH generator polynomials indexed by the number of parity bits (same as the
+# ones used by third_party/bch_generated)
+BCH_GENERATOR_POLYNOMIAL = {
+    128: 0x11C07255F712797BD19FC6D7504F9662B,
+    160: 0x160150CEDFC2A331F6A785703EFD12301B8BB6591,
+    168: 0x14062DBEA9869B262CD23A39069528FE7D7D11905A5,
+    192: 0x14E260E83845C511C50CF2CD8DC350889034785F7660255E7,
+}
+
+BITS_PER_SYMBOL = {"MOD_QPSK": 2, "MOD_8PSK": 3, "MOD_16APSK": 4, "MOD_32APSK": 5}
+
+# Order in which dtv.dvbs2_interleaver_bb reads the bit interleaver columns, the
+# first one goes on the MSB of each symbol. Configs not listed here read the
+# columns in order
+BIT_INTERLEAVER_COLUMN_ORDER = {
+    ("FECFRAME_NORMAL", "MOD_8PSK", "C3_5"): (2, 1, 0),
+    ("FECFRAME_SHORT", "MOD_8PSK", "C3_5"): (2, 1, 0),
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C3_5"): (3, 2, 1, 0),
+    ("FECFRAME_SHORT", "MOD_16APSK", "C3_5"): (3, 2, 0, 1),
+}
+
+# Configs checked against GNU Radio by --check-gnuradio: one per constellation
+# plus the ones with a special bit interleaver column order
+GNURADIO_CHECK_CONFIGS = (
+    ("FECFRAME_SHORT", "MOD_QPSK", "C1_2"),
+    ("FECFRAME_SHORT", "MOD_8PSK", "C2_3"),
+    ("FECFRAME_NORMAL", "MOD_8PSK", "C3_5"),
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C3_5"),
+    ("FECFRAME_SHORT", "MOD_16APSK", "C3_5"),
+    ("FECFRAME_SHORT", "MOD_32APSK", "C3_4"),
+)
+
+GNU_RADIO_FLOW_GRAPH = p.join(ROOT, "gnuradio_data", "dvbs2_encoder_flow_diagram.py")
+
+# Files that are not expected to match GNU Radio bit by bit: the polyphase
+# filter of the flow graph uses FFTW
+GNURADIO_INEXACT_FILES = (
+    "modulated_pilots_off_floating_point.bin",
+    "modulated_pilots_off_fixed_point.bin",
+    "modulated_pilots_on_floating_point.bin",
+    "modulated_pilots_on_fixed_point.bin",
+)
+
+MODCOD = {
+    ("MOD_QPSK", "C1_4"): 1,
+    ("MOD_QPSK", "C1_3"): 2,
+    ("MOD_QPSK", "C2_5"): 3,
+    ("MOD_QPSK", "C1_2"): 4,
+    ("MOD_QPSK", "C3_5"): 5,
+    ("MOD_QPSK", "C2_3"): 6,
+    ("MOD_QPSK", "C3_4"): 7,
+    ("MOD_QPSK", "C4_5"): 8,
+    ("MOD_QPSK", "C5_6"): 9,
+    ("MOD_QPSK", "C8_9"): 10,
+    ("MOD_QPSK", "C9_10"): 11,
+    ("MOD_8PSK", "C3_5"): 12,
+    ("MOD_8PSK", "C2_3"): 13,
+    ("MOD_8PSK", "C3_4"): 14,
+    ("MOD_8PSK", "C5_6"): 15,
+    ("MOD_8PSK", "C8_9"): 16,
+    ("MOD_8PSK", "C9_10"): 17,
+    ("MOD_16APSK", "C2_3"): 18,
+    ("MOD_16APSK", "C3_4"): 19,
+    ("MOD_16APSK", "C4_5"): 20,
+    ("MOD_16APSK", "C5_6"): 21,
+    ("MOD_16APSK", "C8_9"): 22,
+    ("MOD_16APSK", "C9_10"): 23,
+    ("MOD_32APSK", "C3_4"): 24,
+    ("MOD_32APSK", "C4_5"): 25,
+    ("MOD_32APSK", "C5_6"): 26,
+    ("MOD_32APSK", "C8_9"): 27,
+    ("MOD_32APSK", "C9_10"): 28,
+}
+
+# Same values as dvbs2_encoder_flow_diagram.py
+MODULATOR_OUTPUT_SCALING_FACTOR = {
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C2_3"): 1.1357805960496432,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C3_4"): 1.1317122612043418,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C3_5"): 1.1408944401668009,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C4_5"): 1.130064093262531,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C5_6"): 1.1291735004211465,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C8_9"): 1.127242960381356,
+    ("FECFRAME_NORMAL", "MOD_16APSK", "C9_10"): 1.126621516078321,
+    ("FECFRAME_NORMAL", "MOD_32APSK", "C3_4"): 1.2768096671118951,
+    ("FECFRAME_NORMAL", "MOD_32APSK", "C4_5"): 1.2677026999872547,
+    ("FECFRAME_NORMAL", "MOD_32APSK", "C5_6"): 1.2626890498906358,
+    ("FECFRAME_NORMAL", "MOD_32APSK", "C8_9"): 1.2542139595410673,
+    ("FECFRAME_NORMAL", "MOD_32APSK", "C9_10"): 1.253354710666101,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C2_3"): 1.1357805960496432,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C3_4"): 1.1317122612043418,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C3_5"): 1.1408944401668009,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C4_5"): 1.130064093262531,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C5_6"): 1.1291735004211465,
+    ("FECFRAME_SHORT", "MOD_16APSK", "C8_9"): 1.127242960381356,
+    ("FECFRAME_SHORT", "MOD_32APSK", "C3_4"): 1.2768096671118951,
+    ("FECFRAME_SHORT", "MOD_32APSK", "C4_5"): 1.2677026999872547,
+    ("FECFRAME_SHORT", "MOD_32APSK", "C5_6"): 1.2626890498906358,
+    ("FECFRAME_SHORT", "MOD_32APSK", "C8_9"): 1.2542139595410673,
+}
+
+PHYSICAL_LAYER_HEADER_LENGTH = 90
+PHYSICAL_LAYER_SOF = 0x18D2E82
+PHYSICAL_LAYER_SIGNALLING_SCRAMBLER = 0x719D83C953422DFA
+PHYSICAL_LAYER_SIGNALLING_GENERATOR = (
+    0x55555555,
+    0x33333333,
+    0x0F0F0F0F,
+    0x00FF00FF,
+    0x0000FFFF,
+    0xFFFFFFFF,
+)
+
+# Parameters of the RRC filter used to generate the modulated_pilots_* files
+SYMBOL_RATE = 5_000_000
+SAMPLE_RATE = 2 * SYMBOL_RATE
+ROLLOFF = 0.2
+TAPS = 32
+
+
+def getLdpcTable(frame_type, code_rate):
+    """
+    Unrolls the LDPC table from misc/ldpc for the given config, where each row
+    of the CSV file maps to 360 consecutive information bits. Returns a tuple
+    (offsets, is_last, bit_index) of flat arrays in the order the encoder
+    consumes them, where offset = (coefficient + (bit_index % 360) * q) % length
+    """
+    path = p.join(ROOT, "misc", "ldpc", f"ldpc_table_{frame_type}_{code_rate}.csv")
+    with open(path, "r") as fd:
+        rows = [
+            numpy.array(line.split(","), dtype=numpy.int64)
+            for line in fd.read().split("\n")
+            if line
+        ]
+
+    length = FECFRAME_LENGTH[frame_type] - 360 * len(rows)
+    q = length // 360
+    steps = numpy.arange(360, dtype=numpy.int64)[:, None] * q
+
+    offsets = []
+    is_last = []
+    bit_index = []
+
+    for row_number, row in enumerate(rows):
+        offsets += [((row[None, :] + steps) % length).ravel()]
+        last = numpy.zeros(len(row), dtype=numpy.uint8)
+        last[-1] = 1
+        is_last += [numpy.tile(last, 360)]
+        bit_index += [
+            numpy.repeat(
+                numpy.arange(360 * row_number, 360 * (row_number + 1)), len(row)
+            )
+        ]
+
+    return (
+        numpy.concatenate(offsets),
+        numpy.concatenate(is_last),
+        numpy.concatenate(bit_index),
+    )
+
+
+@lru_cache(maxsize=None)
+def _getLdpcTable(frame_type, code_rate):
+    return getLdpcTable(frame_type, code_rate)
+
+
+@lru_cache(maxsize=None)
+def _getBbScramblerSequence():
+    "PRBS 1 + X^14 + X^15 as per EN 302 307-1, section 5.2.2"
+    register = 0x4A80
+    sequence = numpy.zeros(FECFRAME_LENGTH["FECFRAME_NORMAL"], dtype=numpy.uint8)
+    for i in range(len(sequence)):
+        bit = (register ^ (register >> 1)) & 1
+        sequence[i] = bit
+        register >>= 1
+        if bit:
+            register |= 0x4000
+    return sequence
+
+
+@lru_cache(maxsize=None)
+def _getBchRemainderTable(parity_length):
+    "Table to calculate the BCH parity one byte at a time, CRC style"
+    polynomial = BCH_GENERATOR_POLYNOMIAL[parity_length]
+    table = []
+    for byte in range(256):
+        register = byte << (parity_length - 8)
+        for _ in range(8):
+            register <<= 1
+            if register >> parity_length:
+                register ^= polynomial
+        table += [register]
+    return table
+
+
+@lru_cache(maxsize=None)
+def _getPlScramblerSequence():
+    """
+    Complex scrambling sequence R(i) for gold code 0 as per EN 302 307-1,
+    section 5.5.4. Values are 0, 1, 2 or 3 for multiplying by 1, j, -1 or -j
+    """
+    frame_length = FECFRAME_LENGTH["FECFRAME_NORMAL"]
+    length = (1 << 17) + frame_length
+    x = [1] + [0] * 17
+    y = [1] * 18
+    for i in range(length - 18):
+        x.append(x[i + 7] ^ x[i])
+        y.append(y[i + 10] ^ y[i + 7] ^ y[i + 5] ^ y[i])
+    z = numpy.array(x, dtype=numpy.uint8) ^ numpy.array(y, dtype=numpy.uint8)
+    return 2 * z[1 << 17 : (1 << 17) + frame_length] + z[:frame_length]
+
+
+def _getRootRaisedCosine(gain, sampling_freq, symbol_rate, alpha, ntaps):
+    "Same as gnuradio.filter.firdes.root_raised_cosine, including rounding"
+    ntaps |= 1
+    spb = sampling_freq / symbol_rate
+    taps = numpy.zeros(ntaps, dtype=numpy.float32)
+    scale = 0.0
+    for i in range(ntaps):
+        xindx = float(i - ntaps // 2)
+        x1 = math.pi * xindx / spb
+        x2 = 4 * alpha * xindx / spb
+        x3 = x2 * x2 - 1
+
+        if abs(x3) >= 0.000001:
+            if i != ntaps // 2:
+                num = math.cos((1 + alpha) * x1) + math.sin((1 - alpha) * x1) / (
+                    4 * alpha * xindx / spb
+                )
+            else:
+                num = math.cos((1 + alpha) * x1) + (1 - alpha) * math.pi / (4 * alpha)
+            den = x3 * math.pi
+        else:
+            x3 = (1 - alpha) * x1
+            x2 = (1 + alpha) * x1
+            num = (
+                math.sin(x2) * (1 + alpha) * math.pi
+                - math.cos(x3) * ((1 - alpha) * math.pi * spb) / (4 * alpha * xindx)
+                + math.sin(x3) * spb * spb / (4 * alpha * xindx * xindx)
+            )
+            den = -32 * math.pi * alpha * alpha * xindx / spb
+
+        taps[i] = 4 * alpha * num / den
+        scale += float(taps[i])
+
+    for i in range(ntaps):
+        taps[i] = float(taps[i]) * gain / scale
+
+    return taps
+
+
+def _getConstellation(frame_type, constellation, code_rate):
+    """
+    Constellation points as created by GNU Radio's dvbs2_modulator_bc (i.e.,
+    not scaled to fit [-1, 1))
+    """
+    # pylint: disable=invalid-name
+    if constellation == "MOD_QPSK":
+        angles = (1, 7, 3, 5)
+        points = [
+            (math.cos(a * math.pi / 4.0), math.sin(a * math.pi / 4.0)) for a in angles
+        ]
+    elif constellation == "MOD_8PSK":
+        angles = (1, 0, 4, 5, 2, 7, 3, 6)
+        points = [
+            (math.cos(a * math.pi / 4.0), math.sin(a * math.pi / 4.0)) for a in angles
+        ]
+    elif constellation == "MOD_16APSK":
+        r2 = 1.0
+        r1 = {
+            "C2_3": r2 / 3.15,
+            "C3_4": r2 / 2.85,
+            "C4_5": r2 / 2.75,
+            "C5_6": r2 / 2.70,
+            "C8_9": r2 / 2.60,
+            "C9_10": r2 / 2.57,
+            "C3_5": r2 / 3.70,
+        }.get(code_rate, 0.0)
+        if frame_type == "FECFRAME_SHORT" and code_rate == "C9_10":
+            r1 = 0.0
+
+        r0 = math.sqrt(4.0 / ((r1 * r1) + 3.0 * (r2 * r2)))
+        r1 = r0 * r1
+        r2 = r0 * r2
+
+        points = [
+            (r * math.cos(angle), r * math.sin(angle))
+            for r, angle in (
+                (r2, math.pi / 4),
+                (r2, -math.pi / 4),
+                (r2, 3 * math.pi / 4),
+                (r2, -3 * math.pi / 4),
+                (r2, math.pi / 12),
+                (r2, -math.pi / 12),
+                (r2, 11 * math.pi / 12),
+                (r2, -11 * math.pi / 12),
+                (r2, 5 * math.pi / 12),
+                (r2, -5 * math.pi / 12),
+                (r2, 7 * math.pi / 12),
+                (r2, -7 * math.pi / 12),
+                (r1, math.pi / 4),
+                (r1, -math.pi / 4),
+                (r1, 3 * math.pi / 4),
+                (r1, -3 * math.pi / 4),
+            )
+        ]
+    elif constellation == "MOD_32APSK":
+        r3 = 1.0
+        r1 = {
+            "C3_4": r3 / 5.27,
+            "C4_5": r3 / 4.87,
+            "C5_6": r3 / 4.64,
+            "C8_9": r3 / 4.33,
+            "C9_10": r3 / 4.30,
+        }.get(code_rate, 0.0)
+        r2 = {
+            "C3_4": r1 * 2.84,
+            "C4_5": r1 * 2.72,
+            "C5_6": r1 * 2.64,
+            "C8_9": r1 * 2.54,
+            "C9_10": r1 * 2.53,
+        }.get(code_rate, 0.0)
+
+        r0 = math.sqrt(8.0 / ((r1 * r1) + 3.0 * (r2 * r2) + 4.0 * (r3 * r3)))
+        r1 *= r0
+        r2 *= r0
+        r3 *= r0
+
+        points = [
+            (r * math.cos(angle), r * math.sin(angle))
+            for r, angle in (
+                (r2, math.pi / 4),
+                (r2, 5 * math.pi / 12),
+                (r2, -math.pi / 4),
+                (r2, -5 * math.pi / 12),
+                (r2, 3 * math.pi / 4),
+                (r2, 7 * math.pi / 12),
+                (r2, -3 * math.pi / 4),
+                (r2, -7 * math.pi / 12),
+                (r3, math.pi / 8),
+                (r3, 3 * math.pi / 8),
+                (r3, -math.pi / 4),
+                (r3, -math.pi / 2),
+                (r3, 3 * math.pi / 4),
+                (r3, math.pi / 2),
+                (r3, -7 * math.pi / 8),
+                (r3, -5 * math.pi / 8),
+                (r2, math.pi / 12),
+                (r1, math.pi / 4),
+                (r2, -math.pi / 12),
+                (r1, -math.pi / 4),
+                (r2, 11 * math.pi / 12),
+                (r1, 3 * math.pi / 4),
+                (r2, -11 * math.pi / 12),
+                (r1, -3 * math.pi / 4),
+                (r3, 0),
+                (r3, math.pi / 4),
+                (r3, -math.pi / 8),
+                (r3, -3 * math.pi / 8),
+                (r3, 7 * math.pi / 8),
+                (r3, 5 * math.pi / 8),
+                (r3, math.pi),
+                (r3, -3 * math.pi / 4),
+            )
+        ]
+    else:
+        assert False, f"Unknown constellation: {constellation}"
+    # pylint: enable=invalid-name
+
+    return _toComplex(points)
+
+
+def _toComplex(points):
+    "Converts (real, imag) tuples into single precision complex values"
+    result = numpy.zeros(len(points), dtype=numpy.complex64)
+    result.real = [real for real, _ in points]
+    result.imag = [imag for _, imag in points]
+    return result
+
+
+def _pack(data, bits_per_input=1):
+    "Same as repack_bits_bb(bits_per_input, 8, MSB first)"
+    data = numpy.asarray(data, dtype=numpy.uint8)
+    if bits_per_input != 1:
+        shifts = numpy.arange(bits_per_input - 1, -1, -1, dtype=numpy.uint8)
+        data = ((data[:, None] >> shifts) & 1).ravel()
+    return numpy.packbits(data)
+
+
+def _keepMInN(data, m, n, offset):
+    "Same as blocks.keep_m_in_n, blocks of n items not complete are dropped"
+    blocks = len(data) // n
+    return data[: blocks * n].reshape(blocks, n)[:, offset : offset + m].ravel()
+
+
+def _toFixedPoint(data, width=16):
+    "Same as complex_to_float + float_to_short + stream_mux"
+    scale = numpy.float32(1 << (width - 1))
+    interleaved = numpy.empty(2 * len(data), dtype=numpy.float32)
+    interleaved[0::2] = data.real
+    interleaved[1::2] = data.imag
+    interleaved *= scale
+    return numpy.rint(numpy.clip(interleaved, -scale, scale - 1)).astype(numpy.int16)
+
+
+class Dvbs2EncoderModel:
+    """
+    Encodes BBFRAMEs for a given config and dumps the output of each stage the
+    same way dvbs2_encoder_flow_diagram.dvbs2_encoder does
+    """
+
+    def __init__(self, frame_type, constellation, code_rate):
+        self.frame_type = frame_type
+        self.constellation = constellation
+        self.code_rate = code_rate
+
+        self.frame_length = BBFRAME_LENGTH[frame_type][code_rate] // 8
+        self.bits_per_symbol = BITS_PER_SYMBOL[constellation]
+        self.slots = FECFRAME_LENGTH[frame_type] // self.bits_per_symbol // 90
+
+    def getRandomFrame(self, seed=None, frames=1):
+        """
+        Random BBFRAME data, same range used by the flow graph. If frames is
+        more than 1, frames are concatenated
+        """
+        return (
+            numpy.random.RandomState(seed)
+            .randint(0, 255, frames * self.frame_length)
+            .astype(numpy.uint8)
+        )
+
+    def basebandScrambler(self, bits):
+        "Same as dtv.dvb_bbscrambler_bb"
+        return bits ^ _getBbScramblerSequence()[: len(bits)]
+
+    def bchEncoder(self, bits):
+        "Same as dtv.dvb_bch_bb, appends the parity bits to the data"
+        parity_length = self.getLdpcInfoLength() - len(bits)
+        table = _getBchRemainderTable(parity_length)
+        mask = (1 << parity_length) - 1
+        shift = parity_length - 8
+
+        register = 0
+        for byte in numpy.packbits(bits).tolist():
+            register = ((register << 8) & mask) ^ table[(register >> shift) ^ byte]
+
+        parity = numpy.frombuffer(
+            register.to_bytes(parity_length // 8, "big"), dtype=numpy.uint8
+        )
+        return numpy.concatenate([bits, numpy.unpackbits(parity)])
+
+    def getLdpcInfoLength(self):
+        "Number of information bits of the LDPC code"
+        _, _, bit_index = _getLdpcTable(self.frame_type, self.code_rate)
+        return int(bit_index[-1]) + 1
+
+    def ldpcEncoder(self, bits):
+        "Same as dtv.dvb_ldpc_bb, appends the parity bits to the data"
+        offsets, _, bit_index = _getLdpcTable(self.frame_type, self.code_rate)
+        length = FECFRAME_LENGTH[self.frame_type] - len(bits)
+        parity = numpy.bincount(offsets[bits[bit_index] == 1], minlength=length)
+        parity = numpy.cumsum(parity & 1) & 1
+        return numpy.concatenate([bits, parity.astype(numpy.uint8)])
+
+    def bitInterleaver(self, bits):
+        """
+        Same as dtv.dvbs2_interleaver_bb, each output item has the bits of a
+        single symbol
+        """
+        if self.constellation == "MOD_QPSK":
+            pairs = bits.reshape(-1, 2)
+            return (pairs[:, 0] << 1) | pairs[:, 1]
+
+        columns = bits.reshape(self.bits_per_symbol, -1)
+        order = BIT_INTERLEAVER_COLUMN_ORDER.get(
+            (self.frame_type, self.constellation, self.code_rate),
+            range(self.bits_per_symbol),
+        )
+
+        symbols = numpy.zeros(columns.shape[1], dtype=numpy.uint8)
+        for column in order:
+            symbols = (symbols << 1) | columns[column]
+        return symbols
+
+    def modulator(self, symbols):
+        """
+        Same as dtv.dvbs2_modulator_bc followed by the multiply_const_vcc that
+        scales the constellation to [-1, 1)
+        """
+        points = _getConstellation(self.frame_type, self.constellation, self.code_rate)
+        scaling_factor = MODULATOR_OUTPUT_SCALING_FACTOR.get(
+            (self.frame_type, self.constellation, self.code_rate), 1.0
+        )
+        points *= numpy.float32(1.0 / scaling_factor)
+        return points[symbols]
+
+    def getPhysicalLayerHeader(self, pilots):
+        "PLHEADER symbols (SOF + PLS code) as per EN 302 307-1, section 5.5.2"
+        code = MODCOD.get((self.constellation, self.code_rate), 0) << 2
+        if self.frame_type == "FECFRAME_SHORT":
+            code |= 2
+        if pilots:
+            code |= 1
+
+        codeword = 0
+        for i, row in enumerate(PHYSICAL_LAYER_SIGNALLING_GENERATOR):
+            if code & (0x40 >> i):
+                codeword ^= row
+
+        bits = [(PHYSICAL_LAYER_SOF >> (25 - i)) & 1 for i in range(26)]
+        for i in range(32):
+            bit = (codeword >> (31 - i)) & 1
+            bits += [bit, bit ^ (code & 1)]
+        for i in range(64):
+            bits[26 + i] ^= (PHYSICAL_LAYER_SIGNALLING_SCRAMBLER >> (63 - i)) & 1
+
+        # pi/2 BPSK
+        bpsk = (
+            (
+                (math.cos(math.pi / 4.0), math.sin(math.pi / 4.0)),
+                (math.cos(5.0 * math.pi / 4.0), math.sin(5.0 * math.pi / 4.0)),
+            ),
+            (
+                (math.cos(5.0 * math.pi / 4.0), math.sin(math.pi / 4.0)),
+                (math.cos(math.pi / 4.0), math.sin(5.0 * math.pi / 4.0)),
+            ),
+        )
+        return _toComplex([bpsk[i & 1][bit] for i, bit in enumerate(bits)])
+
+    def physicalLayerFramer(self, symbols, pilots):
+        """
+        Same as dtv.dvbs2_physical_cc but without the zero stuffing, i.e.,
+        PLHEADER + scrambled payload (and pilots if enabled)
+        """
+        pilot = _toComplex([(math.cos(math.pi / 4.0), math.sin(math.pi / 4.0))])
+        frames = []
+        for frame in symbols.reshape(-1, self.slots * 90):
+            if pilots:
+                # Pilot blocks go after every 16 slots except after the last one
+                pilot_blocks = (self.slots - 1) // 16
+                groups = numpy.split(
+                    frame, [1440 * (i + 1) for i in range(pilot_blocks)]
+                )
+                payload = [groups[0]]
+                for group in groups[1:]:
+                    payload += [numpy.repeat(pilot, 36), group]
+                frame = numpy.concatenate(payload)
+
+            # Rotate by 1, j, -1 or -j by swapping/negating real and imaginary
+            # parts
+            scrambler = _getPlScramblerSequence()[: len(frame)]
+            rotations = [scrambler == i for i in range(4)]
+            scrambled = numpy.zeros(len(frame), dtype=numpy.complex64)
+            scrambled.real = numpy.select(
+                rotations, [frame.real, -frame.imag, -frame.real, frame.imag]
+            )
+            scrambled.imag = numpy.select(
+                rotations, [frame.imag, frame.real, -frame.imag, -frame.real]
+            )
+            frames += [self.getPhysicalLayerHeader(pilots), scrambled]
+
+        return numpy.concatenate(frames)
+
+    def getPhysicalLayerFrameSize(self, pilots):
+        """
+        Frame size as calculated by the flow graph to split header and payload,
+        must be kept identical to it so that dumps match
+        """
+        length = 90 * (self.slots + 1)
+        if pilots:
+            return length + ((self.slots - 1) // 16)
+        return length
+
+    def getPhysicalLayerFrameLength(self, pilots):
+        "Actual number of symbols of each PLFRAME (without stuffing)"
+        length = 90 * (self.slots + 1)
+        if pilots:
+            return length + 36 * ((self.slots - 1) // 16)
+        return length
+
+    def getFrameSizes(self):
+        """
+        Returns a dict mapping the output file names to the number of bytes
+        each frame takes in them. Dumps whose frames don't have a fixed size
+        are not listed
+        """
+        fecframe_length = FECFRAME_LENGTH[self.frame_type]
+        symbols = fecframe_length // self.bits_per_symbol
+
+        sizes = {
+            "input_data_packed.bin": self.frame_length,
+            "input_data_unpacked.bin": 8 * self.frame_length,
+            "bch_encoder_input.bin": 8 * self.frame_length,
+            "bb_scrambler_output_packed.bin": self.frame_length,
+            "ldpc_encoder_input.bin": self.getLdpcInfoLength(),
+            "bch_encoder_output_packed.bin": self.getLdpcInfoLength() // 8,
+            "bit_interleaver_input.bin": fecframe_length,
+            "ldpc_output_packed.bin": fecframe_length // 8,
+            "bit_interleaver_output.bin": symbols,
+            "bit_interleaver_output_packed.bin": fecframe_length // 8,
+        }
+
+        def addComplexAndFixedPoint(basename, items):
+            sizes[f"{basename}_floating_point.bin"] = 8 * items
+            sizes[f"{basename}_fixed_point.bin"] = 4 * items
+
+        addComplexAndFixedPoint("bit_mapper_output", symbols)
+
+        for pilots, suffix in ((False, "pilots_off"), (True, "pilots_on")):
+            frame_size = self.getPhysicalLayerFrameSize(pilots)
+            header_length = PHYSICAL_LAYER_HEADER_LENGTH
+            addComplexAndFixedPoint(
+                f"plframe_{suffix}", self.getPhysicalLayerFrameLength(pilots)
+            )
+            # The flow graph splits header and payload every frame_size symbols,
+            # which with pilots is shorter than the actual PLFRAME, so the split
+            # dumps are only aligned to frames up to the end of the first one
+            if not pilots:
+                addComplexAndFixedPoint(f"plframe_header_{suffix}", header_length)
+                addComplexAndFixedPoint(
+                    f"plframe_payload_{suffix}", frame_size - header_length
+                )
+            # Symbols are zero stuffed before filtering
+            addComplexAndFixedPoint(
+                f"modulated_{suffix}", 2 * self.getPhysicalLayerFrameLength(pilots)
+            )
+
+        return sizes
+
+    def run(self, data):
+        """
+        Runs data through all stages and returns a dict mapping the flow
+        graph's output file names to their contents. data can have multiple
+        frames, in which case they're encoded back to back as the flow graph
+        would
+        """
+        result = {}
+        frames = data.reshape(-1, self.frame_length)
+        bits = numpy.unpackbits(data)
+        result["input_data_packed.bin"] = data
+        result["input_data_unpacked.bin"] = bits
+
+        bb_scrambler = [self.basebandScrambler(numpy.unpackbits(x)) for x in frames]
+        result["bch_encoder_input.bin"] = numpy.concatenate(bb_scrambler)
+        result["bb_scrambler_output_packed.bin"] = _pack(
+            result["bch_encoder_input.bin"]
+        )
+
+        bch_encoder = [self.bchEncoder(x) for x in bb_scrambler]
+        result["ldpc_encoder_input.bin"] = numpy.concatenate(bch_encoder)
+        result["bch_encoder_output_packed.bin"] = _pack(
+            result["ldpc_encoder_input.bin"]
+        )
+
+        ldpc_encoder = [self.ldpcEncoder(x) for x in bch_encoder]
+        result["bit_interleaver_input.bin"] = numpy.concatenate(ldpc_encoder)
+        result["ldpc_output_packed.bin"] = _pack(result["bit_interleaver_input.bin"])
+
+        bit_interleaver = numpy.concatenate(
+            [self.bitInterleaver(x) for x in ldpc_encoder]
+        )
+        result["bit_interleaver_output.bin"] = bit_interleaver
+        result["bit_interleaver_output_packed.bin"] = _pack(
+            bit_interleaver, self.bits_per_symbol
+        )
+
+        bit_mapper = self.modulator(bit_interleaver)
+        result.update(self._getComplexAndFixedPoint("bit_mapper_output", bit_mapper))
+
+        filter_coefficients = _getRootRaisedCosine(
+            1.0, SAMPLE_RATE, SAMPLE_RATE / 2, ROLLOFF, TAPS
+        )
+
+        # FFT filter only processes complete blocks of fftsize - ntaps + 1
+        # items, with fftsize being twice the next power of 2 of ntaps
+        fft_size = 2 * (1 << math.ceil(math.log2(len(filter_coefficients))))
+        filter_block = fft_size - len(filter_coefficients) + 1
+
+        for pilots, suffix in ((False, "pilots_off"), (True, "pilots_on")):
+            plframe = self.physicalLayerFramer(bit_mapper, pilots)
+            frame_size = self.getPhysicalLayerFrameSize(pilots)
+            header_length = PHYSICAL_LAYER_HEADER_LENGTH
+
+            result.update(self._getComplexAndFixedPoint(f"plframe_{suffix}", plframe))
+            result.update(
+                self._getComplexAndFixedPoint(
+                    f"plframe_header_{suffix}",
+                    _keepMInN(plframe, header_length, frame_size, 0),
+                )
+            )
+            result.update(
+                self._getComplexAndFixedPoint(
+                    f"plframe_payload_{suffix}",
+                    _keepMInN(
+                        plframe, frame_size - header_length, frame_size, header_length
+                    ),
+                )
+            )
+
+            # The physical layer framer stuffs a zero after each symbol
+            stuffed = numpy.zeros(2 * len(plframe), dtype=numpy.complex64)
+            stuffed[0::2] = plframe
+            modulated = numpy.convolve(stuffed, filter_coefficients)
+            modulated = modulated[: len(stuffed) // filter_block * filter_block]
+            result.update(
+                self._getComplexAndFixedPoint(
+                    f"modulated_{suffix}", modulated.astype(numpy.complex64)
+                )
+            )
+
+        result["polyphase_coefficients.bin"] = filter_coefficients
+
+        return result
+
+    @staticmethod
+    def _getComplexAndFixedPoint(basename, data):
+        return {
+            f"{basename}_floating_point.bin": data,
+            f"{basename}_fixed_point.bin": _toFixedPoint(data),
+        }
+
+
+def writeRealTable(data, path):
+    "Writes data to path in the real table format, replacing it atomically"
+    data = numpy.asarray(data, dtype="<f8").ravel()
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as fd:
+        fd.write(
+            REAL_TABLE_HEADER.pack(REAL_TABLE_MAGIC, REAL_TABLE_VERSION, len(data))
+        )
+        data.tofile(fd)
+    os.replace(temp, path)
+
+
+def isRealTable(path):
+    "Checks if path exists and is in the current real table format"
+    try:
+        with open(path, "rb") as fd:
+            header = fd.read(REAL_TABLE_HEADER.size)
+    except OSError:
+        return False
+
+    if len(header) != REAL_TABLE_HEADER.size:
+        return False
+
+    magic, version, _ = REAL_TABLE_HEADER.unpack(header)
+    return magic == REAL_TABLE_MAGIC and version == REAL_TABLE_VERSION
+
+
+def readRealTable(path):
+    """
+    Reads a file written by writeRealTable. Files in the previous format (one
+    decimal value per line) are still read, but are deprecated
+    """
+    if not isRealTable(path):
+        _logger.warning(
+            "%s has one decimal value per line, this format is deprecated and "
+            "should be regenerated",
+            path,
+        )
+        return numpy.loadtxt(path, dtype=numpy.float64, ndmin=1)
+
+    with open(path, "rb") as fd:
+        _, _, length = REAL_TABLE_HEADER.unpack(fd.read(REAL_TABLE_HEADER.size))
+        return numpy.fromfile(fd, dtype="<f8", count=length)
+
+
+def writeCoefficientsToFile(data, path="polyphase_coefficients.bin"):
+    "Writes the polyphase filter coefficients, scaled by 1/2, as a real table"
+    writeRealTable(numpy.asarray(data, dtype=numpy.float64) / 2, path)
+
+
+def writeFrameIndex(frame_type, constellation, code_rate, frames, path="."):
+    """
+    Writes a <name>.index file next to each <name>.bin output file with the
+    byte offset and length of each frame in it. Streams truncated by the flow
+    graph (e.g. by the FFT filter) will have the last frame shorter. Dumps
+    that are not split at frame boundaries (plframe_header_pilots_on and
+    plframe_payload_pilots_on) don't get an index. Returns the paths of the
+    index files written
+    """
+    model = Dvbs2EncoderModel(
+        frame_type=frame_type, constellation=constellation, code_rate=code_rate
+    )
+
+    written = []
+    for filename, frame_size in model.getFrameSizes().items():
+        if not p.exists(p.join(path, filename)):
+            continue
+        file_size = p.getsize(p.join(path, filename))
+        index = p.join(path, p.splitext(filename)[0] + ".index")
+        with open(index, "w") as fd:
+            fd.write("# Frame, offset, length\n")
+            for frame in range(frames):
+                offset = min(frame * frame_size, file_size)
+                length = min(frame_size, file_size - offset)
+                fd.write(f"{frame},{offset},{length}\n")
+        written.append(index)
+
+    return written
+
+
+def generate(frame_type, constellation, code_rate, path=".", seed=None, frames=1):
+    """
+    Generates the reference data for a config and writes it to path, file
+    names and formats are the same as the ones of the GNU Radio flow graph.
+    Returns the paths of all files written
+    """
+    model = Dvbs2EncoderModel(
+        frame_type=frame_type, constellation=constellation, code_rate=code_rate
+    )
+
+    if not p.exists(path):
+        os.makedirs(path)
+
+    written = []
+    for filename, data in model.run(model.getRandomFrame(seed, frames)).items():
+        if filename == "polyphase_coefficients.bin":
+            writeCoefficientsToFile(data, p.join(path, filename))
+        else:
+            data.tofile(p.join(path, filename))
+        written.append(p.join(path, filename))
+
+    return written + writeFrameIndex(frame_type, constellation, code_rate, frames, path)
+
+
+def compareWithGnuRadio(frame_type, constellation, code_rate, path):
+    """
+    Runs the model with the input data of a GNU Radio flow graph run found in
+    path and compares its results with the other files in there. Returns the
+    names of the files that differ, except for GNURADIO_INEXACT_FILES
+    """
+    model = Dvbs2EncoderModel(
+        frame_type=frame_type, constellation=constellation, code_rate=code_rate
+    )
+    data = numpy.fromfile(p.join(path, "input_data_packed.bin"), dtype=numpy.uint8)
+
+    mismatches = []
+    for filename, expected in model.run(data).items():
+        if filename in GNURADIO_INEXACT_FILES or filename.endswith(".index"):
+            continue
+        if filename == "polyphase_coefficients.bin":
+            continue
+        if not p.exists(p.join(path, filename)):
+            mismatches.append(filename)
+            _logger.error("%s was not written by GNU Radio", filename)
+            continue
+        with open(p.join(path, filename), "rb") as fd:
+            if fd.read() != expected.tobytes():
+                mismatches.append(filename)
+                _logger.error("%s differs from GNU Radio's output", filename)
+
+    return mismatches
+
+
+def getAllConfigs():
+    "Returns all (frame type, constellation, code rate) configs"
+    return tuple(
+        (frame_type, constellation, code_rate)
+        for frame_type, code_rates in BBFRAME_LENGTH.items()
+        for code_rate in code_rates
+        # Short frames don't have a 9/10 code rate
+        if (frame_type, code_rate) != ("FECFRAME_SHORT", "C9_10")
+        for constellation in BITS_PER_SYMBOL
+    )
+
+
+def checkWithGnuRadio(configs=GNURADIO_CHECK_CONFIGS, seed=0, frames=2):
+    """
+    Runs dvbs2_encoder_flow_diagram.py (needs GNU Radio) for each of configs
+    and compares its output with the model's. Returns True if all of them
+    match
+    """
+    passed = True
+    with tempfile.TemporaryDirectory() as path:
+        manifest = "\n".join(
+            f"{frame_type} {constellation} {code_rate} "
+            f"{p.join(path, '_'.join((frame_type, constellation, code_rate)))} "
+            f"{seed} {frames}"
+            for frame_type, constellation, code_rate in configs
+        )
+        try:
+            subprocess.run(
+                [GNU_RADIO_FLOW_GRAPH, "--batch", "-"],
+                input=manifest.encode(),
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            _logger.error("Failed to run %s: %s", GNU_RADIO_FLOW_GRAPH, exc)
+            return False
+
+        for frame_type, constellation, code_rate in configs:
+            name = "_".join((frame_type, constellation, code_rate))
+            mismatches = compareWithGnuRadio(
+                frame_type, constellation, code_rate, p.join(path, name)
+            )
+            print(f"{name}: {'FAIL' if mismatches else 'PASS'}")
+            passed &= not mismatches
+
+    return passed
+
+
+def argument_parser():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--frame-type",
+        default="FECFRAME_NORMAL",
+        choices=tuple(FECFRAME_LENGTH),
+    )
+    parser.add_argument(
+        "--constellation",
+        default="MOD_8PSK",
+        choices=tuple(BITS_PER_SYMBOL),
+    )
+    parser.add_argument(
+        "--code-rate",
+        default="C1_2",
+        choices=tuple(BBFRAME_LENGTH["FECFRAME_NORMAL"]),
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--frames", type=int, default=1, help="Number of frames to generate"
+    )
+    parser.add_argument(
+        "--check-gnuradio",
+        action="store_true",
+        help="Instead of generating data, check the model against the output of "
+        "dvbs2_encoder_flow_diagram.py for one config of each constellation "
+        "(needs GNU Radio)",
+    )
+    parser.add_argument(
+        "--all-configs",
+        action="store_true",
+        help="Make --check-gnuradio check all configs",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = argument_parser()
+    if args.check_gnuradio:
+        configs = getAllConfigs() if args.all_configs else GNURADIO_CHECK_CONFIGS
+        return 0 if checkWithGnuRadio(configs, frames=args.frames) else 1
+
+    generate(
+        frame_type=args.frame_type,
+        constellation=args.constellation,
+        code_rate=args.code_rate,
+        seed=args.seed,
+        frames=args.frames,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"""
+Checks raw DUT output dumps written by axi_file_compare_complex (see
+raw_dump_file_t in testbench/dvb_sim_utils_pkg.vhd) with the same tolerance
+semantics as the VHDL comparison
+"""
+
+import glob
+import json
+import logging
+import os.path as p
+import struct
+import sys
+from argparse import ArgumentParser
+
+import numpy  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+RAW_DUMP_MAGIC = b"RAWD"
+RAW_DUMP_VERSION = 1
+# Magic, version, bytes per I/Q component and tolerance
+RAW_DUMP_HEADER = struct.Struct("<4sBBH")
+
+RECEIVED_TLAST = 1 << 0
+EXPECTED_TLAST = 1 << 1
+
+
+def read(path):
+    """
+    Returns the tolerance the dump was written with and its entries as a
+    structured array with received_i, received_q, expected_i, expected_q and
+    flags fields
+    """
+    with open(path, "rb") as fd:
+        header = fd.read(RAW_DUMP_HEADER.size)
+
+    if len(header) != RAW_DUMP_HEADER.size:
+        raise ValueError(f"{path} is too short to be a raw dump")
+
+    magic, version, width, tolerance = RAW_DUMP_HEADER.unpack(header)
+    if magic != RAW_DUMP_MAGIC:
+        raise ValueError(f"{path} doesn't start with {RAW_DUMP_MAGIC!r}")
+    if version != RAW_DUMP_VERSION:
+        raise ValueError(f"Unsupported raw dump version in {path}: {version}")
+
+    component = numpy.dtype(f"<i{width}")
+    dtype = numpy.dtype(
+        [
+            ("received_i", component),
+            ("received_q", component),
+            ("expected_i", component),
+            ("expected_q", component),
+            ("flags", numpy.uint8),
+        ]
+    )
+
+    return tolerance, numpy.fromfile(path, dtype=dtype, offset=RAW_DUMP_HEADER.size)
+
+
+def _getHistogram(values):
+    "Returns a list of [value, count] for each distinct value"
+    distinct, counts = numpy.unique(values, return_counts=True)
+    return [[int(x), int(y)] for x, y in zip(distinct, counts)]
+
+
+def check(path, tolerance=None):
+    """
+    Compares received and expected data of a raw dump. A word fails when
+    either of its components differs from the expected value by more than
+    tolerance, which defaults to the one the dump was written with. Frames
+    are delimited by the expected tlast. Returns a dict with the number of
+    words, frames and errors, the first mismatch of each frame, histograms of
+    the I and Q errors and the EVM
+    """
+    dump_tolerance, entries = read(path)
+    if tolerance is None:
+        tolerance = dump_tolerance
+
+    received_i = entries["received_i"].astype(numpy.int64)
+    received_q = entries["received_q"].astype(numpy.int64)
+    expected_i = entries["expected_i"].astype(numpy.int64)
+    expected_q = entries["expected_q"].astype(numpy.int64)
+    received_tlast = (entries["flags"] & RECEIVED_TLAST) != 0
+    expected_tlast = (entries["flags"] & EXPECTED_TLAST) != 0
+
+    error_i = received_i - expected_i
+    error_q = received_q - expected_q
+
+    tdata_failed = (numpy.abs(error_i) > tolerance) | (numpy.abs(error_q) > tolerance)
+    tlast_failed = received_tlast != expected_tlast
+    failed = tdata_failed | tlast_failed
+
+    # Entries up to and including the one with the expected tlast belong to
+    # the same frame
+    frame = numpy.zeros(len(entries), dtype=numpy.int64)
+    frame[1:] = numpy.cumsum(expected_tlast)[:-1]
+    frames = int(frame[-1]) + 1 if len(entries) else 0
+    starts = numpy.flatnonzero(numpy.diff(frame, prepend=-1))
+    word = numpy.arange(len(entries)) - starts[frame]
+
+    first_mismatches = []
+    failed_frames, first = numpy.unique(frame[failed], return_index=True)
+    for index in numpy.flatnonzero(failed)[first]:
+        first_mismatches += [
+            dict(
+                frame=int(frame[index]),
+                word=int(word[index]),
+                received=[int(received_i[index]), int(received_q[index])],
+                expected=[int(expected_i[index]), int(expected_q[index])],
+                delta=[int(error_i[index]), int(error_q[index])],
+                tdata_error=bool(tdata_failed[index]),
+                tlast_error=bool(tlast_failed[index]),
+            )
+        ]
+
+    # EVM is the RMS error vector magnitude relative to the RMS magnitude of
+    # the expected data. It's undefined for frames where all expected words
+    # are zero, so those are left out and reported as None
+    error_power = numpy.bincount(
+        frame,
+        weights=(error_i**2 + error_q**2).astype(numpy.float64),
+        minlength=frames,
+    )
+    expected_power = numpy.bincount(
+        frame,
+        weights=(expected_i**2 + expected_q**2).astype(numpy.float64),
+        minlength=frames,
+    )
+    valid = expected_power > 0
+    evm = (
+        float(numpy.sqrt(error_power[valid].sum() / expected_power[valid].sum()))
+        if valid.any()
+        else None
+    )
+    frame_evm = [
+        float(numpy.sqrt(error / expected)) if expected > 0 else None
+        for error, expected in zip(error_power, expected_power)
+    ]
+
+    return dict(
+        path=path,
+        tolerance=tolerance,
+        words=len(entries),
+        frames=frames,
+        failed_frames=len(failed_frames),
+        tdata_errors=int(tdata_failed.sum()),
+        tlast_errors=int(tlast_failed.sum()),
+        first_mismatches=first_mismatches,
+        histogram=dict(i=_getHistogram(error_i), q=_getHistogram(error_q)),
+        evm=dict(
+            percent=None if evm is None else 100 * evm,
+            db=float(20 * numpy.log10(evm)) if evm else None,
+            frames_percent=[None if x is None else 100 * x for x in frame_evm],
+        ),
+    )
+
+
+def formatReport(report):
+    "Returns a human readable version of a report returned by check"
+    lines = [
+        f"{report['path']}: {report['words']} words, {report['frames']} frames, "
+        f"{report['tdata_errors']} tdata errors, {report['tlast_errors']} "
+        f"tlast errors (tolerance={report['tolerance']})",
+        "  EVM: "
+        + (
+            "n/a (no expected power)"
+            if report["evm"]["percent"] is None
+            else f"{report['evm']['percent']:.3f}%"
+        )
+        + (
+            f" ({report['evm']['db']:.1f} dB)"
+            if report["evm"]["db"] is not None
+            else ""
+        ),
+    ]
+
+    for mismatch in report["first_mismatches"]:
+        kinds = [
+            kind
+            for kind, failed in (
+                ("tdata", mismatch["tdata_error"]),
+                ("tlast", mismatch["tlast_error"]),
+            )
+            if failed
+        ]
+        lines += [
+            f"  [{mismatch['frame']}, {mismatch['word']}] First {' and '.join(kinds)} "
+            f"mismatch of frame. Got: ({mismatch['received'][0]}, "
+            f"{mismatch['received'][1]}), expected: ({mismatch['expected'][0]}, "
+            f"{mismatch['expected'][1]}), delta ({mismatch['delta'][0]}, "
+            f"{mismatch['delta'][1]})"
+        ]
+
+    if report["tdata_errors"]:
+        for component in ("i", "q"):
+            lines += [
+                f"  {component.upper()} error histogram: "
+                + ", ".join(
+                    f"{error}: {count}"
+                    for error, count in report["histogram"][component]
+                )
+            ]
+
+    return "\n".join(lines)
+
+
+def checkDirectory(path, tolerance=None):
+    """
+    Checks all raw dumps (*.raw) in path, writing each report next to its
+    dump as JSON and printing it. Returns True if no dump has errors
+    """
+    passed = True
+    for dump in sorted(glob.glob(p.join(path, "*.raw"))):
+        report = check(dump, tolerance)
+        with open(p.splitext(dump)[0] + ".json", "w") as fd:
+            json.dump(report, fd, indent=2)
+        print(formatReport(report))
+        if report["tdata_errors"] or report["tlast_errors"]:
+            passed = False
+    return passed
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=None,
+        help="Maximum difference between received and expected I or Q values. "
+        "Defaults to the tolerance the dump was written with",
+    )
+    parser.add_argument(
+        "--json", default=None, help="Write the reports of all dumps to this file"
+    )
+    parser.add_argument("dumps", nargs="+", help="Raw dumps to check")
+    args = parser.parse_args()
+
+    reports = []
+    for dump in args.dumps:
+        try:
+            reports += [check(dump, args.tolerance)]
+        except (OSError, ValueError) as exc:
+            _logger.error("Failed to check %s: %s", dump, exc)
+            return 2
+        print(formatReport(reports[-1]))
+
+    if args.json is not None:
+        with open(args.json, "w") as fd:
+            json.dump(reports, fd, indent=2)
+
+    return 1 if any(x["tdata_errors"] or x["tlast_errors"] for x in reports) else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"""
+Inspects the dumps in gnuradio_data (packed or unpacked bits, symbols and fixed
+or floating point IQ): shows frames, the bit interleaver column layout and the
+differences between two dumps. Files are memory mapped and processed in chunks,
+so captures larger than memory can be inspected
+"""
+
+import logging
+import os.path as p
+import re
+import sys
+from argparse import ArgumentParser
+from typing import List, NamedTuple, Optional
+
+import numpy  # type: ignore
+
+sys.path.insert(0, p.join(p.dirname(p.abspath(__file__)), "..", "gnuradio_data"))
+
+import dvbs2_encoder_model  # type: ignore # pylint: disable=wrong-import-position
+
+_logger = logging.getLogger(__name__)
+
+_CONFIG = re.compile(
+    r"(?P<frame_type>FECFRAME_SHORT|FECFRAME_NORMAL)_"
+    r"(?P<constellation>MOD_(?:QPSK|8PSK|16APSK|32APSK))_"
+    r"(?P<code_rate>C\d+_\d+)"
+)
+
+# Item type of each dump format
+FORMATS = {
+    "packed": numpy.dtype(numpy.uint8),
+    "unpacked": numpy.dtype(numpy.uint8),
+    "symbols": numpy.dtype(numpy.uint8),
+    "fixed_point": numpy.dtype([("i", "<i2"), ("q", "<i2")]),
+    "floating_point": numpy.dtype(numpy.complex64),
+}
+
+# The bit interleaver writes bits column wise and reads them row wise, with one
+# column per bit of each symbol
+INTERLEAVER_COLUMNS = {"MOD_8PSK": 3, "MOD_16APSK": 4, "MOD_32APSK": 5}
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class Dump(NamedTuple):
+    "A memory mapped dump and the item offset and length of each frame"
+    path: str
+    fmt: str
+    data: numpy.ndarray
+    frames: List[tuple]
+    config: Optional[dict]
+
+
+def getFormat(path):
+    "Guesses a dump's format from its file name"
+    name = p.basename(path)
+    if name.endswith("_fixed_point.bin"):
+        return "fixed_point"
+    if name.endswith("_floating_point.bin"):
+        return "floating_point"
+    if name.endswith("_packed.bin") or name.startswith("dvbs2_encoder_wrapper_input"):
+        return "packed"
+    if name == "bit_interleaver_output.bin":
+        return "symbols"
+    return "unpacked"
+
+
+def getConfig(path):
+    """
+    Returns the frame type, constellation and code rate of a dump from its
+    directory name (e.g. FECFRAME_SHORT_MOD_8PSK_C1_2) or None if it has none
+    """
+    match = _CONFIG.search(p.abspath(path))
+    return None if match is None else match.groupdict()
+
+
+def _getFrames(path, config, itemsize, length, frame_size=None):
+    """
+    Returns the (offset, length) in items of each frame of a dump. Frames come
+    from frame_size (in bytes) if set, then from the <name>.index file next to
+    the dump and then from the frame size of the config. The whole dump is a
+    single frame if none of those are available
+    """
+    if frame_size is None:
+        index = p.splitext(path)[0] + ".index"
+        if p.exists(index):
+            frames = []
+            with open(index, "r") as fd:
+                for line in fd:
+                    if line.startswith("#") or not line.strip():
+                        continue
+                    _, offset, size = (int(x) for x in line.split(","))
+                    frames += [(offset // itemsize, size // itemsize)]
+            return frames
+
+        if config is not None:
+            model = dvbs2_encoder_model.Dvbs2EncoderModel(**config)
+            frame_size = model.getFrameSizes().get(p.basename(path))
+
+    if not frame_size:
+        return [(0, length)]
+
+    frame_items = frame_size // itemsize
+    return [
+        (offset, min(frame_items, length - offset))
+        for offset in range(0, length, frame_items)
+    ]
+
+
+def openDump(path, fmt=None, frame_size=None, constellation=None):
+    "Memory maps a dump and finds its frames"
+    fmt = fmt or getFormat(path)
+    dtype = FORMATS[fmt]
+    length = p.getsize(path) // dtype.itemsize
+    if length:
+        data = numpy.memmap(path, dtype=dtype, mode="r", shape=(length,))
+    else:
+        data = numpy.empty(0, dtype=dtype)
+
+    config = getConfig(path)
+    if constellation is not None:
+        config = dict(config or {}, constellation=constellation)
+
+    frames = _getFrames(
+        path,
+        config if config is not None and len(config) == 3 else None,
+        dtype.itemsize,
+        length,
+        frame_size,
+    )
+    return Dump(path, fmt, data, frames, config)
+
+
+def parseFrames(value, count):
+    """
+    Returns the frame numbers selected by value ("N", "A:B" or "A:B:S", same
+    as Python slices) out of count frames
+    """
+    if value is None:
+        return list(range(count))
+    if ":" not in value:
+        frame = int(value)
+        if not -count <= frame < count:
+            raise ValueError(f"Frame {frame} is out of range, dump has {count} frames")
+        return [frame % count]
+    parts = [int(x) if x else None for x in value.split(":")]
+    return list(range(count))[slice(*parts)]
+
+
+def iterChunks(data, offset, length, chunk_size):
+    "Yields (offset, items) of data[offset:offset + length] in chunks"
+    items = max(1, chunk_size // data.dtype.itemsize)
+    for start in range(offset, offset + length, items):
+        yield start, numpy.asarray(data[start : min(start + items, offset + length)])
+
+
+def _getBitsPerSymbol(dump):
+    if dump.config is None or "constellation" not in dump.config:
+        raise ValueError(
+            f"Can't find the constellation of {dump.path}, use --constellation"
+        )
+    return dvbs2_encoder_model.BITS_PER_SYMBOL[dump.config["constellation"]]
+
+
+def toBits(dump, items):
+    "Returns the bits of items of a bit or symbol dump, one per byte"
+    if dump.fmt == "packed":
+        return numpy.unpackbits(items)
+    if dump.fmt == "unpacked":
+        return items & 1
+    if dump.fmt == "symbols":
+        bits_per_symbol = _getBitsPerSymbol(dump)
+        shifts = numpy.arange(bits_per_symbol - 1, -1, -1, dtype=numpy.uint8)
+        return ((items[:, None] >> shifts) & 1).ravel()
+    raise ValueError(f"{dump.path} is not a bit or symbol dump")
+
+
+def formatBytes(offset, data, per_line=16):
+    "Yields lines with the offset and the hex value of per_line bytes"
+    for start in range(0, len(data), per_line):
+        yield f"{offset + start:>8}: " + " ".join(
+            f"{x:02x}" for x in data[start : start + per_line]
+        )
+
+
+def formatItems(dump, offset, items):
+    "Yields lines with the offset and the values of items"
+    if dump.fmt == "packed":
+        yield from formatBytes(offset, items)
+    elif dump.fmt == "unpacked":
+        # Show 8 bits per byte, the last one zero padded
+        for start in range(0, len(items), 128):
+            bits = items[start : start + 128] & 1
+            yield f"{offset + start:>8}: " + " ".join(
+                f"{x:02x}" for x in numpy.packbits(bits)
+            ) + (f" ({len(bits) % 8} bits)" if len(bits) % 8 else "")
+    elif dump.fmt == "symbols":
+        for start in range(0, len(items), 16):
+            yield f"{offset + start:>8}: " + " ".join(
+                f"{x:>2}" for x in items[start : start + 16]
+            )
+    elif dump.fmt == "fixed_point":
+        for start in range(0, len(items), 8):
+            yield f"{offset + start:>8}: " + " ".join(
+                f"({x['i']:>6},{x['q']:>6})" for x in items[start : start + 8]
+            )
+    else:
+        for start in range(0, len(items), 4):
+            yield f"{offset + start:>8}: " + " ".join(
+                f"{x.real:+.6f}{x.imag:+.6f}j" for x in items[start : start + 4]
+            )
+
+
+def show(dump, frames, chunk_size=DEFAULT_CHUNK_SIZE):
+    "Prints the items of the given frames"
+    for frame in frames:
+        offset, length = dump.frames[frame]
+        print(f"Frame {frame}: {length} items at item offset {offset}")
+        for start, items in iterChunks(dump.data, offset, length, chunk_size):
+            for line in formatItems(dump, start - offset, items):
+                print(line)
+
+
+def getColumns(dump, frame, output_order=False):
+    """
+    Returns the bits of each bit interleaver column of a frame as a (columns,
+    rows) array. Bits are taken as written to the interleaver (column wise),
+    unless output_order is set or the dump has symbols, in which case they're
+    taken as read from it (row wise)
+    """
+    if dump.config is None or "constellation" not in dump.config:
+        raise ValueError(
+            f"Can't find the constellation of {dump.path}, use --constellation"
+        )
+    constellation = dump.config["constellation"]
+    if constellation not in INTERLEAVER_COLUMNS:
+        raise ValueError(f"{constellation} frames are not interleaved")
+    columns = INTERLEAVER_COLUMNS[constellation]
+
+    offset, length = dump.frames[frame]
+    bits = toBits(dump, numpy.asarray(dump.data[offset : offset + length]))
+    bits = bits[: len(bits) // columns * columns]
+
+    if output_order or dump.fmt == "symbols":
+        return bits.reshape(-1, columns).T
+    return bits.reshape(columns, -1)
+
+
+def showColumns(dump, frames, output_order=False):
+    "Prints each bit interleaver column of the given frames as packed bytes"
+    for frame in frames:
+        columns = getColumns(dump, frame, output_order)
+        for index, column in enumerate(columns):
+            print(f"Frame {frame}, column {index} ({len(column)} bits)")
+            for line in formatBytes(0, numpy.packbits(column)):
+                print(line)
+
+
+class FrameDiff(NamedTuple):
+    "Differences between the same frame of two dumps"
+    frame: int
+    differences: int
+    first: int
+    max_error: float
+
+
+def diff(first, second, tolerance=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compares two dumps of the same format item by item, in chunks. Bits are
+    compared individually, IQ values differ when the real or imaginary error
+    is above tolerance. Frames are the ones of the first dump. Returns a
+    FrameDiff for each frame with differences and the number of items
+    compared
+    """
+    if first.fmt != second.fmt:
+        raise ValueError(f"Can't compare {first.fmt} and {second.fmt} dumps")
+
+    length = min(len(first.data), len(second.data))
+    starts = numpy.array([offset for offset, _ in first.frames], dtype=numpy.int64)
+
+    differences = numpy.zeros(len(starts), dtype=numpy.int64)
+    first_difference = numpy.full(len(starts), -1, dtype=numpy.int64)
+    max_error = numpy.zeros(len(starts))
+
+    for offset, items in iterChunks(first.data, 0, length, chunk_size):
+        other = numpy.asarray(second.data[offset : offset + len(items)])
+
+        if first.fmt in ("packed", "unpacked", "symbols"):
+            error = items ^ other
+            failed = error != 0
+        else:
+            if first.fmt == "fixed_point":
+                error_re = items["i"].astype(numpy.int64) - other["i"]
+                error_im = items["q"].astype(numpy.int64) - other["q"]
+            else:
+                error_re = items.real.astype(numpy.float64) - other.real
+                error_im = items.imag.astype(numpy.float64) - other.imag
+            error = numpy.maximum(numpy.abs(error_re), numpy.abs(error_im))
+            failed = error > tolerance
+
+        positions = offset + numpy.flatnonzero(failed)
+        if not len(positions):
+            continue
+
+        frames = numpy.searchsorted(starts, positions, side="right") - 1
+        if first.fmt in ("packed", "unpacked", "symbols"):
+            # Count the bits that differ only on the items that do
+            bits = numpy.unpackbits(error[failed][:, None], axis=1).sum(axis=1)
+            numpy.add.at(differences, frames, bits)
+        else:
+            numpy.add.at(differences, frames, 1)
+            numpy.maximum.at(max_error, frames, error[failed])
+
+        distinct, index = numpy.unique(frames, return_index=True)
+        new = first_difference[distinct] < 0
+        first_difference[distinct[new]] = positions[index[new]] - starts[distinct[new]]
+
+    return [
+        FrameDiff(
+            int(frame),
+            int(differences[frame]),
+            int(first_difference[frame]),
+            float(max_error[frame]),
+        )
+        for frame in numpy.flatnonzero(differences)
+    ], length
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--format",
+        choices=tuple(FORMATS),
+        default=None,
+        help="Dump format, guessed from the file name by default",
+    )
+    parser.add_argument(
+        "--constellation",
+        choices=tuple(dvbs2_encoder_model.BITS_PER_SYMBOL),
+        default=None,
+        help="Constellation of the dumps, taken from the directory name by default",
+    )
+    parser.add_argument(
+        "--frame-size",
+        type=int,
+        default=None,
+        help="Frame size in bytes. Defaults to the one in the .index file next to "
+        "the dump or the one of the dump's config",
+    )
+    parser.add_argument(
+        "--frames",
+        default=None,
+        help="Frames to process, either a frame number or a slice (A:B or A:B:S)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        help="Size in MB of the chunks dumps are processed in",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = commands.add_parser("show", help="Show the items of each frame")
+    show_parser.add_argument("dump")
+
+    columns_parser = commands.add_parser(
+        "columns", help="Show the bit interleaver columns of each frame"
+    )
+    columns_parser.add_argument(
+        "--output-order",
+        action="store_true",
+        help="Bits are in the order they're read from the interleaver (row "
+        "wise). Implied for symbol dumps",
+    )
+    columns_parser.add_argument("dump")
+
+    diff_parser = commands.add_parser(
+        "diff", help="Show the differences between two dumps of each frame"
+    )
+    diff_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0,
+        help="Maximum difference between IQ values considered equal",
+    )
+    diff_parser.add_argument("first")
+    diff_parser.add_argument("second")
+
+    args = parser.parse_args()
+    chunk_size = args.chunk_size * 1024 * 1024
+
+    def getDump(path):
+        return openDump(path, args.format, args.frame_size, args.constellation)
+
+    try:
+        if args.command == "show":
+            dump = getDump(args.dump)
+            show(dump, parseFrames(args.frames, len(dump.frames)), chunk_size)
+        elif args.command == "columns":
+            dump = getDump(args.dump)
+            showColumns(
+                dump, parseFrames(args.frames, len(dump.frames)), args.output_order
+            )
+        else:
+            first, second = getDump(args.first), getDump(args.second)
+            frames = set(parseFrames(args.frames, len(first.frames)))
+            diffs, length = diff(first, second, args.tolerance, chunk_size)
+            if len(first.data) != len(second.data):
+                print(
+                    f"Dumps have different lengths ({len(first.data)} and "
+                    f"{len(second.data)} items), only the first {length} were "
+                    "compared"
+                )
+            diffs = [x for x in diffs if x.frame in frames]
+            for item in diffs:
+                if first.fmt in ("packed", "unpacked", "symbols"):
+                    print(
+                        f"Frame {item.frame}: {item.differences} bits differ, "
+                        f"first at item {item.first}"
+                    )
+                else:
+                    print(
+                        f"Frame {item.frame}: {item.differences} items differ, "
+                        f"first at item {item.first}, max error {item.max_error:g}"
+                    )
+            print(f"{len(diffs)} of {len(frames)} frames differ")
+            return 1 if diffs or len(first.data) != len(second.data) else 0
+    except (OSError, ValueError) as exc:
+        _logger.error("%s", exc)
+        return 2
+    except BrokenPipeError:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -25,19 +25,22 @@ https://github.com/aicodix/tables
 
 import logging
 import math
+import os
 import os.path as p
 import re
 import sys
+from argparse import ArgumentParser
+from functools import lru_cache
 from glob import glob
-from os import makedirs
 
 from tabulate import tabulate
 
-logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 _logger = logging.getLogger(__name__)
 
 ROOT = p.abspath(p.dirname(__file__))
 
+TARGET_FILE = p.abspath(p.join(ROOT, "..", "rtl", "ldpc", "ldpc_tables_pkg.vhd"))
+
 HEADER = """\
 --
 -- DVB FPGA
@@ -62,6 +65,35 @@ HEADER = """\
 
 _PARAM_RE = re.compile(r"ldpc_table_(FECFRAME_(?:NORMAL|SHORT))_(C\d_\d+).csv")
 
+# Width of the LDPC coefficients, same as LDPC_TABLE_DATA_WIDTH
+LDPC_TABLE_DATA_WIDTH = 16
+
+# (depth, width) aspect ratios of Xilinx 7 series block RAMs. The widest ones
+# are only available in simple dual port mode, which is enough for a ROM
+BRAM_ASPECT_RATIOS = {
+    "18k": ((16384, 1), (8192, 2), (4096, 4), (2048, 9), (1024, 18), (512, 36)),
+    "36k": (
+        (32768, 1),
+        (16384, 2),
+        (8192, 4),
+        (4096, 9),
+        (2048, 18),
+        (1024, 36),
+        (512, 72),
+    ),
+}
+
+# Word widths tried when packing more than one coefficient per ROM word
+PACKED_WORD_WIDTHS = (18, 32, 36, 64, 72)
+
+
+def getBramCount(depth, width, size):
+    "Returns the number of 18k or 36k BRAMs needed by a depth x width ROM"
+    return min(
+        math.ceil(width / port_width) * math.ceil(depth / port_depth)
+        for port_depth, port_width in BRAM_ASPECT_RATIOS[size]
+    )
+
 
 class LdpcTable:
     """
@@ -71,6 +103,7 @@ class LdpcTable:
     def __init__(self, path):
         self._path = path
         self._table = tuple(self._read())
+        self._coefficients = tuple(x for row in self._table for x in row)
 
         self._widths = self._getColumnWidths()
 
@@ -88,14 +121,15 @@ class LdpcTable:
 
     @property
     def table(self):
-        return tuple(self._table)
+        return self._table
 
     def _read(self):
-        _logger.info("Reading %s", self._path)
-        for line in (x.strip() for x in open(self._path).readlines()):
-            if not line:
-                continue
-            yield tuple(int(x) for x in line.split(","))
+        _logger.debug("Reading %s", self._path)
+        with open(self._path) as fd:
+            for line in (x.strip() for x in fd):
+                if not line:
+                    continue
+                yield tuple(int(x) for x in line.split(","))
 
     def _getColumnWidths(self):
         max_values = {}
@@ -145,10 +179,20 @@ class LdpcTable:
             width=width,
             entries=len(self._widths),
             total=(total + 7) // 8,
-            brams_18k=max((width + 17) // 18, self.length * width / 1024 / 18),
-            brams_36k=max((width + 35) // 36, self.length * width / 1024 / 36),
+            brams_18k=getBramCount(self.length, width, "18k"),
+            brams_36k=getBramCount(self.length, width, "36k"),
         )
 
+    @property
+    def coefficients(self):
+        "Coefficients of all rows, in the order they're read"
+        return self._coefficients
+
+    @property
+    def entry_width(self):
+        "Number of bits needed by the largest coefficient"
+        return max(self.coefficients).bit_length()
+
     @property
     def length(self):
         return len(self._table)
@@ -162,8 +206,8 @@ class LdpcTable:
 
         width = sum(self._widths.values())
 
-        brams_18k = max((width + 17) // 18, self.length * width / 1024 / 18)
-        brams_36k = max((width + 35) // 36, self.length * width / 1024 / 36)
+        brams_18k = getBramCount(self.length, width, "18k")
+        brams_36k = getBramCount(self.length, width, "36k")
 
         columns = len(self._widths)
 
@@ -186,7 +230,7 @@ class LdpcTable:
 
         lines.append("  );")
 
-        _logger.info(
+        _logger.debug(
             "RAM has %.2f kb (%d x %d), or %d BRAMs",
             self.length * width / 1024.0,
             self.length,
@@ -252,7 +296,159 @@ LDPC_Q = {
 }
 
 
-def _generateTablesRom(tables):
+class RomEncoding:
+    """
+    Layout of the LDPC coefficients in one or more ROMs. Tables start at a new
+    word and each word has up to word_width // entry_width coefficients of a
+    table, the first one on the LSBs. axi_ldpc_table can only read encodings
+    with a single ROM that hold the coefficients themselves
+    """
+
+    def __init__(self, name, roms, supported=True):
+        self.name = name
+        # Each ROM is a tuple of its word width and a list of (table, entry
+        # width, coefficients) tuples
+        self.roms = roms
+        self.supported = supported
+
+    @property
+    def word_width(self):
+        "Word width of the first (only, if supported) ROM"
+        return self.roms[0][0]
+
+    def getDepths(self):
+        "Returns the number of words of each ROM"
+        return [
+            sum(
+                math.ceil(len(coefficients) / (word_width // entry_width))
+                for _, entry_width, coefficients in entries
+            )
+            for word_width, entries in self.roms
+        ]
+
+    def getStats(self):
+        depths = self.getDepths()
+        widths = [x for x, _ in self.roms]
+        return dict(
+            name=self.name,
+            depth=" + ".join(str(x) for x in depths),
+            width=" + ".join(str(x) for x in widths),
+            total=sum(x * y for x, y in zip(depths, widths)),
+            brams_18k=sum(getBramCount(x, y, "18k") for x, y in zip(depths, widths)),
+            brams_36k=sum(getBramCount(x, y, "36k") for x, y in zip(depths, widths)),
+            supported=self.supported,
+        )
+
+    def getOffsets(self):
+        "Returns the sorted bit offsets of the coefficients within the words"
+        word_width, entries = self.roms[0]
+        return sorted(
+            {
+                i * entry_width
+                for _, entry_width, coefficients in entries
+                for i in range(min(word_width // entry_width, len(coefficients)))
+            }
+        )
+
+    def getWords(self):
+        """
+        Yields (table, entry width, coefficients) for every word of a single ROM
+        encoding
+        """
+        assert len(self.roms) == 1, "Only single ROM encodings can be rendered"
+        word_width, entries = self.roms[0]
+        for table, entry_width, coefficients in entries:
+            step = word_width // entry_width
+            for i in range(0, len(coefficients), step):
+                yield table, entry_width, coefficients[i : i + step]
+
+
+def _getDeltaCoefficients(table):
+    """
+    Yields the coefficients of a table with each one replaced by its
+    difference to the previous one on the same row, modulo the parity length
+    """
+    parity_length = LDPC_Q[(table.frame_type, table.code_rate)] * 360
+    for row in table.table:
+        yield row[0]
+        for previous, current in zip(row, row[1:]):
+            yield (current - previous) % parity_length
+
+
+def getEncodings(tables):
+    "Yields the candidate ROM encodings of the LDPC coefficients"
+    yield RomEncoding(
+        "full width",
+        [
+            (
+                LDPC_TABLE_DATA_WIDTH,
+                [(x, LDPC_TABLE_DATA_WIDTH, x.coefficients) for x in tables],
+            )
+        ],
+    )
+
+    # Coefficients are packed at the width of each table
+    for word_width in PACKED_WORD_WIDTHS:
+        yield RomEncoding(
+            f"packed, {word_width} bit words",
+            [(word_width, [(x, x.entry_width, x.coefficients) for x in tables])],
+        )
+
+    # Deltas are packed the same way, at the width of each table's largest
+    # delta
+    deltas = [tuple(_getDeltaCoefficients(x)) for x in tables]
+    for word_width in PACKED_WORD_WIDTHS:
+        yield RomEncoding(
+            f"row delta, {word_width} bit words",
+            [
+                (
+                    word_width,
+                    [(x, max(y).bit_length(), y) for x, y in zip(tables, deltas)],
+                )
+            ],
+            supported=False,
+        )
+
+    frame_types = {}
+    for table in tables:
+        frame_types.setdefault(table.frame_type, []).append(table)
+
+    roms = []
+    for frame_type_tables in frame_types.values():
+        width = max(x.entry_width for x in frame_type_tables)
+        roms += [(width, [(x, width, x.coefficients) for x in frame_type_tables])]
+
+    yield RomEncoding("split by frame type", roms, supported=False)
+
+
+def getEncodingNames(tables):
+    "Returns the names of the encodings axi_ldpc_table can read"
+    return [x.name for x in getEncodings(tables) if x.supported]
+
+
+def selectEncoding(encodings, name=None):
+    """
+    Returns the supported encoding with a given name or, if name is None, the
+    one that uses the least BRAMs, breaking ties with the number of bits.
+    axi_ldpc_table adds a pipeline stage for packed encodings (see
+    get_extract_cycles)
+    """
+    supported = [x for x in encodings if x.supported]
+    if name is None:
+
+        def cost(encoding):
+            stats = encoding.getStats()
+            return stats["brams_18k"], stats["brams_36k"], stats["total"]
+
+        return min(supported, key=cost)
+
+    for encoding in supported:
+        if encoding.name == name:
+            return encoding
+    raise ValueError(f"{repr(name)} is not a supported encoding")
+
+
+def _generateTablesRom(tables, encoding):
     count_cfg = dict(_generateRowCountRom(tables))
 
     package = [
@@ -264,11 +460,22 @@ def _generateTablesRom(tables):
         f"    stage_0_rows: integer;",
         f"    stage_1_loops: integer;",
         f"    stage_1_rows: integer;",
+        f"    entry_width: integer;",
+        f"    last_entry_offset: integer;",
         f"  end record ldpc_metadata_t;",
         f"",
         f"  -- Reduce the footprint of this",
         f"  constant LDPC_TABLE_DATA_WIDTH : integer := numbits(max(DVB_N_LDPC));",
         f"",
+        f"  -- Each word of LDPC_DATA_TABLE has one or more coefficients of entry_width bits,",
+        f"  -- the first one on the LSBs and the last one at last_entry_offset",
+        f"  constant LDPC_DATA_TABLE_WIDTH : integer := {encoding.word_width};",
+        f"",
+        f"  -- Bit offsets where coefficients can start within a word of LDPC_DATA_TABLE",
+        f"  constant LDPC_DATA_TABLE_OFFSETS : integer_vector_t := ("
+        + ", ".join(f"{i} => {x}" for i, x in enumerate(encoding.getOffsets()))
+        + ");",
+        f"",
         f"  -- Use this function to get the starting address of a given config within the LDPC_DATA_TABLE",
         f"  function get_ldpc_metadata (",
         f"    constant frame_type : frame_type_t;",
@@ -276,9 +483,9 @@ def _generateTablesRom(tables):
         "",
     ]
 
-    #  data_width = max(y for table in tables for y in table.widths)
-    data_width = "LDPC_TABLE_DATA_WIDTH"
-    table_length = sum(len(y) for table in tables for y in table.table)
+    data_width = "LDPC_DATA_TABLE_WIDTH"
+    words = list(encoding.getWords())
+    table_length = len(words)
     address_width = math.ceil(math.log2(table_length))
 
     package_body = [
@@ -293,17 +500,13 @@ def _generateTablesRom(tables):
 
     _logger.debug("Address map:")
     addr = 0
-    for table in tables:
+    for table, entry_width, coefficients in encoding.roms[0][1]:
+        entries_per_word = encoding.word_width // entry_width
         _logger.debug("0x%.4x | %4d | %s", addr, addr, table.name)
         key = (table.frame_type, table.code_rate)
-        result_tuple = [
-            addr,
-            count_cfg[key][0][0],
-            count_cfg[key][0][1],
-            count_cfg[key][1][0],
-            count_cfg[key][1][1],
-        ]
-        print(result_tuple)
+        _logger.debug(
+            "%s metadata: addr=%d, stages=%s", table.name, addr, count_cfg[key]
+        )
         package_body += [
             f"    if frame_type = {table.frame_type} and code_rate = {table.code_rate} then",
             f"      return (",
@@ -312,16 +515,19 @@ def _generateTablesRom(tables):
             f"        stage_0_loops => {count_cfg[key][0][0]},",
             f"        stage_0_rows => {count_cfg[key][0][1]},",
             f"        stage_1_loops => {count_cfg[key][1][0]},",
-            f"        stage_1_rows => {count_cfg[key][1][1]});",
+            f"        stage_1_rows => {count_cfg[key][1][1]},",
+            f"        entry_width => {entry_width},",
+            f"        last_entry_offset => {(entries_per_word - 1) * entry_width});",
             f"     end if;",
         ]
 
-        addr += sum(len(x) for x in table.table)
+        addr += math.ceil(len(coefficients) / entries_per_word)
 
     package_body += [
         "",
         "    -- Return a non existing index for any config not listed above",
-        "    return (addr => -1, q => -1, stage_0_loops => -1, stage_0_rows => -1, stage_1_loops => -1, stage_1_rows => -1);",
+        "    return (addr => -1, q => -1, stage_0_loops => -1, stage_0_rows => -1, stage_1_loops => -1, stage_1_rows => -1,",
+        "            entry_width => -1, last_entry_offset => -1);",
         "  end function get_ldpc_metadata;",
         "",
     ]
@@ -333,47 +539,54 @@ def _generateTablesRom(tables):
     # Now generate the actual table
     package += [
         "",
+        f"  -- Coefficients encoded as '{encoding.name}'",
         f"  constant LDPC_DATA_TABLE : std_logic_array_t"
         f"(0 to {table_length - 1})"
         f"({data_width} - 1 downto 0) := (",
     ]
 
-    addr = 0
-
     rom_content = []
-    for table in tables:
-        rom_content += [
-            f"    -- Table for {table.frame_type}, {table.code_rate}",
+    for addr, (table, entry_width, coefficients) in enumerate(words):
+        if addr == 0 or words[addr - 1][0] is not table:
+            rom_content += [
+                f"    -- Table for {table.frame_type}, {table.code_rate}",
+            ]
+
+        padding = encoding.word_width - len(coefficients) * entry_width
+
+        # Last coefficient goes on the MSBs
+        fields = [f'"{"0" * padding}"'] if padding else []
+        fields += [
+            f"std_logic_vector(to_unsigned({x:5d}, {entry_width}))"
+            for x in reversed(coefficients)
         ]
 
-        for row in table.table:
-            for i, column in enumerate(row):
-                # Append the is_last flag and the actual data
-                is_last = i == len(row) - 1
+        entry = f"    {addr:4d} => " + " & ".join(fields)
 
-                #  vhdl_bin_value = bin(column)[2:]
-                #  vhdl_bin_value = '0'*(data_width - len(vhdl_bin_value)) + vhdl_bin_value
+        if addr < table_length - 1:
+            entry += ","
 
-                entry = (
-                    f"    {addr:4d} => "
-                    f"std_logic_vector(to_unsigned({column:5d}, {data_width}))"
-                )
+        rom_content += [entry]
 
-                if addr < table_length - 1:
-                    entry += ", -- %5d / 0x%.4x" % (column, column)
-                    if is_last:
-                        entry += " -- last item of row"
+    package += ["\n".join(rom_content) + ");"]
 
-                rom_content += [entry]
+    return "\n".join(package), "\n".join(package_body)
 
-                addr += 1
 
-    package += ["\n".join(rom_content) + ");"]
+@lru_cache(maxsize=None)
+def getTables(path=p.join(ROOT, "ldpc")):
+    "Returns the LDPC tables of all CSV files in path, parsing them only once"
+    return tuple(LdpcTable(x) for x in sorted(glob(p.join(path, "*.csv"))))
 
-    return "\n".join(package), "\n".join(package_body)
 
+def render(ldpc_tables=None, encoding_name=None):
+    """
+    Returns the contents of ldpc_tables_pkg.vhd with LDPC_DATA_TABLE using the
+    encoding named encoding_name or, if not set, the cheapest one
+    """
+    if ldpc_tables is None:
+        ldpc_tables = getTables()
 
-def main():
     lines = str(HEADER)
 
     lines += "\n".join(
@@ -390,14 +603,10 @@ def main():
         ]
     )
 
-    paths = sorted(glob(p.join(ROOT, "ldpc", "*.csv")))
-
     rendered_tables = ""
 
     stats = []
 
-    ldpc_tables = tuple(LdpcTable(x) for x in paths)
-
     for ldpc_table in ldpc_tables:
         stats += [["--", ldpc_table.name] + list(ldpc_table.getStats().values())]
         rendered_tables += ldpc_table.render()
@@ -417,7 +626,50 @@ def main():
             "36k BRAMs",
         ),
     )
-    lines += "\n".join(["", "", "package ldpc_tables_pkg is", "", "",])
+
+    encodings = list(getEncodings(ldpc_tables))
+    encoding = selectEncoding(encodings, encoding_name)
+
+    candidates = []
+    for candidate in encodings:
+        stats = candidate.getStats()
+        _logger.debug(
+            "%s: %s x %s bits, %d x 18k BRAMs or %d x 36k BRAMs%s",
+            stats["name"],
+            stats["depth"],
+            stats["width"],
+            stats["brams_18k"],
+            stats["brams_36k"],
+            "" if candidate.supported else " (not supported by axi_ldpc_table)",
+        )
+        candidates += [
+            ["--", "*" if candidate is encoding else ""] + list(stats.values())
+        ]
+
+    lines += "\n\n-- LDPC_DATA_TABLE encodings (* is the one used)\n\n"
+    lines += tabulate(
+        candidates,
+        headers=(
+            "--",
+            "",
+            "encoding",
+            "depth",
+            "width (bits)",
+            "total (bits)",
+            "18k BRAMs",
+            "36k BRAMs",
+            "supported",
+        ),
+    )
+    lines += "\n".join(
+        [
+            "",
+            "",
+            "package ldpc_tables_pkg is",
+            "",
+            "",
+        ]
+    )
 
     lines += "\n".join(
         [
@@ -436,7 +688,7 @@ def main():
     )
     lines += rendered_tables
 
-    package, package_body = _generateTablesRom(ldpc_tables)
+    package, package_body = _generateTablesRom(ldpc_tables, encoding)
 
     lines += "\n".join(
         [
@@ -451,10 +703,78 @@ def main():
         ]
     )
 
-    target_file = p.abspath(p.join(ROOT, "..", "rtl", "ldpc", "ldpc_tables_pkg.vhd"))
-    if not p.exists(p.dirname(target_file)):
-        makedirs(p.dirname(target_file))
-    open(target_file, "w").write(lines)
+    return lines
+
+
+def isStale(path=TARGET_FILE, content=None):
+    "Checks if path doesn't exist or its contents differ from the rendered package"
+    if content is None:
+        content = render()
+    try:
+        with open(path, "r") as fd:
+            return fd.read() != content
+    except OSError:
+        return True
+
+
+def writeIfChanged(path=TARGET_FILE, content=None):
+    """
+    Writes the rendered package to path, replacing it atomically, only if its
+    contents changed so that its timestamp (and what depends on it) is kept
+    otherwise. Returns True if the file was written
+    """
+    if content is None:
+        content = render()
+    if not isStale(path, content):
+        return False
+
+    os.makedirs(p.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "w") as fd:
+        fd.write(content)
+    os.replace(temp, path)
+    return True
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write anything, exit with 1 if the package is not up to date",
+    )
+    parser.add_argument(
+        "--output", "-o", default=TARGET_FILE, help="Path of the generated package"
+    )
+    parser.add_argument(
+        "--encoding",
+        default=None,
+        choices=getEncodingNames(getTables()),
+        help="Layout of the coefficients in LDPC_DATA_TABLE. Defaults to the one "
+        "that uses the least BRAMs. Packed encodings add a cycle of latency and "
+        "a mux to axi_ldpc_table",
+    )
+    args = parser.parse_args()
+
+    content = render(encoding_name=args.encoding)
+
+    if args.check:
+        if isStale(args.output, content):
+            _logger.error(
+                "%s is out of date, run %s to update it", args.output, sys.argv[0]
+            )
+            return 1
+        _logger.info("%s is up to date", args.output)
+        return 0
+
+    if writeIfChanged(args.output, content):
+        _logger.info("Updated %s", args.output)
+    else:
+        _logger.info("%s is up to date", args.output)
+
+    return 0
 
 
-main()
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"""
+Merges the xunit reports of run.py --shard i/N runs into a single report
+"""
+
+import logging
+import sys
+from argparse import ArgumentParser
+from xml.etree import ElementTree
+
+_logger = logging.getLogger(__name__)
+
+
+def merge(paths):
+    "Returns a testsuite element with the test cases of all reports in paths"
+    testcases = {}
+    for path in paths:
+        root = ElementTree.parse(path).getroot()
+        for testcase in root.iter("testcase"):
+            key = (testcase.get("classname"), testcase.get("name"))
+            if key in testcases:
+                _logger.warning(
+                    "%s.%s found in more than one report, keeping the last one",
+                    *key,
+                )
+            testcases[key] = testcase
+
+    suite = ElementTree.Element("testsuite")
+    suite.attrib["name"] = "dvb_fpga"
+    suite.attrib["tests"] = str(len(testcases))
+    suite.attrib["failures"] = str(
+        sum(x.find("failure") is not None for x in testcases.values())
+    )
+    suite.attrib["errors"] = str(
+        sum(x.find("error") is not None for x in testcases.values())
+    )
+    suite.attrib["skipped"] = str(
+        sum(x.find("skipped") is not None for x in testcases.values())
+    )
+    suite.attrib["time"] = "%.1f" % sum(
+        float(x.get("time", 0)) for x in testcases.values()
+    )
+
+    for key in sorted(testcases):
+        suite.append(testcases[key])
+
+    return suite
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--output", "-o", required=True, help="Merged report")
+    parser.add_argument("reports", nargs="+", help="xunit reports of each shard")
+    args = parser.parse_args()
+
+    suite = merge(args.reports)
+    ElementTree.ElementTree(suite).write(
+        args.output, encoding="utf-8", xml_declaration=True
+    )
+
+    print(
+        f"Merged {suite.get('tests')} tests from {len(args.reports)} reports, "
+        f"{suite.get('failures')} failures, {suite.get('errors')} errors"
+    )
+
+    return 1 if int(suite.get("failures")) or int(suite.get("errors")) else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
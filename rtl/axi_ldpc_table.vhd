@@ -65,16 +65,37 @@ architecture axi_ldpc_table of axi_ldpc_table is
     0 => FRAME_TYPE_WIDTH,
     1 => CODE_RATE_WIDTH);
 
-  constant TABLE_ENTRY_WIDTH : integer := get_table_entry_width(LDPC_DATA_TABLE);
+  constant ROM_WORD_WIDTH     : integer := get_table_entry_width(LDPC_DATA_TABLE);
+  constant TABLE_ENTRY_WIDTH  : integer := LDPC_TABLE_DATA_WIDTH;
+  -- Bit offsets within a ROM word and coefficient widths, with an extra bit so that the
+  -- width of a coefficient filling the entire word also fits
+  constant ENTRY_OFFSET_WIDTH : integer := numbits(ROM_WORD_WIDTH) + 1;
+
+  -- Picking a coefficient out of a packed ROM word takes a pipeline stage of its own,
+  -- words with a single coefficient are used as is
+  function get_extract_cycles return integer is
+  begin
+    if LDPC_DATA_TABLE_OFFSETS'length = 1 then
+      return 0;
+    end if;
+    return 1;
+  end;
 
-  -- Record with LDPC metadata as unsigned vectors
+  constant EXTRACT_CYCLES     : integer := get_extract_cycles;
+
+  -- Record with LDPC metadata as unsigned vectors. addr and offset point to the ROM word
+  -- and bit offset within it of the first coefficient of the current row
   type ldpc_metadata_unsigned_t is record
-    addr          : unsigned(numbits(LDPC_DATA_TABLE'length) - 1 downto 0);
-    q             : unsigned(LDPC_Q_WIDTH - 1 downto 0);
-    stage_0_loops : unsigned(7 downto 0);
-    stage_0_rows  : unsigned(7 downto 0);
-    stage_1_loops : unsigned(7 downto 0);
-    stage_1_rows  : unsigned(7 downto 0);
+    addr              : unsigned(numbits(LDPC_DATA_TABLE'length) - 1 downto 0);
+    offset            : unsigned(ENTRY_OFFSET_WIDTH - 1 downto 0);
+    q                 : unsigned(LDPC_Q_WIDTH - 1 downto 0);
+    stage_0_loops     : unsigned(7 downto 0);
+    stage_0_rows      : unsigned(7 downto 0);
+    stage_1_loops     : unsigned(7 downto 0);
+    stage_1_rows      : unsigned(7 downto 0);
+    entry_width       : unsigned(ENTRY_OFFSET_WIDTH - 1 downto 0);
+    entry_mask        : std_logic_vector(TABLE_ENTRY_WIDTH - 1 downto 0);
+    last_entry_offset : unsigned(ENTRY_OFFSET_WIDTH - 1 downto 0);
   end record ldpc_metadata_unsigned_t;
 
   -- Overload original to get unsigned fields
@@ -84,15 +105,38 @@ architecture axi_ldpc_table of axi_ldpc_table is
     variable result     : ldpc_metadata_t := get_ldpc_metadata(frame_type, code_rate);
   begin
     return (
-      addr          => to_unsigned(result.addr, numbits(LDPC_DATA_TABLE'length)),
-      q             => to_unsigned(result.q, LDPC_Q_WIDTH),
-      stage_0_loops => to_unsigned(result.stage_0_loops - 1, 8),
-      stage_0_rows  => to_unsigned(result.stage_0_rows - 1, 8),
-      stage_1_loops => to_unsigned(result.stage_1_loops - 1, 8),
-      stage_1_rows  => to_unsigned(result.stage_1_rows - 1, 8)
+      addr              => to_unsigned(result.addr, numbits(LDPC_DATA_TABLE'length)),
+      offset            => (others => '0'),
+      q                 => to_unsigned(result.q, LDPC_Q_WIDTH),
+      stage_0_loops     => to_unsigned(result.stage_0_loops - 1, 8),
+      stage_0_rows      => to_unsigned(result.stage_0_rows - 1, 8),
+      stage_1_loops     => to_unsigned(result.stage_1_loops - 1, 8),
+      stage_1_rows      => to_unsigned(result.stage_1_rows - 1, 8),
+      entry_width       => to_unsigned(result.entry_width, ENTRY_OFFSET_WIDTH),
+      entry_mask        => std_logic_vector(to_unsigned(2**result.entry_width - 1, TABLE_ENTRY_WIDTH)),
+      last_entry_offset => to_unsigned(result.last_entry_offset, ENTRY_OFFSET_WIDTH)
     );
   end;
 
+  -- Extracts the coefficient at a given bit offset of a ROM word. Coefficients can only
+  -- start at one of the offsets in LDPC_DATA_TABLE_OFFSETS, so this is a mux between
+  -- fixed slices of the word rather than a shifter
+  function get_entry (
+    constant word   : std_logic_vector;
+    constant offset : std_logic_vector;
+    constant mask   : std_logic_vector) return unsigned is
+    variable result  : unsigned(TABLE_ENTRY_WIDTH - 1 downto 0);
+  begin
+    result := (others => '0');
+    for i in LDPC_DATA_TABLE_OFFSETS'range loop
+      if unsigned(offset) = LDPC_DATA_TABLE_OFFSETS(i) then
+        result := resize(shift_right(unsigned(word), LDPC_DATA_TABLE_OFFSETS(i)),
+                         TABLE_ENTRY_WIDTH);
+      end if;
+    end loop;
+    return result and unsigned(mask);
+  end;
+
   -------------
   -- Signals --
   -------------
@@ -112,7 +156,10 @@ architecture axi_ldpc_table of axi_ldpc_table is
 
   signal metadata          : ldpc_metadata_unsigned_t;
   signal table_addr        : unsigned(numbits(LDPC_DATA_TABLE'length) - 1 downto 0);
-  signal rom_data          : std_logic_vector(TABLE_ENTRY_WIDTH - 1 downto 0);
+  signal table_offset      : unsigned(ENTRY_OFFSET_WIDTH - 1 downto 0);
+  signal next_addr         : unsigned(numbits(LDPC_DATA_TABLE'length) - 1 downto 0);
+  signal next_offset       : unsigned(ENTRY_OFFSET_WIDTH - 1 downto 0);
+  signal rom_data          : std_logic_vector(ROM_WORD_WIDTH - 1 downto 0);
   signal offset_delta      : unsigned(TABLE_ENTRY_WIDTH - 1 downto 0);
   signal offset_delta_reg  : std_logic_vector(TABLE_ENTRY_WIDTH - 1 downto 0);
   signal busy              : std_logic;
@@ -194,7 +241,12 @@ begin
                   metadata.stage_0_loops when stage = 0 else
                   metadata.stage_1_loops;
 
-  ldpc_coeff <= '0' & unsigned(rom_data);
+  -- Coefficients are read one after the other from each ROM word, moving to the next
+  -- word after the last one
+  next_addr   <= table_addr + 1 when table_offset = metadata.last_entry_offset else
+                 table_addr;
+  next_offset <= (others => '0') when table_offset = metadata.last_entry_offset else
+                 table_offset + metadata.entry_width;
 
   last_coeff  <= '1' when loop_cnt = loop_cnt_max and stage = 1 and row_cnt = row_cnt_max and group_cnt = DVB_LDPC_GROUP_LENGTH - 1 else '0';
 
@@ -223,14 +275,19 @@ begin
       table_length    <= (others => '1');
 
       table_addr      <= (others => 'U');
+      table_offset    <= (others => '0');
       cfg_frame_type  <= unknown;
       cfg_code_rate   <= unknown;
-      metadata        <= (addr          => (others => 'U'),
-                          q             => (others => 'U'),
-                          stage_0_loops => (others => 'U'),
-                          stage_0_rows  => (others => 'U'),
-                          stage_1_loops => (others => 'U'),
-                          stage_1_rows  => (others => 'U'));
+      metadata        <= (addr              => (others => 'U'),
+                          offset            => (others => 'U'),
+                          q                 => (others => 'U'),
+                          stage_0_loops     => (others => 'U'),
+                          stage_0_rows      => (others => 'U'),
+                          stage_1_loops     => (others => 'U'),
+                          stage_1_rows      => (others => 'U'),
+                          entry_width       => (others => 'U'),
+                          entry_mask        => (others => 'U'),
+                          last_entry_offset => (others => 'U'));
 
     elsif clk'event and clk = '1' then
 
@@ -251,6 +308,7 @@ begin
 
         metadata          <= tmp_ldpc_metadata;
         table_addr        <= tmp_ldpc_metadata.addr;
+        table_offset      <= tmp_ldpc_metadata.offset;
       end if;
 
       if axi_out_wren = '1' and axi_out_next = '1' then
@@ -270,7 +328,8 @@ begin
                                                           code_rate => cfg_code_rate),
                                      table_length'length);
 
-        table_addr    <= table_addr + 1;
+        table_addr    <= next_addr;
+        table_offset  <= next_offset;
         row_cnt       <= row_cnt + 1;
 
         last_row : if row_cnt = row_cnt_max then
@@ -286,18 +345,21 @@ begin
           end if;
 
           -- Re read this address range
-          table_addr <= metadata.addr;
+          table_addr   <= metadata.addr;
+          table_offset <= metadata.offset;
 
           -- Handle end of the 360 entries group
           end_of_group : if group_cnt = DVB_LDPC_GROUP_LENGTH - 1 then
             group_cnt       <= (others => '0');
             loop_cnt        <= loop_cnt + 1;
-            table_addr      <= table_addr + 1;
+            table_addr      <= next_addr;
+            table_offset    <= next_offset;
 
             -- Once we iterated enough times over this range, let the address increment
             -- but store the point where that happened so we can do the same thing with
             -- a different base address
-            metadata.addr   <= table_addr + 1;
+            metadata.addr   <= next_addr;
+            metadata.offset <= next_offset;
 
             end_of_loop : if loop_cnt = loop_cnt_max then
               loop_cnt      <= (others => '0');
@@ -321,7 +383,7 @@ begin
   -------------------------------------------------------------
   axi_out_ctrl_gen_u : entity fpga_cores.sr_delay
     generic map (
-      DELAY_CYCLES  => 4,
+      DELAY_CYCLES  => 4 + EXTRACT_CYCLES,
       DATA_WIDTH    => 2,
       EXTRACT_SHREG => False)
     port map (
@@ -336,7 +398,7 @@ begin
 
   axi_out_next_gen_u : entity fpga_cores.sr_delay
     generic map (
-      DELAY_CYCLES  => 3,
+      DELAY_CYCLES  => 3 + EXTRACT_CYCLES,
       DATA_WIDTH    => 1,
       EXTRACT_SHREG => False)
     port map (
@@ -346,10 +408,48 @@ begin
       din(0)   => ldpc_next,
       dout(0)  => axi_out_next);
 
+  -- ROM words with a single coefficient
+  full_width_gen : if EXTRACT_CYCLES = 0 generate
+    ldpc_coeff <= '0' & unsigned(rom_data(TABLE_ENTRY_WIDTH - 1 downto 0));
+  end generate full_width_gen;
+
+  -- ROM words with multiple coefficients
+  packed_gen : if EXTRACT_CYCLES /= 0 generate
+    signal entry_info     : std_logic_vector(ENTRY_OFFSET_WIDTH + TABLE_ENTRY_WIDTH - 1 downto 0);
+    signal rom_entry_info : std_logic_vector(ENTRY_OFFSET_WIDTH + TABLE_ENTRY_WIDTH - 1 downto 0);
+  begin
+
+    entry_info <= metadata.entry_mask & std_logic_vector(table_offset);
+
+    -- Synchronize the bit offset and mask of each coefficient with the ROM output
+    entry_delay_u : entity fpga_cores.sr_delay
+      generic map (
+        DELAY_CYCLES  => 2,
+        DATA_WIDTH    => entry_info'length,
+        EXTRACT_SHREG => False)
+      port map (
+        clk      => clk,
+        clken    => '1',
+
+        din   => entry_info,
+        dout  => rom_entry_info);
+
+    process(clk)
+    begin
+      if rising_edge(clk) then
+        ldpc_coeff <= '0' & get_entry(
+          word   => rom_data,
+          offset => rom_entry_info(ENTRY_OFFSET_WIDTH - 1 downto 0),
+          mask   => rom_entry_info(rom_entry_info'length - 1 downto ENTRY_OFFSET_WIDTH));
+      end if;
+    end process;
+
+  end generate packed_gen;
+
   -- Synchronize the offset with the pipelined ldpc_coeff
   offset_delta_delay_u : entity fpga_cores.sr_delay
     generic map (
-      DELAY_CYCLES  => 2,
+      DELAY_CYCLES  => 2 + EXTRACT_CYCLES,
       DATA_WIDTH    => offset_delta'length,
       EXTRACT_SHREG => False)
     port map (
@@ -391,7 +491,7 @@ begin
 
     axi_out_adapter_u : entity fpga_cores.axi_stream_master_adapter
       generic map (
-        MAX_SKEW_CYCLES => 5,
+        MAX_SKEW_CYCLES => 5 + EXTRACT_CYCLES,
         TDATA_WIDTH     => wr_data'length)
       port map (
         -- Usual ports
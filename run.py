@@ -21,26 +21,60 @@
 """Main unit test entry point"""
 
 # pylint: disable=unspecified-encoding
+import argparse
+import collections
+import contextlib
+import fnmatch
+import functools
+import glob
+import hashlib
+import heapq
+import inspect
+import itertools
+import json
 import logging
 import math
 import os
 import os.path as p
 import random
 import re
+import shlex
+import shutil
+import struct
 import subprocess as subp
 import sys
+import tempfile
+import threading
 import time
+import zlib
 from enum import Enum
 from multiprocessing import Pool
-from typing import List, NamedTuple
+from typing import Dict, List, NamedTuple
 
+import numpy  # type: ignore
 from vunit.ui import VUnit  # type: ignore
 from vunit.vunit_cli import VUnitCLI  # type: ignore
 
+try:
+    import fcntl
+    import resource
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+    resource = None  # type: ignore
+
 _logger = logging.getLogger(__name__)
 
 ROOT = p.abspath(p.dirname(__file__))
 
+sys.path.insert(0, p.join(ROOT, "gnuradio_data"))
+sys.path.insert(0, p.join(ROOT, "misc"))
+
+# pylint: disable=wrong-import-position
+import check_raw_dump  # type: ignore
+import dvbs2_encoder_model  # type: ignore
+
+# pylint: enable=wrong-import-position
+
 
 class ConstellationType(Enum):
     """
@@ -104,7 +138,7 @@ class TestDefinition(
 
     def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
         super().__init__()
-        self.timestamp = p.join(self.test_files_path, "timestamp")
+        self.cache_key_file = p.join(self.test_files_path, "cache_key")
 
     @staticmethod
     def fromConfigTuple(frame_type, constellation, code_rate, pilots):
@@ -176,7 +210,10 @@ def _getConfigs(
                     )
 
 
-TEST_CONFIGS = set(_getConfigs())
+@functools.lru_cache(maxsize=None)
+def _getTestConfigs():
+    "All valid configs, created on first use to keep start up fast"
+    return frozenset(_getConfigs())
 
 
 def _getAcmCommandByte(
@@ -234,31 +271,252 @@ def _getAcmCommandByte(
     return result
 
 
-def _runGnuRadio(config):
+GNU_RADIO_FLOW_GRAPH = p.join(ROOT, "gnuradio_data", "dvbs2_encoder_flow_diagram.py")
+
+# Number of frames generated for each config. The flow graph and the model can
+# write multiple frames (with a .index file per dump), but testbenches read
+# each dump as a single frame and replay it NUMBER_OF_TEST_FRAMES times, so
+# they need to be updated before this can be raised
+REFERENCE_DATA_FRAMES = 1
+
+# Tables shared by all configs, see _getLdpcTablePath and
+# _getModulationTablePath
+LDPC_TABLES_PATH = p.join(ROOT, "gnuradio_data", "ldpc_tables")
+MODULATION_TABLES_PATH = p.join(ROOT, "gnuradio_data", "modulation_tables")
+
+
+class StageProfile(NamedTuple):
+    "Resources used by a single data generation stage"
+    stage: str
+    name: str
+    wall_time: float
+    cpu_time: float
+    # In kB, as reported by getrusage
+    peak_rss: int
+    bytes_written: int
+
+
+def _getSize(path: str) -> int:
+    "Size of a file or of all files in a directory"
+    if p.isdir(path):
+        return sum(_getSize(p.join(path, name)) for name in os.listdir(path))
+    return p.getsize(path) if p.exists(path) else 0
+
+
+def _profileStage(stage, name, function, *args, **kwargs) -> List[StageProfile]:
     """
-    Runs gnuradio_data/dvbs2_encoder_flow_diagram.py script via shell. Reason
-    for not importing and running locally is to allow GNI Radio's Python
-    environment to be independent of VUnit's Python env.
+    Calls function(*args, **kwargs) and returns the resources it used.
+    function should return the paths it has written or None if there was
+    nothing to do, in which case nothing is returned. CPU time and peak RSS
+    include child processes (e.g. the GNU Radio flow graph), peak RSS is
+    that of the process running the stage and not only of the stage itself.
+    Both are 0 where getrusage is not available
     """
-    print(f"Generating data for {config.name}")
 
-    command = [
-        p.join(ROOT, "gnuradio_data", "dvbs2_encoder_flow_diagram.py"),
-        "--frame-type",
-        config.frame_type.name,
-        "--constellation",
-        config.constellation.name,
-        "--code-rate",
-        config.code_rate.name,
+    def getUsage():
+        if resource is None:
+            return ()
+        return (
+            resource.getrusage(resource.RUSAGE_SELF),
+            resource.getrusage(resource.RUSAGE_CHILDREN),
+        )
+
+    wall_start = time.perf_counter()
+    usage_start = getUsage()
+
+    paths = function(*args, **kwargs)
+
+    wall_time = time.perf_counter() - wall_start
+    usage_end = getUsage()
+
+    if paths is None:
+        return []
+
+    return [
+        StageProfile(
+            stage=stage,
+            name=name,
+            wall_time=wall_time,
+            cpu_time=sum(
+                end.ru_utime + end.ru_stime - start.ru_utime - start.ru_stime
+                for start, end in zip(usage_start, usage_end)
+            ),
+            peak_rss=max((usage.ru_maxrss for usage in usage_end), default=0),
+            bytes_written=sum(_getSize(path) for path in paths),
+        )
     ]
 
-    if not p.exists(config.test_files_path):
-        os.makedirs(config.test_files_path)
+
+class CpuBudget:
+    """
+    Number of CPUs shared by reference data generation workers and simulator
+    processes. A simulation holds one CPU from the moment its data is ready
+    until it finishes. VUnit only calls post_check hooks when tests pass, so
+    the CPU of a failed simulation is given back when its VUnit thread starts
+    the next test
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._free = size
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+    def available(self):
+        "Number of CPUs not in use"
+        with self._condition:
+            return self._free
+
+    def acquire(self, count=1):
+        """
+        Waits until count CPUs (up to the budget size) are free and takes
+        them. Returns the number of CPUs taken
+        """
+        count = min(count, self.size)
+        with self._condition:
+            self._condition.wait_for(lambda: self._free >= count)
+            self._free -= count
+        return count
+
+    def release(self, count=1):
+        "Gives back count CPUs"
+        with self._condition:
+            self._free += count
+            self._condition.notify_all()
+
+    def startSimulation(self):
+        "Takes a CPU for the simulation the current thread is about to run"
+        self.endSimulation()
+        self.acquire()
+        self._local.simulating = True
+
+    def endSimulation(self):
+        "Gives back the CPU of the current thread's last simulation, if any"
+        if getattr(self._local, "simulating", False):
+            self._local.simulating = False
+            self.release()
+
+
+class BudgetPool:
+    """
+    Process pool whose jobs only start when a CPU of the budget is free, so
+    that it can be shared by multiple threads without using more CPUs than
+    the budget allows
+    """
+
+    def __init__(self, budget: CpuBudget):
+        self.budget = budget
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _getPool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = Pool(self.budget.size)
+            return self._pool
+
+    def start(self):
+        """
+        Creates the worker processes. Forking is only safe before other
+        threads are started, so this should be called before that
+        """
+        self._getPool()
+
+    def map(self, function, iterable):
+        "Same as multiprocessing.Pool.map"
+        return self.starmap(function, ((x,) for x in iterable))
+
+    def starmap(self, function, iterable):
+        "Same as multiprocessing.Pool.starmap"
+        pool = self._getPool()
+        results = []
+        for args in iterable:
+            self.budget.acquire()
+            try:
+                results += [
+                    pool.apply_async(
+                        function,
+                        args,
+                        callback=lambda _: self.budget.release(),
+                        error_callback=lambda _: self.budget.release(),
+                    )
+                ]
+            except:
+                self.budget.release()
+                raise
+        return [result.get() for result in results]
+
+    def close(self):
+        "Terminates the worker processes"
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+
+def _getPool(pool):
+    "Returns a context manager for pool or, if pool is None, for a new Pool"
+    return Pool() if pool is None else contextlib.nullcontext(pool)
+
+
+def _getDataSeed(config, seed):
+    """
+    Returns the seed used to generate a config's random input data, so that
+    configs sharing a seed still get different frames
+    """
+    return zlib.crc32(f"{seed},{p.basename(config.test_files_path)}".encode())
+
+
+def _runGnuRadio(configs, seed=0, pool=None):
+    """
+    Runs gnuradio_data/dvbs2_encoder_flow_diagram.py script via shell in
+    batch mode, so that the flow graphs for all configs are built and run by a
+    small pool of long lived workers. Reason for not importing and running
+    locally is to allow GNI Radio's Python environment to be independent of
+    VUnit's Python env. Returns the resources used, the flow graph is
+    profiled as a whole since all configs are run by the same process. If
+    pool is a BudgetPool, the flow graph workers take CPUs from its budget
+    """
+    manifest = []
+    for config in configs:
+        print(f"Generating data for {config.name}")
+        manifest += [
+            " ".join(
+                shlex.quote(str(x))
+                for x in (
+                    config.frame_type.name,
+                    config.constellation.name,
+                    config.code_rate.name,
+                    config.test_files_path,
+                    _getDataSeed(config, seed),
+                    REFERENCE_DATA_FRAMES,
+                )
+            )
+        ]
+
+    command = [GNU_RADIO_FLOW_GRAPH, "--batch", "-"]
+
+    budget = getattr(pool, "budget", None)
+    if budget is not None:
+        workers = budget.acquire(max(1, min(len(configs), budget.available())))
+        command += ["--workers", str(workers)]
+
+    def runFlowGraph():
+        try:
+            subp.run(
+                command,
+                input="\n".join(manifest).encode(),
+                stdout=subp.PIPE,
+                stderr=subp.PIPE,
+                check=True,
+            )
+        finally:
+            if budget is not None:
+                budget.release(workers)
+        return [config.test_files_path for config in configs]
 
     try:
-        subp.check_output(command, cwd=config.test_files_path, stderr=subp.PIPE)
-        with open(config.timestamp, "w") as fd:
-            fd.write(time.asctime())
+        profiles = _profileStage("gnuradio", f"{len(configs)} configs", runFlowGraph)
     except subp.CalledProcessError as exc:
         _logger.error(
             'Failed to generate GUN Radio data. Command used: "%s"\nResult:\n%s',
@@ -267,14 +525,59 @@ def _runGnuRadio(config):
         )
         raise
 
-    # Generate the dvbs2_encoder_wrapper test files by inserting the metadata
-    # into the data stream
+    with _getPool(pool) as pool:
+        for result in pool.map(_profileWrapperInputData, configs):
+            profiles += result
+
+    return profiles
+
+
+def _runReferenceModel(config, seed=0):
+    """
+    Generates the same files as _runGnuRadio using the NumPy model of the flow
+    graph (gnuradio_data/dvbs2_encoder_model.py), without leaving the current
+    process. Returns the resources used
+    """
+    print(f"Generating data for {config.name}")
+
+    return _profileStage(
+        "reference_model",
+        config.name,
+        dvbs2_encoder_model.generate,
+        frame_type=config.frame_type.name,
+        constellation=config.constellation.name,
+        code_rate=config.code_rate.name,
+        path=config.test_files_path,
+        seed=_getDataSeed(config, seed),
+        frames=REFERENCE_DATA_FRAMES,
+    ) + _profileWrapperInputData(config)
+
+
+def _profileWrapperInputData(config):
+    "Runs _addWrapperInputData and returns the resources used"
+    return _profileStage(
+        "wrapper_input_data", config.name, _addWrapperInputData, config
+    )
+
+
+def _addWrapperInputData(config):
+    """
+    Generate the dvbs2_encoder_wrapper test files by inserting the metadata
+    into the data stream. Returns the paths written
+    """
+    pilots_off = p.join(
+        config.test_files_path, "dvbs2_encoder_wrapper_input_pilots_off.bin"
+    )
+    pilots_on = p.join(
+        config.test_files_path, "dvbs2_encoder_wrapper_input_pilots_on.bin"
+    )
+
     _addModcodToInputData(
         _getAcmCommandByte(
             config.frame_type, config.constellation, config.code_rate, False
         ),
         p.join(config.test_files_path, "input_data_packed.bin"),
-        p.join(config.test_files_path, "dvbs2_encoder_wrapper_input_pilots_off.bin"),
+        pilots_off,
     )
 
     _addModcodToInputData(
@@ -282,9 +585,11 @@ def _runGnuRadio(config):
             config.frame_type, config.constellation, config.code_rate, True
         ),
         p.join(config.test_files_path, "input_data_packed.bin"),
-        p.join(config.test_files_path, "dvbs2_encoder_wrapper_input_pilots_on.bin"),
+        pilots_on,
     )
 
+    return [pilots_off, pilots_on]
+
 
 def _addModcodToInputData(metadata: int, source: str, target: str):
     """
@@ -297,19 +602,313 @@ def _addModcodToInputData(metadata: int, source: str, target: str):
             target_fd.write(source_fd.read())
 
 
-def _generateGnuRadioData():
+def _getGnuRadioVersion():
+    """
+    Returns the version of GNU Radio used to run the flow graph or "unknown"
+    if it can't be determined
+    """
+    try:
+        return (
+            subp.check_output(["gnuradio-config-info", "--version"], stderr=subp.STDOUT)
+            .decode(errors="replace")
+            .strip()
+        )
+    except (OSError, subp.CalledProcessError):
+        return "unknown"
+
+
+class ReferenceDataCache:
+    """
+    Content addressed cache for the reference data of each config. Entries
+    are keyed on a hash of the generator scripts, the run.py helpers that
+    write to the entries, the config tuple, the seed, the number of frames and
+    the version of the generator, so changing any of those makes that config
+    (and only that config) stale.
+
+    The key of the data currently in a config's test_files_path is kept in
+    a cache_key file inside it. If cache_dir is set, generated data is also
+    stored there under its key so it can be reused by other workspaces, with
+    least recently used entries evicted when the total size goes above
+    max_size bytes.
+    """
+
+    # Files that are not part of the cache entries (auxiliary tables used to be
+    # written to test_files_path)
+    _NOT_CACHED = (
+        "cache_key",
+        "ldpc_table.bin",
+        "ldpc_table.txt",
+        "modulation_table.bin",
+    )
+
+    # Functions whose behaviour changes the contents of the cache entries
+    _HELPERS = (
+        _getAcmCommandByte,
+        _getDataSeed,
+        _runGnuRadio,
+        _runReferenceModel,
+        _addWrapperInputData,
+        _addModcodToInputData,
+    )
+
+    def __init__(self, use_gnuradio, seed, cache_dir=None, max_size=None):
+        self._seed = seed
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+        # The flow graph uses the model to write some of the files
+        scripts = [dvbs2_encoder_model.__file__]
+        if use_gnuradio:
+            scripts += [GNU_RADIO_FLOW_GRAPH]
+            version = f"gnuradio={_getGnuRadioVersion()}"
+        else:
+            version = f"numpy={dvbs2_encoder_model.numpy.__version__}"
+
+        digest = hashlib.sha256()
+        for script in scripts:
+            with open(script, "rb") as fd:
+                digest.update(fd.read())
+        for helper in self._HELPERS:
+            digest.update(inspect.getsource(helper).encode())
+        digest.update(version.encode())
+        self._generator = digest.hexdigest()
+
+    def getKey(self, config: TestDefinition) -> str:
+        "Returns the key of a given config"
+        return hashlib.sha256(
+            ",".join(
+                [
+                    self._generator,
+                    config.frame_type.name,
+                    config.constellation.name,
+                    config.code_rate.name,
+                    str(self._seed),
+                    str(REFERENCE_DATA_FRAMES),
+                ]
+            ).encode()
+        ).hexdigest()
+
+    def isFresh(self, config: TestDefinition) -> bool:
+        "Checks if config's test_files_path has up to date data"
+        try:
+            with open(config.cache_key_file, "r") as fd:
+                return fd.read().strip() == self.getKey(config)
+        except OSError:
+            return False
+
+    def fetch(self, config: TestDefinition) -> bool:
+        """
+        Copies the data for config from the shared cache dir into its
+        test_files_path. Returns False if the cache dir doesn't have it.
+        """
+        if self._cache_dir is None:
+            return False
+
+        entry = p.join(self._cache_dir, self.getKey(config))
+        if not p.isdir(entry):
+            return False
+
+        if not p.exists(config.test_files_path):
+            os.makedirs(config.test_files_path)
+
+        try:
+            for filename in os.listdir(entry):
+                shutil.copy2(p.join(entry, filename), config.test_files_path)
+            # Mark the entry as recently used
+            os.utime(entry)
+        except OSError:
+            # Entry might have been evicted by another process in the
+            # meantime
+            _logger.warning("Failed to fetch %s from %s", config.name, entry)
+            return False
+
+        self._writeKey(config)
+        return True
+
+    def store(self, config: TestDefinition):
+        """
+        Marks the data in config's test_files_path as up to date and copies
+        it to the shared cache dir (if any)
+        """
+        self._writeKey(config)
+
+        if self._cache_dir is None:
+            return
+
+        entry = p.join(self._cache_dir, self.getKey(config))
+        if p.isdir(entry):
+            os.utime(entry)
+            return
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        # Copy to a temporary dir and rename it so that other workspaces
+        # using the same cache dir never see partially written entries
+        temp_entry = tempfile.mkdtemp(dir=self._cache_dir, prefix=".tmp_")
+        for filename in os.listdir(config.test_files_path):
+            if filename not in self._NOT_CACHED:
+                shutil.copy2(p.join(config.test_files_path, filename), temp_entry)
+        try:
+            os.rename(temp_entry, entry)
+        except OSError:
+            # Someone else stored the same entry first
+            shutil.rmtree(temp_entry, ignore_errors=True)
+
+    def evict(self):
+        """
+        Removes least recently used entries until the cache dir is under
+        the configured size
+        """
+        if self._cache_dir is None or self._max_size is None:
+            return
+        if not p.isdir(self._cache_dir):
+            return
+
+        entries = []
+        total_size = 0
+        for name in os.listdir(self._cache_dir):
+            path = p.join(self._cache_dir, name)
+            if name.startswith(".") or not p.isdir(path):
+                continue
+            size = sum(
+                p.getsize(p.join(path, filename)) for filename in os.listdir(path)
+            )
+            entries += [(p.getmtime(path), size, path)]
+            total_size += size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            _logger.info("Evicting %s from reference data cache", path)
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    def _writeKey(self, config):
+        with open(config.cache_key_file, "w") as fd:
+            fd.write(self.getKey(config))
+
+
+@contextlib.contextmanager
+def _lockDirectory(path):
+    """
+    Holds an exclusive lock on path (using a lock file next to it) so that
+    run.py instances sharing the same tree don't write to it at the same time.
+    Where flock is not available, the lock is held by creating the lock file
+    exclusively, so a run.py that is killed leaves it behind and it has to be
+    removed by hand
+    """
+    lock = path + ".lock"
+    if fcntl is None:
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            os.remove(lock)
+        return
+
+    with open(lock, "w") as fd:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _planGeneration(configs):
+    """
+    Collapses configs whose data goes to the same test_files_path into a
+    single job (configs with and without pilots share the same data). Returns
+    the jobs sorted by path and the number of configs deduplicated
+    """
+    jobs = {}
+    for config in configs:
+        jobs.setdefault(config.test_files_path, config)
+    return [jobs[path] for path in sorted(jobs)], len(configs) - len(jobs)
+
+
+def _generateGnuRadioData(  # pylint: disable=too-many-arguments
+    configs,
+    use_gnuradio=True,
+    seed=0,
+    cache_dir=None,
+    max_cache_size=None,
+    pool=None,
+):
     """
-    Generates GNU Radio data for configs whose test files can't found
+    Generates GNU Radio data for configs whose test files are missing or
+    stale. Data is generated by the GNU Radio flow graph unless use_gnuradio
+    is False, in which case the NumPy model is run for each config. Jobs run
+    on pool or, if not set, on a new process pool. Returns the resources used
+    by each stage (see StageProfile)
     """
-    configs = []
+    cache = ReferenceDataCache(
+        use_gnuradio=use_gnuradio,
+        seed=seed,
+        cache_dir=cache_dir,
+        max_size=max_cache_size,
+    )
+
+    configs = list(configs)
+    jobs, deduplicated = _planGeneration(configs)
+    jobs = [config for config in jobs if not cache.isFresh(config)]
+
+    if not jobs:
+        return []
+
+    if deduplicated:
+        print(
+            f"Deduplicated {deduplicated} of {len(configs)} data generation jobs "
+            "sharing the same directory"
+        )
 
-    for config in TEST_CONFIGS:
-        if not p.exists(config.timestamp):
-            configs += [config]
+    with contextlib.ExitStack() as stack:
+        # Jobs are sorted by path, so locks are always taken in the same order
+        for config in jobs:
+            stack.enter_context(_lockDirectory(config.test_files_path))
+
+        profiles = []
+        pending = []
+
+        for config in jobs:
+            # Another run.py might have generated the data while we waited
+            # for the locks
+            if cache.isFresh(config):
+                continue
+            fetched = _profileStage(
+                "cache_fetch",
+                config.name,
+                lambda config=config: [config.test_files_path]
+                if cache.fetch(config)
+                else None,
+            )
+            if fetched:
+                profiles += fetched
+            else:
+                pending += [config]
+
+        jobs = pending
+
+        if jobs and use_gnuradio:
+            profiles += _runGnuRadio(jobs, seed=seed, pool=pool)
+        elif jobs:
+            # Generate needed data on a process pool to speed up things
+            with _getPool(pool) as pool:
+                for result in pool.map(
+                    functools.partial(_runReferenceModel, seed=seed), jobs
+                ):
+                    profiles += result
+
+        for config in jobs:
+            cache.store(config)
+
+    cache.evict()
 
-    # Generate needed data on a process pool to speed up things
-    with Pool() as pool:
-        pool.map(_runGnuRadio, configs)
+    return profiles
 
 
 LDPC_Q = {
@@ -360,351 +959,971 @@ LDPC_LENGTH = {
     (FrameType.FECFRAME_SHORT, CodeRate.C8_9): 16_200 - 14_400,
 }
 
-PHYSICAL_LAYER_HEADER_CONFIGS = {
-    TestDefinition.fromConfigTuple(frame_type, constellation, code_rate, pilots)
-    for frame_type, constellation, code_rate, pilots in (
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C8_9, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_2, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_3, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_4, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C8_9, False),
-        #  (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C9_10, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C8_9, False),
-        (
-            FrameType.FECFRAME_NORMAL,
-            ConstellationType.MOD_16APSK,
-            CodeRate.C9_10,
-            False,
-        ),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C8_9, False),
-        (
-            FrameType.FECFRAME_NORMAL,
-            ConstellationType.MOD_32APSK,
-            CodeRate.C9_10,
-            False,
-        ),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C3_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C8_9, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C9_10, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_2, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_3, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_4, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C2_3, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C2_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C3_4, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C3_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C4_5, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C5_6, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C8_9, False),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C9_10, False),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_2, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_3, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_4, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C8_9, True),
-        #  (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C9_10, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C9_10, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C9_10, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C3_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_8PSK, CodeRate.C9_10, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_2, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_3, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C1_4, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C2_3, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C2_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C3_4, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C3_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C4_5, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C5_6, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C8_9, True),
-        (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_QPSK, CodeRate.C9_10, True),
-    )
-}
-
-# Physical layer scrambler doesn't do anything with pilots
-PHYSICAL_LAYER_SCRAMBLER_CONFIGS = {
-    config for config in PHYSICAL_LAYER_HEADER_CONFIGS if not config.pilots
-}
-
-# List specific valid 16 APSK and 32 APSK configs
-CONSTELLATION_MAPPER_CONFIGS = (
-    set(_getConfigs(constellations=(ConstellationType.MOD_QPSK,)))
-    | set(_getConfigs(constellations=(ConstellationType.MOD_8PSK,)))
-    | {
-        TestDefinition.fromConfigTuple(frame_type, constellation, code_rate, False)
-        for frame_type, constellation, code_rate in (
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C2_3),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C9_10),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C9_10),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C2_3),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C9_10),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_16APSK, CodeRate.C3_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C8_9),
-            (FrameType.FECFRAME_NORMAL, ConstellationType.MOD_32APSK, CodeRate.C9_10),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6),
-            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9),
-            # this should work but GNU Radio itself doesn't handle it for some
-            # reason
-            # (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C9_10),
-        )
-    }
-)
-
-
-def _populateLdpcTable(config: TestDefinition):  # pylint: disable=too-many-locals
-    """
-    Creates the unrolled binary LDPC table file for the LDPC encoder testbench
-    a CSV file with coefficients (from DVB-S2 spec's appendices B and C).
-    """
-    bin_table_path = p.join(config.test_files_path, "ldpc_table.bin")
-    text_table_path = p.join(config.test_files_path, "ldpc_table.txt")
-
-    if p.exists(bin_table_path) and p.exists(text_table_path):
-        return
-
-    csv_table = p.join(
-        ROOT,
-        "misc",
-        "ldpc",
-        f"ldpc_table_{config.frame_type.name}_{config.code_rate.name}.csv",
-    )
-
-    print(
-        f"Generating LDPC table for FECFRAME={config.frame_type.value}, "
-        f'code rate={config.code_rate.value} using "{csv_table}" as reference. '
-        f'Binary data will be written to "{config.test_files_path}"',
-    )
-
-    with open(csv_table, "r") as fd:
-        table = [x.split(",") for x in fd.read().split("\n") if x]
-
-    table_q = LDPC_Q[(config.frame_type, config.code_rate)]
-    table_length = LDPC_LENGTH[(config.frame_type, config.code_rate)]
-    word_cnt = 0
-
-    bin_table: List[str] = []
-    text_table: List[str] = []
-
-    bin_table += ["# Offset, next, bit index"]
-
-    # Each offset is 16 bits (to represent 64,800 bits of FECFRAME_NORMAL),
-    # but we'll also embed the s_ldpc_next values into the file as well on a
-    # byte, so data width will 24: data[16] is s_ldpc_next while data[15:0] is
-    # the actual offset
-    bit_index = 0
-
-    for line in table:
-        for _ in range(360):
-            text_table += [f"{bit_index:5d} || "]
-            for i, coefficient in enumerate(tuple(int(x) for x in line)):
-                offset = (coefficient + (bit_index % 360) * table_q) % table_length
-                bin_table += [f"{offset},{int(i == len(line) - 1)},{bit_index}"]
-
-                text_table[-1] += f" {word_cnt:5d}, {offset:5d}  |"
-                word_cnt += 1
-
-            bit_index += 1
-
-    with open(bin_table_path, "wb") as bin_table_fd:
-        bin_table_fd.write(b"\n".join([bytes(x, encoding="utf8") for x in bin_table]))
-
-    with open(text_table_path, "w") as text_table_fd:
-        text_table_fd.write("\n".join(text_table))
-
-
-def _getModulationTable(
-    frame_type: FrameType, constellation: ConstellationType, code_rate: CodeRate
-):
-    """
-    Returns the modulation table for a given config. Please note we're scaling
-    the constellation radius to keep values between [-1, 1). Also, this is for
-    refence only since the RAMs now come with the correct initial values for
-    all configs
-    """
-    # pylint: disable=invalid-name
-    if constellation == ConstellationType.MOD_QPSK:
-        return (
-            # QPSK
-            (math.cos(math.pi / 4.0), math.sin(math.pi / 4.0)),
-            (math.cos(7 * math.pi / 4.0), math.sin(7 * math.pi / 4.0)),
-            (math.cos(3 * math.pi / 4.0), math.sin(3 * math.pi / 4.0)),
-            (math.cos(5 * math.pi / 4.0), math.sin(5 * math.pi / 4.0)),
-        )
-
-    if constellation == ConstellationType.MOD_8PSK:
-        return (
-            (math.cos(math.pi / 4.0), math.sin(math.pi / 4.0)),
-            (math.cos(0.0), math.sin(0.0)),
-            (math.cos(4 * math.pi / 4.0), math.sin(4 * math.pi / 4.0)),
-            (math.cos(5 * math.pi / 4.0), math.sin(5 * math.pi / 4.0)),
-            (math.cos(2 * math.pi / 4.0), math.sin(2 * math.pi / 4.0)),
-            (math.cos(7 * math.pi / 4.0), math.sin(7 * math.pi / 4.0)),
-            (math.cos(3 * math.pi / 4.0), math.sin(3 * math.pi / 4.0)),
-            (math.cos(6 * math.pi / 4.0), math.sin(6 * math.pi / 4.0)),
-        )
-
-    if constellation == ConstellationType.MOD_16APSK:
-        r1 = 1.0
-        r2 = 1.0
-        if frame_type == FrameType.FECFRAME_NORMAL:
-            r1 = {
-                CodeRate.C2_3: r2 / 3.15,
-                CodeRate.C3_4: r2 / 2.85,
-                CodeRate.C4_5: r2 / 2.75,
-                CodeRate.C5_6: r2 / 2.70,
-                CodeRate.C8_9: r2 / 2.60,
-                CodeRate.C9_10: r2 / 2.57,
-                CodeRate.C3_5: r2 / 3.70,
-            }.get(code_rate, 0.0)
-        elif frame_type == FrameType.FECFRAME_SHORT:
-            r1 = {
-                CodeRate.C2_3: r2 / 3.15,
-                CodeRate.C3_4: r2 / 2.85,
-                CodeRate.C4_5: r2 / 2.75,
-                CodeRate.C5_6: r2 / 2.70,
-                CodeRate.C8_9: r2 / 2.60,
-                CodeRate.C3_5: r2 / 3.70,
-            }.get(code_rate, 0.0)
-
-        # Needed since GNU Radio 3.8 (see https://github.com/gnuradio/gnuradio/commit/efe3e6c1)
-        r0 = math.sqrt(4.0 / ((r1 * r1) + 3.0 * (r2 * r2)))
-        r1 = r0 * r1
-        r2 = r0 * r2
-
-        scaling = max(r0, r1, r2)
-        r0 = r0 / scaling
-        r1 = r1 / scaling
-        r2 = r2 / scaling
-
-        return (
-            (r2 * math.cos(math.pi / 4), r2 * math.sin(math.pi / 4)),
-            (r2 * math.cos(-math.pi / 4), r2 * math.sin(-math.pi / 4)),
-            (r2 * math.cos(3 * math.pi / 4), r2 * math.sin(3 * math.pi / 4)),
-            (r2 * math.cos(-3 * math.pi / 4), r2 * math.sin(-3 * math.pi / 4)),
-            (r2 * math.cos(math.pi / 12), r2 * math.sin(math.pi / 12)),
-            (r2 * math.cos(-math.pi / 12), r2 * math.sin(-math.pi / 12)),
-            (r2 * math.cos(11 * math.pi / 12), r2 * math.sin(11 * math.pi / 12)),
-            (r2 * math.cos(-11 * math.pi / 12), r2 * math.sin(-11 * math.pi / 12)),
-            (r2 * math.cos(5 * math.pi / 12), r2 * math.sin(5 * math.pi / 12)),
-            (r2 * math.cos(-5 * math.pi / 12), r2 * math.sin(-5 * math.pi / 12)),
-            (r2 * math.cos(7 * math.pi / 12), r2 * math.sin(7 * math.pi / 12)),
-            (r2 * math.cos(-7 * math.pi / 12), r2 * math.sin(-7 * math.pi / 12)),
-            (r1 * math.cos(math.pi / 4), r1 * math.sin(math.pi / 4)),
-            (r1 * math.cos(-math.pi / 4), r1 * math.sin(-math.pi / 4)),
-            (r1 * math.cos(3 * math.pi / 4), r1 * math.sin(3 * math.pi / 4)),
-            (r1 * math.cos(-3 * math.pi / 4), r1 * math.sin(-3 * math.pi / 4)),
-        )
-
-    if constellation == ConstellationType.MOD_32APSK:
-        r1 = 1.0
-        r2 = 1.0
-        r3 = 1.0
-        r1 = {
-            CodeRate.C3_4: r3 / 5.27,
-            CodeRate.C4_5: r3 / 4.87,
-            CodeRate.C5_6: r3 / 4.64,
-            CodeRate.C8_9: r3 / 4.33,
-            CodeRate.C9_10: r3 / 4.30,
-        }.get(code_rate, 0.0)
 
-        r2 = {
-            CodeRate.C3_4: r1 * 2.84,
-            CodeRate.C4_5: r1 * 2.72,
+@functools.lru_cache(maxsize=None)
+def _getPhysicalLayerHeaderConfigs():
+    "Configs supported by the physical layer header"
+    return frozenset(
+        TestDefinition.fromConfigTuple(frame_type, constellation, code_rate, pilots)
+        for frame_type, constellation, code_rate, pilots in (
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_2,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            #  (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C9_10, False),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C9_10,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C9_10,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C9_10,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_2,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_3,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_4,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C4_5,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C5_6,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C8_9,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C9_10,
+                False,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C2_3,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C4_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C4_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_SHORT,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C2_3, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_4, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C3_5, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C5_6, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_8PSK, CodeRate.C8_9, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_2, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_3, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_4, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_3, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C2_5, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_4, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C3_5, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C4_5, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C5_6, True),
+            (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C8_9, True),
+            #  (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C9_10, True),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C2_3,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C4_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_16APSK,
+                CodeRate.C9_10,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C4_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_32APSK,
+                CodeRate.C9_10,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C2_3,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C3_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_8PSK,
+                CodeRate.C9_10,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_2,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_3,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C1_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_3,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C2_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_4,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C3_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C4_5,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C5_6,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C8_9,
+                True,
+            ),
+            (
+                FrameType.FECFRAME_NORMAL,
+                ConstellationType.MOD_QPSK,
+                CodeRate.C9_10,
+                True,
+            ),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _getPhysicalLayerScramblerConfigs():
+    "Physical layer scrambler doesn't do anything with pilots"
+    return frozenset(
+        config for config in _getPhysicalLayerHeaderConfigs() if not config.pilots
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _getConstellationMapperConfigs():
+    "List specific valid 16 APSK and 32 APSK configs"
+    return frozenset(
+        set(_getConfigs(constellations=(ConstellationType.MOD_QPSK,)))
+        | set(_getConfigs(constellations=(ConstellationType.MOD_8PSK,)))
+        | {
+            TestDefinition.fromConfigTuple(frame_type, constellation, code_rate, False)
+            for frame_type, constellation, code_rate in (
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C2_3,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C3_4,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C4_5,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C5_6,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C8_9,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C9_10,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C3_5,
+                ),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_5),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C3_4,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C4_5,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C5_6,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C8_9,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C9_10,
+                ),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C2_3,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C3_4,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C4_5,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C5_6,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C8_9,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C9_10,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_16APSK,
+                    CodeRate.C3_5,
+                ),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_4),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C4_5),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C5_6),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C8_9),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C3_5),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C3_4,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C4_5,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C5_6,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C8_9,
+                ),
+                (
+                    FrameType.FECFRAME_NORMAL,
+                    ConstellationType.MOD_32APSK,
+                    CodeRate.C9_10,
+                ),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C3_4),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C4_5),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C5_6),
+                (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C8_9),
+                # this should work but GNU Radio itself doesn't handle it for some
+                # reason
+                # (FrameType.FECFRAME_SHORT, ConstellationType.MOD_32APSK, CodeRate.C9_10),
+            )
+        }
+    )
+
+
+# LDPC table file format, see read_ldpc_table_header and read_ldpc_table_entry
+# in testbench/dvb_sim_utils_pkg.vhd. The header has a magic string, format
+# version, frame type, code rate and the number of entries. Each entry is the
+# offset as a little endian uint16 followed by a flags byte where bit 0 marks
+# the last coefficient of a bit (s_ldpc_next)
+LDPC_TABLE_MAGIC = b"LDPC"
+LDPC_TABLE_VERSION = 1
+LDPC_TABLE_HEADER = struct.Struct("<4sBBBBI")
+LDPC_TABLE_ENTRY = numpy.dtype([("offset", "<u2"), ("flags", "u1")])
+
+
+def _isLdpcTableValid(path: str) -> bool:
+    "Checks if path exists and has the expected LDPC table format"
+    try:
+        with open(path, "rb") as fd:
+            header = fd.read(LDPC_TABLE_HEADER.size)
+    except OSError:
+        return False
+
+    if len(header) != LDPC_TABLE_HEADER.size:
+        return False
+
+    magic, version, *_ = LDPC_TABLE_HEADER.unpack(header)
+    return magic == LDPC_TABLE_MAGIC and version == LDPC_TABLE_VERSION
+
+
+def _getLdpcTablePath(frame_type: FrameType, code_rate: CodeRate) -> str:
+    """
+    Path of the LDPC table for a given frame type and code rate. Tables don't
+    depend on the constellation or pilots, so all configs share the same
+    files (see get_ldpc_table_path in testbench/dvb_sim_utils_pkg.vhd)
+    """
+    return p.join(LDPC_TABLES_PATH, f"{frame_type.name}_{code_rate.name}.bin")
+
+
+def _populateLdpcTable(
+    frame_type: FrameType, code_rate: CodeRate, text_table: bool = False
+):
+    """
+    Creates the unrolled binary LDPC table file for the LDPC encoder testbench
+    a CSV file with coefficients (from DVB-S2 spec's appendices B and C). The
+    human readable text version is only created if text_table is set.
+    Returns the paths written or None if the table was already up to date.
+    """
+    bin_table_path = _getLdpcTablePath(frame_type, code_rate)
+    text_table_path = p.splitext(bin_table_path)[0] + ".txt"
+
+    if _isLdpcTableValid(bin_table_path) and (
+        not text_table or p.exists(text_table_path)
+    ):
+        return None
+
+    csv_table = p.join(
+        ROOT,
+        "misc",
+        "ldpc",
+        f"ldpc_table_{frame_type.name}_{code_rate.name}.csv",
+    )
+
+    print(
+        f"Generating LDPC table for FECFRAME={frame_type.value}, "
+        f'code rate={code_rate.value} using "{csv_table}" as reference. '
+        f'Binary data will be written to "{bin_table_path}"',
+    )
+
+    with open(csv_table, "r") as fd:
+        table = [
+            numpy.array(line.split(","), dtype=numpy.int64)
+            for line in fd.read().split("\n")
+            if line
+        ]
+
+    table_q = LDPC_Q[(frame_type, code_rate)]
+    table_length = LDPC_LENGTH[(frame_type, code_rate)]
+
+    # Each CSV row applies to 360 consecutive bits, offsets for the whole row
+    # are calculated at once
+    steps = numpy.arange(360, dtype=numpy.int64)[:, None] * table_q
+
+    os.makedirs(LDPC_TABLES_PATH, exist_ok=True)
+
+    # Tables are shared, write to temporary files and replace the actual ones
+    # when done so that other run.py instances never see partial files
+    suffix = f".{os.getpid()}.tmp"
+    bin_table_fd = open(bin_table_path + suffix, "wb")
+    text_table_fd = open(text_table_path + suffix, "wb") if text_table else None
+
+    bin_table_fd.write(
+        LDPC_TABLE_HEADER.pack(
+            LDPC_TABLE_MAGIC,
+            LDPC_TABLE_VERSION,
+            # Values should match frame_type_t'pos and code_rate_t'pos, which
+            # have "unknown" as their first value
+            list(FrameType).index(frame_type) + 1,
+            list(CodeRate).index(code_rate) + 1,
+            0,
+            360 * sum(len(coefficients) for coefficients in table),
+        )
+    )
+
+    bit_index = 0
+    word_cnt = 0
+
+    for coefficients in table:
+        offsets = (coefficients[None, :] + steps) % table_length
+
+        entries = numpy.zeros(offsets.shape, dtype=LDPC_TABLE_ENTRY)
+        entries["offset"] = offsets
+        entries["flags"][:, -1] = 1
+        bin_table_fd.write(entries.tobytes())
+
+        if text_table_fd is not None:
+            if bit_index:
+                text_table_fd.write(b"\n")
+            words = numpy.arange(word_cnt, word_cnt + offsets.size).reshape(
+                offsets.shape
+            )
+            text_table_fd.write(
+                b"\n".join(
+                    b"%5d || " % index
+                    + b"".join(b" %5d, %5d  |" % x for x in zip(word, offset))
+                    for index, word, offset in zip(
+                        range(bit_index, bit_index + 360), words, offsets
+                    )
+                )
+            )
+
+        bit_index += 360
+        word_cnt += offsets.size
+
+    bin_table_fd.close()
+    os.replace(bin_table_path + suffix, bin_table_path)
+    if text_table_fd is None:
+        return [bin_table_path]
+
+    text_table_fd.close()
+    os.replace(text_table_path + suffix, text_table_path)
+    return [bin_table_path, text_table_path]
+
+
+def _getModulationTable(
+    frame_type: FrameType, constellation: ConstellationType, code_rate: CodeRate
+):
+    """
+    Returns the modulation table for a given config. Please note we're scaling
+    the constellation radius to keep values between [-1, 1). Also, this is for
+    refence only since the RAMs now come with the correct initial values for
+    all configs
+    """
+    # pylint: disable=invalid-name
+    if constellation == ConstellationType.MOD_QPSK:
+        return (
+            # QPSK
+            (math.cos(math.pi / 4.0), math.sin(math.pi / 4.0)),
+            (math.cos(7 * math.pi / 4.0), math.sin(7 * math.pi / 4.0)),
+            (math.cos(3 * math.pi / 4.0), math.sin(3 * math.pi / 4.0)),
+            (math.cos(5 * math.pi / 4.0), math.sin(5 * math.pi / 4.0)),
+        )
+
+    if constellation == ConstellationType.MOD_8PSK:
+        return (
+            (math.cos(math.pi / 4.0), math.sin(math.pi / 4.0)),
+            (math.cos(0.0), math.sin(0.0)),
+            (math.cos(4 * math.pi / 4.0), math.sin(4 * math.pi / 4.0)),
+            (math.cos(5 * math.pi / 4.0), math.sin(5 * math.pi / 4.0)),
+            (math.cos(2 * math.pi / 4.0), math.sin(2 * math.pi / 4.0)),
+            (math.cos(7 * math.pi / 4.0), math.sin(7 * math.pi / 4.0)),
+            (math.cos(3 * math.pi / 4.0), math.sin(3 * math.pi / 4.0)),
+            (math.cos(6 * math.pi / 4.0), math.sin(6 * math.pi / 4.0)),
+        )
+
+    if constellation == ConstellationType.MOD_16APSK:
+        r1 = 1.0
+        r2 = 1.0
+        if frame_type == FrameType.FECFRAME_NORMAL:
+            r1 = {
+                CodeRate.C2_3: r2 / 3.15,
+                CodeRate.C3_4: r2 / 2.85,
+                CodeRate.C4_5: r2 / 2.75,
+                CodeRate.C5_6: r2 / 2.70,
+                CodeRate.C8_9: r2 / 2.60,
+                CodeRate.C9_10: r2 / 2.57,
+                CodeRate.C3_5: r2 / 3.70,
+            }.get(code_rate, 0.0)
+        elif frame_type == FrameType.FECFRAME_SHORT:
+            r1 = {
+                CodeRate.C2_3: r2 / 3.15,
+                CodeRate.C3_4: r2 / 2.85,
+                CodeRate.C4_5: r2 / 2.75,
+                CodeRate.C5_6: r2 / 2.70,
+                CodeRate.C8_9: r2 / 2.60,
+                CodeRate.C3_5: r2 / 3.70,
+            }.get(code_rate, 0.0)
+
+        # Needed since GNU Radio 3.8 (see https://github.com/gnuradio/gnuradio/commit/efe3e6c1)
+        r0 = math.sqrt(4.0 / ((r1 * r1) + 3.0 * (r2 * r2)))
+        r1 = r0 * r1
+        r2 = r0 * r2
+
+        scaling = max(r0, r1, r2)
+        r0 = r0 / scaling
+        r1 = r1 / scaling
+        r2 = r2 / scaling
+
+        return (
+            (r2 * math.cos(math.pi / 4), r2 * math.sin(math.pi / 4)),
+            (r2 * math.cos(-math.pi / 4), r2 * math.sin(-math.pi / 4)),
+            (r2 * math.cos(3 * math.pi / 4), r2 * math.sin(3 * math.pi / 4)),
+            (r2 * math.cos(-3 * math.pi / 4), r2 * math.sin(-3 * math.pi / 4)),
+            (r2 * math.cos(math.pi / 12), r2 * math.sin(math.pi / 12)),
+            (r2 * math.cos(-math.pi / 12), r2 * math.sin(-math.pi / 12)),
+            (r2 * math.cos(11 * math.pi / 12), r2 * math.sin(11 * math.pi / 12)),
+            (r2 * math.cos(-11 * math.pi / 12), r2 * math.sin(-11 * math.pi / 12)),
+            (r2 * math.cos(5 * math.pi / 12), r2 * math.sin(5 * math.pi / 12)),
+            (r2 * math.cos(-5 * math.pi / 12), r2 * math.sin(-5 * math.pi / 12)),
+            (r2 * math.cos(7 * math.pi / 12), r2 * math.sin(7 * math.pi / 12)),
+            (r2 * math.cos(-7 * math.pi / 12), r2 * math.sin(-7 * math.pi / 12)),
+            (r1 * math.cos(math.pi / 4), r1 * math.sin(math.pi / 4)),
+            (r1 * math.cos(-math.pi / 4), r1 * math.sin(-math.pi / 4)),
+            (r1 * math.cos(3 * math.pi / 4), r1 * math.sin(3 * math.pi / 4)),
+            (r1 * math.cos(-3 * math.pi / 4), r1 * math.sin(-3 * math.pi / 4)),
+        )
+
+    if constellation == ConstellationType.MOD_32APSK:
+        r1 = 1.0
+        r2 = 1.0
+        r3 = 1.0
+        r1 = {
+            CodeRate.C3_4: r3 / 5.27,
+            CodeRate.C4_5: r3 / 4.87,
+            CodeRate.C5_6: r3 / 4.64,
+            CodeRate.C8_9: r3 / 4.33,
+            CodeRate.C9_10: r3 / 4.30,
+        }.get(code_rate, 0.0)
+
+        r2 = {
+            CodeRate.C3_4: r1 * 2.84,
+            CodeRate.C4_5: r1 * 2.72,
             CodeRate.C5_6: r1 * 2.64,
             CodeRate.C8_9: r1 * 2.54,
             CodeRate.C9_10: r1 * 2.53,
@@ -757,54 +1976,727 @@ def _getModulationTable(
             (r3 * math.cos(-3 * math.pi / 4), r3 * math.sin(-3 * math.pi / 4)),
         )
 
-    # pylint: enable=invalid-name
+    # pylint: enable=invalid-name
+
+    return ()
+
+
+def _getModulationTablePath(
+    frame_type: FrameType, constellation: ConstellationType, code_rate: CodeRate
+) -> str:
+    "Path of the modulation table for a given config, shared by pilots on/off"
+    return p.join(
+        MODULATION_TABLES_PATH,
+        f"{frame_type.name}_{constellation.name}_{code_rate.name}.bin",
+    )
+
+
+def _createModulationTable(
+    frame_type: FrameType, constellation: ConstellationType, code_rate: CodeRate
+):
+    """
+    Creates the modulation table file to be used by axi_constellation_mapper_tb
+    with the cosine and sine of each constellation point, in the format
+    written by dvbs2_encoder_model.writeRealTable. Returns the paths written
+    or None if the table already exists in the current format
+    """
+    target = _getModulationTablePath(frame_type, constellation, code_rate)
+
+    if dvbs2_encoder_model.isRealTable(target):
+        return None
+
+    try:
+        table = _getModulationTable(
+            frame_type=frame_type,
+            constellation=constellation,
+            code_rate=code_rate,
+        )
+    except:
+        print(
+            f"Failed to generate modulation RAM contents for FECFRAME={frame_type.value}, "
+            f"modulation={constellation.value}, code rate={code_rate.value}."
+        )
+        raise
+
+    print(
+        f"Generating modulation RAM contents for FECFRAME={frame_type.value}, "
+        f"modulation={constellation.value}, code rate={code_rate.value}. "
+        f'Data will be written to "{target}"',
+    )
+
+    os.makedirs(MODULATION_TABLES_PATH, exist_ok=True)
+
+    dvbs2_encoder_model.writeRealTable(table, target)
+    return [target]
+
+
+def _getAuxiliaryTableJobs(configs, ldpc_text_table=False):
+    """
+    Returns the _profileStage arguments to create each LDPC and modulation
+    table file used by configs if it doesn't already exist, indexed by
+    (stage, table name)
+    """
+    # Tables don't depend on everything that makes a config, only create each
+    # one once
+    ldpc_tables = {(config.frame_type, config.code_rate) for config in configs}
+    modulation_tables = {
+        (config.frame_type, config.constellation, config.code_rate)
+        for config in configs
+        if config in _getConstellationMapperConfigs()
+    }
+
+    jobs = [
+        (
+            "ldpc_table",
+            f"{frame_type.name}_{code_rate.name}",
+            functools.partial(_populateLdpcTable, text_table=ldpc_text_table),
+            frame_type,
+            code_rate,
+        )
+        for frame_type, code_rate in sorted(ldpc_tables, key=str)
+    ] + [
+        (
+            "modulation_table",
+            f"{frame_type.name}_{constellation.name}_{code_rate.name}",
+            _createModulationTable,
+            frame_type,
+            constellation,
+            code_rate,
+        )
+        for frame_type, constellation, code_rate in sorted(modulation_tables, key=str)
+    ]
+
+    return {(stage, name): (stage, name, *rest) for stage, name, *rest in jobs}
+
+
+class ReferenceDataGenerator:
+    """
+    Generates reference data and auxiliary tables on demand. Tests get a VUnit
+    pre_config hook from getPreConfig, so data is only generated for configs
+    referenced by tests that are actually run, right before they run. Calling
+    start also generates data in the background, so that it overlaps with HDL
+    compilation and with simulations whose data is already available. Data
+    generation workers and simulations share the same CPU budget
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        use_gnuradio=True,
+        seed=0,
+        cache_dir=None,
+        max_cache_size=None,
+        ldpc_text_table=False,
+        cpu_budget=None,
+    ):
+        self._use_gnuradio = use_gnuradio
+        self._seed = seed
+        self._cache_dir = cache_dir
+        self._max_cache_size = max_cache_size
+        self._ldpc_text_table = ldpc_text_table
+        self.budget = CpuBudget(cpu_budget or os.cpu_count() or 1)
+        self._pool = BudgetPool(self.budget)
+        # pre_config hooks are called from VUnit's test runner threads.
+        # Each data directory or table is generated by the first thread that
+        # needs it, the others wait for its event
+        self._lock = threading.Lock()
+        self._done: Dict[tuple, threading.Event] = {}
+        # Test name prefix and configs passed to getPreConfig
+        self._bundles: List[tuple] = []
+        self._stopped = threading.Event()
+        self.profiles: List[StageProfile] = []
+
+    def _claim(self, jobs, function):
+        """
+        Calls function with the values of jobs whose keys haven't been
+        claimed by other threads yet and waits for the others. Returns True
+        if all jobs are done or False if another thread failed to run some
+        of them
+        """
+        with self._lock:
+            mine = [key for key in jobs if key not in self._done]
+            for key in mine:
+                self._done[key] = threading.Event()
+            others = [self._done[key] for key in jobs if key not in mine]
+
+        try:
+            if mine:
+                function([jobs[key] for key in mine])
+        except:
+            # Let the next thread that needs these retry them
+            with self._lock:
+                for key in mine:
+                    self._done.pop(key).set()
+            raise
+
+        for key in mine:
+            self._done[key].set()
+        for event in others:
+            event.wait()
+
+        with self._lock:
+            return all(key in self._done for key in jobs)
+
+    def _addProfiles(self, profiles):
+        with self._lock:
+            self.profiles += profiles
+
+    def prepare(self, configs):
+        """
+        Makes sure data for all configs is available. Returns False if another
+        thread failed to generate some of it
+        """
+        # Configs with and without pilots share the same data
+        data = {("data", config.test_files_path): config for config in configs}
+        data_ok = self._claim(
+            data,
+            lambda configs: self._addProfiles(
+                _generateGnuRadioData(
+                    configs,
+                    use_gnuradio=self._use_gnuradio,
+                    seed=self._seed,
+                    cache_dir=self._cache_dir,
+                    max_cache_size=self._max_cache_size,
+                    pool=self._pool,
+                )
+            ),
+        )
+
+        tables_ok = self._claim(
+            _getAuxiliaryTableJobs(configs, ldpc_text_table=self._ldpc_text_table),
+            lambda jobs: self._addProfiles(
+                sum(self._pool.starmap(_profileStage, jobs), [])
+            ),
+        )
+
+        return data_ok and tables_ok
+
+    def getPreConfig(self, configs, name=None):
+        """
+        Returns a VUnit pre_config hook that prepares data for configs and
+        then takes a CPU from the budget for the simulation. name is the test
+        name prefix of the VUnit config, used by start to filter tests
+        """
+        configs = tuple(configs)
+        self._bundles += [(name, configs)]
+
+        def preConfig():
+            self.budget.endSimulation()
+            if not self.prepare(configs):
+                return False
+            self.budget.startSimulation()
+            return True
+
+        return preConfig
+
+    def getPostCheck(self):
+        "Returns a VUnit post_check hook that gives back the simulation's CPU"
+
+        def postCheck():
+            self.budget.endSimulation()
+            return True
+
+        return postCheck
+
+    def start(self, patterns=("*",)):
+        """
+        Starts generating data in the background for the configs of tests
+        whose names match any of the patterns (same as VUnit's test
+        patterns), in the order they were passed to getPreConfig
+        """
+        self._pool.start()
+
+        jobs = []
+        for name, configs in self._bundles:
+            if name is not None and not any(
+                fnmatch.fnmatch(name + ".*", pattern) for pattern in patterns
+            ):
+                continue
+            # The GNU Radio flow graph is more efficient running batches
+            if self._use_gnuradio:
+                jobs += [configs]
+            else:
+                jobs += [(config,) for config in configs]
+
+        queue = collections.deque(jobs)
+
+        def worker():
+            while not self._stopped.is_set():
+                try:
+                    configs = queue.popleft()
+                except IndexError:
+                    return
+                try:
+                    self.prepare(configs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Tests that need this data will try again and report
+                    # the error
+                    _logger.warning(
+                        "Failed to generate data for %s in the background: %s",
+                        ", ".join(config.name for config in configs),
+                        exc,
+                    )
+
+        for _ in range(min(self.budget.size, len(jobs))):
+            threading.Thread(target=worker, daemon=True).start()
+
+    def stop(self):
+        """
+        Stops generating data in the background (jobs already running are
+        finished) and terminates the worker processes
+        """
+        self._stopped.set()
+        self._pool.close()
+
+    def writeTelemetry(self, path):
+        "Writes the resources used by each stage so far to path as JSON"
+        with self._lock:
+            profiles = list(self.profiles)
+
+        os.makedirs(p.dirname(p.abspath(path)), exist_ok=True)
+        with open(path, "w") as fd:
+            json.dump(
+                {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                    "generator": "gnuradio" if self._use_gnuradio else "numpy",
+                    "seed": self._seed,
+                    "stages": [profile._asdict() for profile in profiles],
+                },
+                fd,
+                indent=2,
+            )
+
+    def printTelemetrySummary(self):
+        "Prints the resources used by each stage type so far"
+        with self._lock:
+            profiles = list(self.profiles)
+
+        if not profiles:
+            return
+
+        stages = {}
+        for profile in profiles:
+            stages.setdefault(profile.stage, []).append(profile)
+
+        print("Reference data generation:")
+        print(
+            f"{'Stage':<20} {'Count':>6} {'Wall (s)':>10} {'CPU (s)':>10} "
+            f"{'Max RSS (MB)':>13} {'Written (MB)':>13}"
+        )
+        for stage, items in stages.items():
+            print(
+                f"{stage:<20} {len(items):>6} "
+                f"{sum(x.wall_time for x in items):>10.2f} "
+                f"{sum(x.cpu_time for x in items):>10.2f} "
+                f"{max(x.peak_rss for x in items) / 1024:>13.1f} "
+                f"{sum(x.bytes_written for x in items) / 1024 / 1024:>13.1f}"
+            )
+        slowest = max(profiles, key=lambda x: x.wall_time)
+        print(f"Slowest: {slowest.stage} {slowest.name} ({slowest.wall_time:.2f}s)")
+
+
+def _getFrameLength(config: TestDefinition) -> int:
+    "Number of bits in a config's FECFRAME"
+    return 64_800 if config.frame_type == FrameType.FECFRAME_NORMAL else 16_200
+
+
+def _packConfigs(configs, costs, bundles):
+    """
+    Splits configs (or any other items in costs) into at most the given number
+    of bundles of roughly the same total cost. Configs are assigned longest
+    first, each one to the bundle with the lowest cost so far, ties are broken
+    so that the result only depends on the arguments. Returns a list of
+    (cost, configs), one for each bundle
+    """
+    heap = [(0.0, index, []) for index in range(min(bundles, len(configs)))]
+
+    for config in sorted(configs, key=lambda x: (-costs[x], str(x))):
+        cost, index, bundle = heapq.heappop(heap)
+        bundle += [config]
+        heapq.heappush(heap, (cost + costs[config], index, bundle))
+
+    return [(cost, bundle) for cost, _, bundle in sorted(heap, key=lambda x: x[1])]
+
+
+class SimulationHistory:
+    """
+    Keeps track of how long each config takes to simulate on each testbench
+    so that tests can be scheduled using actual costs. When a VUnit config
+    simulates multiple configs, its time is split between them proportionally
+    to their estimated cost. Configs without history are estimated from the
+    frame length
+    """
+
+    # Weight of the latest run when updating a config's duration
+    _ALPHA = 0.5
+
+    def __init__(self, path):
+        self._path = path
+        self._durations: Dict[str, Dict[str, float]] = {}
+        # VUnit config name prefix => (testbench, configs)
+        self._bundles: Dict[str, tuple] = {}
+
+        try:
+            with open(path, "r") as fd:
+                self._durations = json.load(fd)["testbenches"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def getCosts(self, testbench, configs):
+        "Returns the estimated simulation time of each config"
+        known = self._durations.get(testbench, {})
+
+        # Estimate unknown configs using the average time per bit of the
+        # known ones
+        rates = [
+            known[config.name] / _getFrameLength(config)
+            for config in configs
+            if config.name in known
+        ]
+        rate = sum(rates) / len(rates) if rates else 1.0
+
+        return {
+            config: known.get(config.name, rate * _getFrameLength(config))
+            for config in configs
+        }
+
+    def addBundle(self, prefix, testbench, configs):
+        "Registers the configs simulated by tests named prefix.*"
+        self._bundles[prefix + "."] = (testbench, tuple(configs))
+
+    def update(self, report):
+        """
+        Updates the durations of configs from a VUnit report (see
+        vunit.ui.results.Report). Only passed tests are taken into account
+        """
+        times: Dict[str, float] = {}
+        for name, result in report.tests.items():
+            if result.status.name != "passed":
+                continue
+            for prefix in self._bundles:
+                if name.startswith(prefix):
+                    times[prefix] = times.get(prefix, 0.0) + result.time
+
+        for prefix, time_spent in times.items():
+            testbench, configs = self._bundles[prefix]
+            costs = self.getCosts(testbench, configs)
+            total = sum(costs.values())
+            durations = self._durations.setdefault(testbench, {})
+            for config in configs:
+                value = time_spent * costs[config] / total
+                if config.name in durations:
+                    value = (
+                        self._ALPHA * value + (1 - self._ALPHA) * durations[config.name]
+                    )
+                durations[config.name] = value
+
+    def save(self):
+        "Writes the history file"
+        os.makedirs(p.dirname(p.abspath(self._path)), exist_ok=True)
+        temp = f"{self._path}.{os.getpid()}.tmp"
+        with open(temp, "w") as fd:
+            json.dump({"testbenches": self._durations}, fd, indent=2, sort_keys=True)
+        os.replace(temp, self._path)
+
+
+# Testbenches that write the result of each config they simulate (see
+# track_config_results in testbench/dvb_sim_utils_pkg.vhd)
+CONFIG_RESULTS_TESTBENCHES = frozenset(
+    (
+        "axi_baseband_scrambler_tb",
+        "axi_bch_encoder_tb",
+        "axi_bit_interleaver_tb",
+        "axi_constellation_mapper_tb",
+        "axi_ldpc_encoder_core_tb",
+        "axi_ldpc_table_tb",
+        "axi_physical_layer_framer_tb",
+        "axi_physical_layer_header_tb",
+        "axi_physical_layer_scrambler_tb",
+        "dvbs2_encoder_tb",
+    )
+)
+
+
+class ConfigResults:
+    """
+    Expands the results of VUnit configs that simulate multiple configs into
+    one result per config, using the config_results.csv file written by the
+    testbench to the test's output path. Configs without a result in failed
+    tests are reported as failed (the first one, which was running when the
+    simulation stopped) or skipped (the others)
+    """
+
+    def __init__(self):
+        # VUnit config name prefix => configs in the order they're simulated
+        # and the number of frames simulated for each of them
+        self._bundles: Dict[str, tuple] = {}
+
+    def addBundle(self, prefix, testbench, configs, frames=1):
+        "Registers the configs simulated by tests named prefix.*"
+        if testbench in CONFIG_RESULTS_TESTBENCHES:
+            self._bundles[prefix + "."] = (tuple(configs), frames)
+
+    def expand(self, report):
+        """
+        Returns a list of dicts with the test name, config name, status,
+        simulation time (ns), number of errors and number of frames of each
+        config
+        """
+        expanded = []
+        for name, result in report.tests.items():
+            prefix = next((x for x in self._bundles if name.startswith(x)), None)
+            if prefix is None:
+                continue
+
+            try:
+                with open(p.join(result.path, "config_results.csv"), "r") as fd:
+                    lines = [line.split(",") for line in fd.read().split("\n") if line]
+            except OSError:
+                continue
+
+            written = {
+                int(index): (status, int(sim_time), int(errors))
+                for index, status, sim_time, errors in lines
+            }
+
+            # A failed test without any failed config stopped while simulating
+            # the first config without a result
+            if result.status.name == "failed" and all(
+                status == "pass" for status, _, _ in written.values()
+            ):
+                missing = "failed"
+            else:
+                missing = "skipped"
+            configs, frames = self._bundles[prefix]
+            for index, config in enumerate(configs):
+                if index in written:
+                    status, sim_time, errors = written[index]
+                    status = "passed" if status == "pass" else "failed"
+                else:
+                    status, sim_time, errors = missing, None, None
+                    missing = "skipped"
+                expanded += [
+                    dict(
+                        test=name,
+                        config=config.name,
+                        status=status,
+                        sim_time=sim_time,
+                        errors=errors,
+                        frames=frames,
+                    )
+                ]
+
+        return expanded
 
-    return ()
+    def writeReport(self, report, path):
+        """
+        Writes the results of each config to path as JSON and prints the
+        configs that failed
+        """
+        expanded = self.expand(report)
+        if not expanded:
+            return
+
+        os.makedirs(p.dirname(p.abspath(path)), exist_ok=True)
+        with open(path, "w") as fd:
+            json.dump(expanded, fd, indent=2)
+
+        failed = [x for x in expanded if x["status"] == "failed"]
+        if failed:
+            print("Failed configs:")
+            for item in failed:
+                print(f"  {item['test']}: {item['config']}")
+        print(f"Results of each config written to {path}")
+
+
+# Testbenches whose complex data comparators can write raw dumps to be checked
+# after the simulation instead (see misc/check_raw_dump.py)
+RAW_DUMP_TESTBENCHES = frozenset(
+    {
+        "axi_constellation_mapper_tb",
+        "axi_physical_layer_framer_tb",
+        "dvbs2_encoder_tb",
+    }
+)
 
 
-def _createModulationTable(config: TestDefinition):
+def _getRawDumpPostCheck(post_check=None):
     """
-    Creates the modulation table file to be used by axi_constellation_mapper_tb
+    Returns a VUnit post_check hook that checks the raw dumps written to the
+    test's output path, after calling post_check if set
     """
-    target = p.join(config.test_files_path, "modulation_table.bin")
 
-    if p.exists(target):
-        return
+    def postCheck(output_path):
+        if post_check is not None and not post_check():
+            return False
+        return check_raw_dump.checkDirectory(output_path)
+
+    return postCheck
+
+
+# Every testbench uses a 5 ns clock
+CLK_PERIOD_NS = 5
+
+# Configs simulated by each testbench in benchmark mode, picked with a fixed
+# seed so that results of different runs can be compared
+BENCHMARK_CONFIGS_PER_TESTBENCH = 4
+BENCHMARK_SEED = 0
+
+# Compile and elaboration flags of each GHDL profile, whether IEEE library
+# warnings are disabled and whether testbenches log debug messages
+GHDL_PROFILES = {
+    "default": dict(
+        a_flags=["-frelaxed-rules", "-O2", "-g"],
+        elab_flags=["-frelaxed-rules"],
+        disable_ieee_warnings=True,
+        verbose=True,
+    ),
+    "debug": dict(
+        a_flags=["-frelaxed-rules", "-O0", "-g"],
+        elab_flags=["-frelaxed-rules"],
+        disable_ieee_warnings=False,
+        verbose=True,
+    ),
+    "fast": dict(
+        a_flags=["-frelaxed-rules", "-O3"],
+        elab_flags=["-frelaxed-rules"],
+        disable_ieee_warnings=True,
+        verbose=False,
+    ),
+}
+
 
+def _getBenchmarkSuites(suites):
+    """
+    Returns the suites with a fixed set of configs of each testbench that
+    reports per config results, all simulated in a single VUnit config
+    """
+    rand = random.Random(BENCHMARK_SEED)
+    benchmark = []
+    for testbench, configs, _ in suites:
+        if testbench not in CONFIG_RESULTS_TESTBENCHES:
+            continue
+        configs = sorted(configs, key=lambda x: x.name)
+        count = min(BENCHMARK_CONFIGS_PER_TESTBENCH, len(configs))
+        benchmark += [(testbench, rand.sample(configs, count), False)]
+    return benchmark
+
+
+def _getGitRevision():
+    "Returns the current git revision or None if it can't be found"
     try:
-        table = _getModulationTable(
-            frame_type=config.frame_type,
-            constellation=config.constellation,
-            code_rate=config.code_rate,
-        )
-    except:
-        print(
-            f"Failed to generate modulation RAM contents for FECFRAME={config.frame_type.value}, "
-            f"modulation={config.constellation.value}, code rate={config.code_rate.value}."
+        return (
+            subp.check_output(
+                ["git", "-C", ROOT, "rev-parse", "HEAD"], stderr=subp.PIPE
+            )
+            .decode()
+            .strip()
         )
-        raise
-
-    print(
-        f"Generating modulation RAM contents for FECFRAME={config.frame_type.value}, "
-        f"modulation={config.constellation.value}, code rate={config.code_rate.value}. "
-        f'Data will be written to "{target}"',
-    )
-
-    with open(target, "wb") as fd:
-        for cos, sin in table:
-            fd.write(bytes(str(cos), encoding="utf8"))
-            fd.write(b"\n")
-            fd.write(bytes(str(sin), encoding="utf8"))
-            fd.write(b"\n")
+    except (OSError, subp.CalledProcessError):
+        return None
 
 
-def _createAuxiliaryTables():
+class Benchmark:
     """
-    Creates the binary LDPC table files if they don't already exist
+    Computes the simulation throughput of each testbench from the per config
+    results and appends it to a JSON file that keeps the results of previous
+    runs, so that trends and GHDL profiles can be compared. The file has the
+    format {"runs": [{"timestamp": ..., "revision": ..., "profile": ...,
+    "testbenches": {testbench: {...}}}]}
     """
-    with Pool() as pool:
-        pool.map(_populateLdpcTable, TEST_CONFIGS)
-        pool.map(_createModulationTable, CONSTELLATION_MAPPER_CONFIGS)
+
+    def __init__(self, path, profile, seed):
+        self.path = path
+        self.profile = profile
+        self.seed = seed
+
+    def measure(self, report, expanded):
+        """
+        Returns the number of configs, frames and clock cycles simulated by
+        each testbench, the wall time it took and the resulting cycles and
+        frames per second. Tests that did not pass are not included
+        """
+        testbenches: Dict[str, dict] = {}
+        tests = set()
+        for item in expanded:
+            result = report.tests[item["test"]]
+            if result.status.name != "passed":
+                _logger.warning("%s did not pass, ignoring it", item["test"])
+                continue
+            testbench = item["test"].split(".")[1]
+            entry = testbenches.setdefault(
+                testbench,
+                dict(configs=0, frames=0, sim_cycles=0, wall_time=0.0),
+            )
+            entry["configs"] += 1
+            entry["frames"] += item["frames"]
+            entry["sim_cycles"] += item["sim_time"] // CLK_PERIOD_NS
+            if item["test"] not in tests:
+                tests.add(item["test"])
+                entry["wall_time"] += result.time
+
+        for entry in testbenches.values():
+            wall_time = entry["wall_time"] or float("nan")
+            entry["cycles_per_second"] = entry["sim_cycles"] / wall_time
+            entry["frames_per_second"] = entry["frames"] / wall_time
+
+        return testbenches
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            return {"runs": []}
+
+    def write(self, report, expanded):
+        """
+        Appends the results of this run to the benchmark file and prints them
+        next to the last run of every other profile
+        """
+        testbenches = self.measure(report, expanded)
+        if not testbenches:
+            return
+
+        data = self._load()
+        previous = {run["profile"]: run for run in data["runs"]}
+        previous.pop(self.profile, None)
+
+        data["runs"] += [
+            dict(
+                timestamp=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                revision=_getGitRevision(),
+                profile=self.profile,
+                seed=self.seed,
+                testbenches=testbenches,
+            )
+        ]
+
+        os.makedirs(p.dirname(p.abspath(self.path)), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=p.dirname(p.abspath(self.path)), delete=False
+        ) as fd:
+            json.dump(data, fd, indent=2)
+        os.replace(fd.name, self.path)
+
+        profiles = [self.profile] + sorted(previous)
+        print(
+            f"{'Testbench':<36} {'Profile':<10} {'Frames':>7} "
+            f"{'Cycles/s':>12} {'Frames/s':>10}"
+        )
+        for testbench in sorted(testbenches):
+            for profile in profiles:
+                if profile == self.profile:
+                    entry = testbenches[testbench]
+                else:
+                    entry = previous[profile]["testbenches"].get(testbench)
+                if entry is None:
+                    continue
+                print(
+                    f"{testbench:<36} {profile:<10} {entry['frames']:>7} "
+                    f"{entry['cycles_per_second']:>12.0f} "
+                    f"{entry['frames_per_second']:>10.2f}"
+                )
+        print(f"Benchmark results written to {self.path}")
 
 
 class GhdlPragmaHandler:
@@ -813,31 +2705,40 @@ class GhdlPragmaHandler:
     -- ghdl translate_off
     this is ignored
     -- ghdl translate_on
+    Generic "synthesis" and "pragma" forms are left alone, third party code
+    uses them to hide simulation only code from synthesis tools
     """
 
-    _PRAGMA = re.compile(
-        r"\s*--\s*ghdl\s+translate_off[\r\n].*?[\n\r]\s*--\s*ghdl\s+translate_on",
-        flags=re.DOTALL | re.I | re.MULTILINE,
-    )
+    _PRAGMA = re.compile(r"^\s*--\s*ghdl\s+translate_(off|on)\b", flags=re.I)
 
-    def run(self, code, file_name):  # pylint: disable=unused-argument,no-self-use
+    def run(self, code, file_name):  # pylint: disable=unused-argument
         """
-        Removes text between "-- ghdl translate_off" and "-- ghdl translate_on"
+        Comments out lines between "-- ghdl translate_off" and
+        "-- ghdl translate_on"
         """
-        # Lazy check to avoid running the regex unnecessarily
-        for word in ("ghdl", "translate_on", "translate_off"):
-            if word not in code:
-                return code
+        # Lazy check to avoid going through files without any pragma
+        if "translate_off" not in code.lower():
+            return code
 
-        lines = code.split("\n")
+        return self._process(code)
 
-        # Prepend the comment characters to lines within matches so line
-        # numbers are kept
-        for match in self._PRAGMA.finditer(code):
-            for lnum in range(
-                code[: match.start()].count("\n") + 1, code[: match.end()].count("\n")
-            ):
-                lines[lnum] = "-- " + lines[lnum]
+    def _process(self, code):
+        # Prepend the comment characters to lines within pragmas so line
+        # numbers are kept. Unterminated blocks are left untouched
+        lines = code.split("\n")
+        start = None
+
+        for lnum, line in enumerate(lines):
+            match = self._PRAGMA.match(line)
+            if match is None:
+                continue
+            if match.group(1).lower() == "off":
+                if start is None:
+                    start = lnum
+            elif start is not None:
+                for index in range(start + 1, lnum):
+                    lines[index] = "-- " + lines[index]
+                start = None
 
         return "\n".join(lines)
 
@@ -870,105 +2771,160 @@ def setupSources(vunit):
     )
 
 
-def setupTests(vunit, args):
+def _getConfigTuples(config, strength):
+    "Returns the combinations of strength parameter values of a config"
+    values = (
+        ("frame_type", config.frame_type),
+        ("constellation", config.constellation),
+        ("code_rate", config.code_rate),
+        ("pilots", config.pilots),
+    )
+    return set(itertools.combinations(values, strength))
+
+
+def _getCoveringConfigs(  # pylint: disable=too-many-arguments
+    configs, costs, strength=2, time_budget=None, seed=0
+):
+    """
+    Selects a subset of configs where every combination of strength parameter
+    values (frame type, constellation, code rate and pilots) present in
+    configs appears at least once, picking each time the config that covers
+    the most combinations not covered yet. If time_budget is set, configs are
+    then added while the total cost stays within it, preferring configs that
+    cover the most combinations of strength + 1 parameters per second, using
+    costs. Covering configs are picked using their frame length as cost, so
+    they only depend on seed.
+    """
+    candidates = sorted(configs, key=lambda x: x.name)
+    random.Random(seed).shuffle(candidates)
+
+    def pick(candidates, uncovered, strength):
+        # Highest number of new combinations, shortest frame on ties. max
+        # returns the first of equal values, so the shuffled order breaks the
+        # remaining ties
+        return max(
+            candidates,
+            key=lambda x: (
+                len(_getConfigTuples(x, strength) & uncovered),
+                -_getFrameLength(x),
+            ),
+        )
+
+    selected = []
+    uncovered = set().union(*(_getConfigTuples(x, strength) for x in candidates))
+    while uncovered:
+        config = pick(candidates, uncovered, strength)
+        selected += [config]
+        candidates.remove(config)
+        uncovered -= _getConfigTuples(config, strength)
+
+    if time_budget is None:
+        return selected
+
+    budget = time_budget - sum(costs[x] for x in selected)
+    strength = min(strength + 1, 4)
+    uncovered = set().union(*(_getConfigTuples(x, strength) for x in candidates))
+    for config in selected:
+        uncovered -= _getConfigTuples(config, strength)
+
+    while True:
+        candidates = [x for x in candidates if costs[x] <= budget]
+        if not candidates:
+            break
+        config = max(
+            candidates,
+            key=lambda x: len(_getConfigTuples(x, strength) & uncovered) / costs[x],
+        )
+        selected += [config]
+        candidates.remove(config)
+        budget -= costs[config]
+        uncovered -= _getConfigTuples(config, strength)
+
+    return selected
+
+
+def _getTestSuites(args, history=None):
     """
-    Creates tests for components
+    Returns the configs tested by each testbench as a list of (testbench,
+    configs, individual_config_runs)
     """
-    for testbench, tests in (
+    suites = [
         (
             "axi_bch_encoder_tb",
             _getConfigs(constellations=(ConstellationType.MOD_8PSK,), pilots=False),
+            args.individual_config_runs,
+        ),
+        (
+            "axi_constellation_mapper_tb",
+            _getConstellationMapperConfigs(),
+            args.individual_config_runs,
         ),
-        ("axi_constellation_mapper_tb", CONSTELLATION_MAPPER_CONFIGS),
         (
             "axi_ldpc_encoder_core_tb",
             _getConfigs(constellations=(ConstellationType.MOD_8PSK,), pilots=False),
+            args.individual_config_runs,
         ),
         (
             "axi_ldpc_table_tb",
             _getConfigs(constellations=(ConstellationType.MOD_8PSK,), pilots=False),
+            args.individual_config_runs,
         ),
-    ):
-        addConfigsTest(
-            entity=vunit.library("lib").entity(testbench),
-            configs=tests,
-            individual_config_runs=args.individual_config_runs,
-            seed=args.seed,
-        )
+    ]
 
-    # Run the DVB S2 Tx testbench with a smaller sample of configs to check
+    # Run the DVB S2 Tx testbench with a smaller set of configs to check
     # integration, otherwise sim takes way too long. Note that when
-    # --individual-config-runs is passed, all configs are added
-    configs = list(PHYSICAL_LAYER_HEADER_CONFIGS & CONSTELLATION_MAPPER_CONFIGS)
-    random.shuffle(configs)
+    # --individual-config-runs is passed, all configs are added. Covering
+    # configs only depend on the seed, but configs added to fill
+    # --dvbs2-time-budget depend on history, so shards must all get the same
+    # history or none at all (see setupTests)
+    configs = _getPhysicalLayerHeaderConfigs() & _getConstellationMapperConfigs()
     if args.individual_config_runs:
-        addConfigsTest(
-            entity=vunit.library("lib").entity("dvbs2_encoder_tb"),
-            configs=configs,
-            individual_config_runs=True,
-            seed=args.seed,
-        )
+        suites += [("dvbs2_encoder_tb", list(configs), True)]
     else:
-        addConfigsTest(
-            entity=vunit.library("lib").entity("dvbs2_encoder_tb"),
-            configs=configs[:8],
-            individual_config_runs=False,
-            seed=args.seed,
+        costs = (
+            {config: _getFrameLength(config) for config in configs}
+            if history is None
+            else history.getCosts("dvbs2_encoder_tb", configs)
         )
-
-    addConfigsTest(
-        vunit.library("lib").entity("axi_baseband_scrambler_tb"),
-        configs=TEST_CONFIGS,
-        individual_config_runs=False,
-        seed=args.seed,
-    )
-    addConfigsTest(
-        vunit.library("lib").entity("axi_physical_layer_header_tb"),
-        configs=PHYSICAL_LAYER_HEADER_CONFIGS,
-        individual_config_runs=args.individual_config_runs,
-        seed=args.seed,
-    )
-    addConfigsTest(
-        vunit.library("lib").entity("axi_physical_layer_scrambler_tb"),
-        configs=PHYSICAL_LAYER_SCRAMBLER_CONFIGS,
-        individual_config_runs=args.individual_config_runs,
-        seed=args.seed,
-    )
-
-    # Generate bit interleaver tests
-    for data_width in (8,):
-        all_configs = []
-        for config in _getConfigs(
-            constellations=(
-                ConstellationType.MOD_8PSK,
-                ConstellationType.MOD_16APSK,
-                ConstellationType.MOD_32APSK,
-            ),
-            pilots=False,
-        ):
-            all_configs += [config.getTestConfigString()]
-
-            if args.individual_config_runs:
-                vunit.library("lib").entity("axi_bit_interleaver_tb").add_config(
-                    name=f"data_width={data_width},{config.name}",
-                    generics=dict(
-                        TDATA_WIDTH=data_width,
-                        test_cfg=config.getTestConfigString(),
-                        NUMBER_OF_TEST_FRAMES=8,
-                        SEED=args.seed,
-                    ),
-                )
-
-        if not args.individual_config_runs:
-            vunit.library("lib").entity("axi_bit_interleaver_tb").add_config(
-                name=f"data_width={data_width},all_parameters",
-                generics=dict(
-                    TDATA_WIDTH=data_width,
-                    test_cfg="|".join(all_configs),
-                    NUMBER_OF_TEST_FRAMES=2,
-                    SEED=args.seed,
+        suites += [
+            (
+                "dvbs2_encoder_tb",
+                _getCoveringConfigs(
+                    configs,
+                    costs,
+                    strength=args.dvbs2_coverage_strength,
+                    time_budget=args.dvbs2_time_budget,
+                    seed=args.seed,
                 ),
+                False,
             )
+        ]
+
+    suites += [
+        ("axi_baseband_scrambler_tb", _getTestConfigs(), False),
+        (
+            "axi_physical_layer_header_tb",
+            _getPhysicalLayerHeaderConfigs(),
+            args.individual_config_runs,
+        ),
+        (
+            "axi_physical_layer_scrambler_tb",
+            _getPhysicalLayerScramblerConfigs(),
+            args.individual_config_runs,
+        ),
+        (
+            "axi_bit_interleaver_tb",
+            _getConfigs(
+                constellations=(
+                    ConstellationType.MOD_8PSK,
+                    ConstellationType.MOD_16APSK,
+                    ConstellationType.MOD_32APSK,
+                ),
+                pilots=False,
+            ),
+            args.individual_config_runs,
+        ),
+    ]
 
     # Physical layer framer only connects axi_physical_layer_header and
     # axi_physical_layer_scrambler and both are tested individually, so we
@@ -1004,61 +2960,347 @@ def setupTests(vunit, args):
         )
     )
 
-    addConfigsTest(
-        vunit.library("lib").entity("axi_physical_layer_framer_tb"),
-        configs=physical_layer_framer_configs,
-        individual_config_runs=args.individual_config_runs,
-        seed=args.seed,
+    suites += [
+        (
+            "axi_physical_layer_framer_tb",
+            physical_layer_framer_configs,
+            args.individual_config_runs,
+        )
+    ]
+
+    return [
+        (testbench, list(configs), individual_config_runs)
+        for testbench, configs, individual_config_runs in suites
+    ]
+
+
+def _shardTestSuites(suites, index, count, history=None):
+    """
+    Splits the configs of all testbenches into count shards of similar
+    simulation time and returns suites with only the configs of shard index
+    (starting at 1). Costs come from history when set, otherwise from the
+    frame length of each config. All shards must use the same history to get
+    the same split
+    """
+    costs = {}
+    for testbench, configs, _ in suites:
+        if history is None:
+            costs.update(
+                {(testbench, config): _getFrameLength(config) for config in configs}
+            )
+        else:
+            costs.update(
+                {
+                    (testbench, config): cost
+                    for config, cost in history.getCosts(testbench, configs).items()
+                }
+            )
+
+    shards = _packConfigs(list(costs), costs, count)
+    # There might be fewer configs than shards
+    selected = set(shards[index - 1][1]) if index <= len(shards) else set()
+
+    return [
+        (
+            testbench,
+            [config for config in configs if (testbench, config) in selected],
+            individual_config_runs,
+        )
+        for testbench, configs, individual_config_runs in suites
+    ]
+
+
+def _parseShard(value):
+    "Parses --shard values in the i/N format"
+    try:
+        index, count = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'"{value}" is not in the i/N format'
+        ) from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f'"{value}" should have 1 <= i <= N')
+    return index, count
+
+
+# Changes to any of these affect the reference data of all testbenches
+DATA_GENERATION_SOURCES = (
+    p.join(ROOT, "run.py"),
+    p.join(ROOT, "gnuradio_data"),
+    p.join(ROOT, "misc", "ldpc"),
+)
+
+
+def _isUnder(path, directory):
+    "Checks if path is directory or is inside it"
+    return path == directory or path.startswith(directory + os.sep)
+
+
+def _getChangedFiles(rev):
+    """
+    Returns the absolute paths of files changed since git revision rev,
+    including uncommitted and untracked files. Submodules show up as a single
+    path
+    """
+    commands = (
+        ["git", "-C", ROOT, "diff", "--name-only", rev, "--"],
+        ["git", "-C", ROOT, "ls-files", "--others", "--exclude-standard"],
     )
+    changed = set()
+    for command in commands:
+        try:
+            output = subp.check_output(command, stderr=subp.PIPE)
+        except subp.CalledProcessError as exc:
+            _logger.error(
+                'Failed to get changed files. Command used: "%s"\nResult:\n%s',
+                " ".join(command),
+                exc.stderr.decode(),
+            )
+            raise
+        changed |= {p.join(ROOT, path) for path in output.decode().split("\n") if path}
+    return changed
 
 
-def addConfigsTest(entity, configs, individual_config_runs, seed=0):
+def _getAffectedTestbenches(vunit, testbenches, changed):
     """
-    Adds a test config with all combinations of configurations (assuming both
-    input and reference files ca be found)
+    Returns the testbenches whose sources, or the sources they depend on
+    according to VUnit's dependency scanner, are in changed
     """
-    if individual_config_runs:
-        for config in configs:
+    if any(
+        _isUnder(path, source) for path in changed for source in DATA_GENERATION_SOURCES
+    ):
+        return set(testbenches)
+
+    # Entity names don't always match file names
+    entities = {}
+    for path in glob.glob(p.join(ROOT, "testbench", "*.vhd")):
+        with open(path, "r") as fd:
+            for name in re.findall(r"^\s*entity\s+(\w+)\s+is", fd.read(), re.I | re.M):
+                entities[name.lower()] = path
+
+    affected = set()
+    for testbench in testbenches:
+        sources = vunit.get_implementation_subset(
+            [vunit.get_source_file(entities[testbench.lower()])]
+        )
+        if any(
+            _isUnder(p.abspath(source.name), path)
+            for source in sources
+            for path in changed
+        ):
+            affected.add(testbench)
+
+    return affected
+
+
+def setupTests(vunit, args, generator, history=None, results=None):
+    """
+    Creates tests for components. If history is set, configs are split into
+    one VUnit config per worker according to their simulation history. If
+    args.shard is set, only configs of that shard are added and history is
+    only used to select and split configs if args.history was passed
+    explicitly. If
+    args.changed_since is set, only testbenches affected by changes since that
+    git revision are added. If args.benchmark is set, only a fixed set of
+    configs of each testbench is added. The configs simulated by each test
+    are registered in results, if set
+    """
+    # The default history is local to each machine, so shards could select
+    # and split configs differently and skip or repeat some of them. Only use
+    # history costs when all shards are given the same --history
+    cost_history = history
+    if args.shard is not None and args.history is None:
+        cost_history = None
+
+    suites = _getTestSuites(args, cost_history)
+    if args.changed_since is not None:
+        affected = _getAffectedTestbenches(
+            vunit,
+            [testbench for testbench, _, _ in suites],
+            _getChangedFiles(args.changed_since),
+        )
+        print(
+            f"Testbenches affected by changes since {args.changed_since}: "
+            + (", ".join(sorted(affected)) or "none")
+        )
+        suites = [suite for suite in suites if suite[0] in affected]
+    if args.benchmark:
+        suites = _getBenchmarkSuites(suites)
+    if args.shard is not None:
+        suites = _shardTestSuites(suites, *args.shard, history=cost_history)
+
+    for testbench, configs, individual_config_runs in suites:
+        if not configs:
+            continue
+
+        if testbench == "axi_bit_interleaver_tb":
+            addBitInterleaverTests(
+                vunit.library("lib").entity(testbench),
+                configs,
+                individual_config_runs,
+                seed=args.seed,
+                generator=generator,
+                history=history,
+                results=results,
+                fail_fast=args.fail_fast,
+            )
+            continue
+
+        addConfigsTest(
+            entity=vunit.library("lib").entity(testbench),
+            configs=configs,
+            individual_config_runs=individual_config_runs,
+            seed=args.seed,
+            generator=generator,
+            history=history,
+            bundles=1 if args.benchmark else args.num_threads,
+            results=results,
+            fail_fast=args.fail_fast,
+            raw_dump=args.raw_dump,
+        )
+
+
+def addBitInterleaverTests(  # pylint: disable=too-many-arguments
+    entity,
+    configs,
+    individual_config_runs,
+    seed=0,
+    generator=None,
+    history=None,
+    results=None,
+    fail_fast=False,
+):
+    "Adds bit interleaver tests, which also iterate over the data width"
+
+    def addBundle(name, configs, frames):
+        prefix = f"{entity.library.name}.{entity.name}.{name}"
+        if history is not None:
+            history.addBundle(prefix, entity.name, configs)
+        if results is not None:
+            results.addBundle(prefix, entity.name, configs, frames)
+        return dict(
+            pre_config=generator.getPreConfig(configs, prefix),
+            post_check=generator.getPostCheck(),
+        )
+
+    for data_width in (8,):
+        if individual_config_runs:
+            for config in configs:
+                hooks = addBundle(
+                    f"data_width={data_width},{config.name}", (config,), 8
+                )
+                entity.add_config(
+                    name=f"data_width={data_width},{config.name}",
+                    generics=dict(
+                        TDATA_WIDTH=data_width,
+                        test_cfg=config.getTestConfigString(),
+                        NUMBER_OF_TEST_FRAMES=8,
+                        SEED=seed,
+                        FAIL_FAST=fail_fast,
+                    ),
+                    **hooks,
+                )
+        else:
+            hooks = addBundle(f"data_width={data_width},all_parameters", configs, 2)
             entity.add_config(
-                name=config.name,
+                name=f"data_width={data_width},all_parameters",
                 generics=dict(
-                    test_cfg=config.getTestConfigString(),
-                    NUMBER_OF_TEST_FRAMES=1,
+                    TDATA_WIDTH=data_width,
+                    test_cfg="|".join(x.getTestConfigString() for x in configs),
+                    NUMBER_OF_TEST_FRAMES=2,
                     SEED=seed,
+                    FAIL_FAST=fail_fast,
                 ),
+                **hooks,
             )
-        return
 
-        # vunit.library("lib").entity("axi_physical_layer_scrambler_tb").add_config(
-        #     name=config.name,
-        #     generics=dict(
-        #         test_cfg=config.getTestConfigString(),
-        #         seed=args.seed,
-        #         NUMBER_OF_TEST_FRAMES=3,
-        #     ),
-        # )
 
-    params = []
+def addConfigsTest(  # pylint: disable=too-many-arguments
+    entity,
+    configs,
+    individual_config_runs,
+    seed=0,
+    generator=None,
+    history=None,
+    bundles=1,
+    results=None,
+    fail_fast=False,
+    raw_dump=False,
+):
+    """
+    Adds a test config with all combinations of configurations (assuming both
+    input and reference files ca be found). If generator is set, reference data
+    for the configs is generated before the test runs. If history is set,
+    configs are split into up to the given number of bundles of similar
+    simulation time, added longest first. If results is set, the result of
+    each config is registered there and if fail_fast is set, simulations
+    stop at the first config that fails. If raw_dump is set, testbenches that
+    support it write raw dumps of their output that are checked after the
+    simulation.
+    """
+    configs = list(configs)
+
+    assert configs, "Could not find any config files!"
+
+    def addConfig(name, configs):
+        generics = dict(
+            test_cfg="|".join(x.getTestConfigString() for x in configs),
+            NUMBER_OF_TEST_FRAMES=1,
+            SEED=seed,
+        )
+        if fail_fast and entity.name in CONFIG_RESULTS_TESTBENCHES:
+            generics["FAIL_FAST"] = True
+
+        post_check = None if generator is None else generator.getPostCheck()
+        if raw_dump and entity.name in RAW_DUMP_TESTBENCHES:
+            generics["RAW_DUMP"] = True
+            post_check = _getRawDumpPostCheck(post_check)
+
+        prefix = f"{entity.library.name}.{entity.name}.{name}"
+
+        entity.add_config(
+            name=name,
+            generics=generics,
+            pre_config=None
+            if generator is None
+            else generator.getPreConfig(configs, prefix),
+            post_check=post_check,
+        )
+        if history is not None:
+            history.addBundle(prefix, entity.name, configs)
+        if results is not None:
+            results.addBundle(prefix, entity.name, configs, frames=1)
+
+    if history is None:
+        costs = {config: _getFrameLength(config) for config in configs}
+    else:
+        costs = history.getCosts(entity.name, configs)
 
-    for config in configs:
-        params += [config.getTestConfigString()]
+    if individual_config_runs:
+        for config in sorted(configs, key=lambda x: (-costs[x], x.name)):
+            addConfig(config.name, (config,))
+        return
 
-    random.shuffle(params)
+    if history is None:
+        bundles = 1
 
-    assert params, "Could not find any config files!"
+    packed = sorted(_packConfigs(configs, costs, bundles), key=lambda x: -x[0])
 
-    entity.add_config(
-        name="test_all_configs",
-        generics=dict(test_cfg="|".join(params), NUMBER_OF_TEST_FRAMES=1, SEED=seed),
-    )
+    for index, (_, bundle) in enumerate(packed):
+        name = "test_all_configs" if len(packed) == 1 else f"configs_{index}"
+
+        # Shuffle the order configs are run to catch issues with state
+        # carried between configs, using the test seed so that failures can
+        # be reproduced
+        bundle = list(bundle)
+        random.Random(seed).shuffle(bundle)
+
+        addConfig(name, bundle)
 
 
 def main():
     "Main entry point for DVB FPGA test runner"
 
-    _generateGnuRadioData()
-    _createAuxiliaryTables()
-
     cli = VUnitCLI()
     cli.parser.add_argument(
         "--individual-config-runs",
@@ -1071,24 +3313,187 @@ def main():
     cli.parser.add_argument(
         "--seed",
         action="store",
-        help="Random seed of the tests",
+        help="Random seed of the tests, must be set when using --shard",
+        type=int,
+        default=None,
+    )
+    cli.parser.add_argument(
+        "--dvbs2-coverage-strength",
+        action="store",
+        help="dvbs2_encoder_tb runs the smallest set of configs it can find "
+        "where every combination of this many parameters (frame type, "
+        "constellation, code rate and pilots) is tested. Defaults to 2 "
+        "(pairwise)",
+        type=int,
+        choices=(1, 2, 3, 4),
+        default=2,
+    )
+    cli.parser.add_argument(
+        "--dvbs2-time-budget",
+        action="store",
+        help="Simulation time in seconds for dvbs2_encoder_tb, the time left "
+        "after --dvbs2-coverage-strength is met is filled with other configs "
+        "based on the simulation history",
+        type=float,
+        default=None,
+    )
+    cli.parser.add_argument(
+        "--changed-since",
+        action="store",
+        help="Only run testbenches that depend on files changed since this git "
+        "revision (including uncommitted changes). Changes to reference data "
+        "generation run all testbenches",
+        default=None,
+    )
+    cli.parser.add_argument(
+        "--shard",
+        action="store",
+        help="Only run shard i of N (i/N, starting at 1). Configs of all "
+        "testbenches are split into N shards of similar simulation time, "
+        "estimated from the frame length of each config or, if --history is "
+        "passed, from that file, which all shards must share. Use "
+        "misc/merge_xunit.py to combine the xunit reports of all shards",
+        type=_parseShard,
+        default=None,
+    )
+
+    cli.parser.add_argument(
+        "--raw-dump",
+        action="store_true",
+        help="Testbenches with complex outputs write them to raw dumps that "
+        "are checked with NumPy after the simulation instead of comparing them "
+        "in the simulator. Reports with the first mismatch of each frame, "
+        "error histograms and EVM are written next to the dumps",
+    )
+    cli.parser.add_argument(
+        "--ghdl-profile",
+        action="store",
+        help="GHDL flags to use: 'default', 'debug' (no optimization, IEEE "
+        "warnings enabled) or 'fast' (no debug info and only warnings and "
+        "errors logged)",
+        choices=tuple(GHDL_PROFILES),
+        default="default",
+    )
+    cli.parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Run a fixed set of configs of each testbench and report "
+        "simulated clock cycles and frames per second. Uses seed "
+        f"{BENCHMARK_SEED} unless --seed is set",
+    )
+    cli.parser.add_argument(
+        "--benchmark-output",
+        action="store",
+        help="JSON file results of --benchmark are appended to. Defaults to "
+        "benchmark.json inside the output path",
+        default=None,
+    )
+
+    cli.parser.add_argument(
+        "--use-model",
+        action="store_true",
+        help="Generate reference data with the NumPy model of the GNU Radio "
+        "flow graph (gnuradio_data/dvbs2_encoder_model.py) instead of running "
+        "the flow graph. Doesn't need GNU Radio, but the model is only checked "
+        "against the flow graph by dvbs2_encoder_model.py --check-gnuradio",
+    )
+
+    cli.parser.add_argument(
+        "--cpu-budget",
+        action="store",
+        help="Number of CPUs shared by reference data generation and "
+        "simulations (at least the number of threads set by -p). Defaults to "
+        "the number of CPUs available",
         type=int,
-        default=random.randint(-1 << 31, 1 << 31),  # VHDL integer range
+        default=None,
+    )
+    cli.parser.add_argument(
+        "--data-seed",
+        action="store",
+        help="Seed used to generate the reference data input frames",
+        type=int,
+        default=0,
+    )
+    cli.parser.add_argument(
+        "--cache-dir",
+        action="store",
+        help="Directory to store and share reference data between workspaces, "
+        "defaults to the DVB_FPGA_CACHE_DIR environment variable. Reference "
+        "data is not shared if neither is set",
+        default=os.environ.get("DVB_FPGA_CACHE_DIR", None),
+    )
+    cli.parser.add_argument(
+        "--cache-size",
+        action="store",
+        help="Maximum size of the reference data cache directory in MB. Least "
+        "recently used entries are removed when this is exceeded",
+        type=int,
+        default=4096,
+    )
+
+    cli.parser.add_argument(
+        "--ldpc-text-table",
+        action="store_true",
+        help="Also write a human readable version of the LDPC tables",
+    )
+    cli.parser.add_argument(
+        "--telemetry",
+        action="store",
+        help="Path to write the time, CPU, memory and disk usage of each "
+        "reference data generation stage as JSON. Defaults to "
+        "generation_telemetry.json inside the output path",
+        default=None,
+    )
+
+    cli.parser.add_argument(
+        "--history",
+        action="store",
+        help="Path of the file with the simulation time of each config, used "
+        "to split configs between workers (see -p). Defaults to "
+        "sim_history.json inside the output path",
+        default=None,
     )
 
     args = cli.parse_args()
 
+    if args.seed is None and args.benchmark:
+        args.seed = BENCHMARK_SEED
+    if args.seed is None:
+        if args.shard is not None:
+            cli.parser.error("--shard requires --seed so all shards run the same tests")
+        args.seed = random.randint(-1 << 31, 1 << 31)  # VHDL integer range
+
+    history = SimulationHistory(
+        args.history or p.join(args.output_path, "sim_history.json")
+    )
+
+    # Data is generated by the tests' pre_config hooks and in the background
+    # for tests selected to run (see generator.start below), so only tests
+    # that actually run trigger generation
+    generator = ReferenceDataGenerator(
+        use_gnuradio=not args.use_model,
+        seed=args.data_seed,
+        cache_dir=args.cache_dir,
+        max_cache_size=args.cache_size * 1024 * 1024,
+        ldpc_text_table=args.ldpc_text_table,
+        cpu_budget=max(args.cpu_budget or os.cpu_count() or 1, args.num_threads),
+    )
+
     print(f"Seed: {args.seed}")
 
     vunit = VUnit.from_args(args=args)
     setupSources(vunit)
-    setupTests(vunit, args)
+    config_results = ConfigResults()
+    setupTests(vunit, args, generator, history, config_results)
 
     vunit.set_compile_option("modelsim.vcom_flags", ["-explicit"])
 
     # Not all options are supported by all GHDL backends
-    vunit.set_sim_option("ghdl.elab_flags", ["-frelaxed-rules"])
-    vunit.set_compile_option("ghdl.a_flags", ["-frelaxed-rules", "-O2", "-g"])
+    profile = GHDL_PROFILES[args.ghdl_profile]
+    vunit.set_sim_option("ghdl.elab_flags", profile["elab_flags"])
+    vunit.set_compile_option("ghdl.a_flags", profile["a_flags"])
+    if not profile["verbose"]:
+        vunit.library("lib").set_generic("VERBOSE", False)
 
     # Make components not bound (error 3473) an error
     vsim_flags = ["-error", "3473"]
@@ -1097,9 +3502,39 @@ def main():
 
     vunit.set_sim_option("modelsim.vsim_flags", vsim_flags)
 
-    vunit.set_sim_option("disable_ieee_warnings", True)
+    vunit.set_sim_option("disable_ieee_warnings", profile["disable_ieee_warnings"])
     vunit.set_sim_option("modelsim.init_file.gui", p.join(ROOT, "wave.do"))
-    vunit.main()
+
+    def postRun(results):
+        generator.stop()
+        report = results.get_report()
+        history.update(report)
+        history.save()
+        config_results.writeReport(
+            report, p.join(args.output_path, "config_results.json")
+        )
+        if args.benchmark:
+            Benchmark(
+                args.benchmark_output or p.join(args.output_path, "benchmark.json"),
+                profile=args.ghdl_profile,
+                seed=args.seed,
+            ).write(report, config_results.expand(report))
+
+        if not generator.profiles:
+            return
+        telemetry = args.telemetry or p.join(
+            args.output_path, "generation_telemetry.json"
+        )
+        generator.writeTelemetry(telemetry)
+        generator.printTelemetrySummary()
+        print(f"Generation telemetry written to {telemetry}")
+
+    # Generate data while VUnit compiles sources and runs the tests whose data
+    # is already available
+    if not (args.list or args.files or args.compile or args.export_json):
+        generator.start(args.test_patterns)
+
+    vunit.main(post_run=postRun)
 
 
 if __name__ == "__main__":
@@ -49,7 +49,9 @@ entity axi_bch_encoder_tb is
     RUNNER_CFG            : string;
     SEED                  : integer;
     TEST_CFG              : string;
-    NUMBER_OF_TEST_FRAMES : integer := 8);
+    NUMBER_OF_TEST_FRAMES : integer := 8;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_bch_encoder_tb;
 
 architecture axi_bch_encoder_tb of axi_bch_encoder_tb is
@@ -164,6 +166,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process
     constant self         : actor_t       := new_actor("main");
     variable file_reader  : file_reader_t := new_file_reader("axi_file_reader_u");
@@ -225,7 +241,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
 
     while test_suite loop
       rst <= '1';
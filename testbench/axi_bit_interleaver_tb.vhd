@@ -54,7 +54,9 @@ entity axi_bit_interleaver_tb is
     TEST_CFG              : string;
     SEED                  : integer;
     TDATA_WIDTH           : integer := 8;
-    NUMBER_OF_TEST_FRAMES : integer := 8);
+    NUMBER_OF_TEST_FRAMES : integer := 8;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_bit_interleaver_tb;
 
 architecture axi_bit_interleaver_tb of axi_bit_interleaver_tb is
@@ -185,6 +187,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{ -----------------------------------------------------------------
     constant self         : actor_t := new_actor("main");
     variable file_reader  : file_reader_t := new_file_reader("axi_file_reader_u");
@@ -253,7 +269,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
 
     while test_suite loop
       rst <= '1';
@@ -59,7 +59,10 @@ entity axi_constellation_mapper_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     NUMBER_OF_TEST_FRAMES : integer := 8;
-    SEED                  : integer);
+    SEED                  : integer;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True;
+    RAW_DUMP              : boolean := False);
 end axi_constellation_mapper_tb;
 
 architecture axi_constellation_mapper_tb of axi_constellation_mapper_tb is
@@ -101,6 +104,7 @@ architecture axi_constellation_mapper_tb of axi_constellation_mapper_tb is
   signal axi_master         : axi_stream_bus_t(tdata(INPUT_DATA_WIDTH - 1 downto 0), tuser(ENCODED_CONFIG_WIDTH - 1 downto 0));
   -- AXI output
   signal axi_slave          : axi_stream_bus_t(tdata(OUTPUT_DATA_WIDTH - 1 downto 0), tuser(ENCODED_CONFIG_WIDTH - 1 downto 0));
+  signal error_cnt          : std_logic_vector(7 downto 0);
   signal expected_tdata     : std_logic_vector(OUTPUT_DATA_WIDTH - 1 downto 0);
 
 begin
@@ -177,7 +181,8 @@ begin
       TOLERANCE           => 4,
       SWAP_BYTE_ENDIANESS => False,
       ERROR_CNT_WIDTH     => 8,
-      REPORT_SEVERITY     => Error)
+      REPORT_SEVERITY     => Error,
+      RAW_DUMP_FILE       => get_raw_dump_path(RUNNER_CFG, "output_checker", RAW_DUMP))
     port map (
       -- Usual ports
       clk                => clk,
@@ -185,7 +190,7 @@ begin
       -- Config and status
       tdata_error_cnt    => open,
       tlast_error_cnt    => open,
-      error_cnt          => open,
+      error_cnt          => error_cnt,
       -- Debug stuff
       expected_tdata     => expected_tdata,
       expected_tlast     => open,
@@ -208,6 +213,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{
     constant self           : actor_t       := new_actor("main");
     constant logger         : logger_t      := get_logger("main");
@@ -309,7 +328,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
     hide(get_logger("file_reader_t(input_data)"), display_handler, debug, True);
     hide(get_logger("file_reader_t(output_checker)"), display_handler, debug, True);
     hide(get_logger("file_reader_t(input_data)"), display_handler, info, True);
@@ -55,7 +55,10 @@ entity axi_file_compare_complex is
     SWAP_BYTE_ENDIANESS : boolean := False;
     ERROR_CNT_WIDTH     : natural := 8;
     REPORT_SEVERITY     : severity_level := Error;
-    DUMP_FILE_FORMAT    : string := "");  -- Leave empty to disable
+    DUMP_FILE_FORMAT    : string := "";   -- Leave empty to disable
+    -- Write received and expected data to this file instead of comparing them
+    -- (see raw_dump_file_t). Leave empty to disable
+    RAW_DUMP_FILE       : string := "");
   port (
     -- Usual ports
     clk                : in  std_logic;
@@ -235,6 +238,8 @@ begin
 
     variable outfile : dump_file_t;
 
+    file raw_dump : raw_dump_file_t;
+
     procedure check_within_tolerance (
       constant v            : std_logic_vector;
       constant ref          : std_logic_vector) is
@@ -316,6 +321,11 @@ begin
     tdata_error_cnt_i <= (others => '0');
     tlast_error_cnt_i <= (others => '0');
 
+    if RAW_DUMP_FILE /= "" then
+      file_open(raw_dump, RAW_DUMP_FILE, write_mode);
+      write_raw_dump_header(raw_dump, DATA_WIDTH, TOLERANCE);
+    end if;
+
     wait until rst = '0';
     while True loop
       wait until axi_data_valid = '1' and rising_edge(clk);
@@ -324,18 +334,26 @@ begin
         failure(sformat("Input data has undefined values: %r (%b)", fo(s_tdata), fo(s_tdata)));
       end if;
 
-      dbg_recv_re     <= signed(s_tdata(DATA_WIDTH - 1 downto DATA_WIDTH/2));
-      dbg_recv_im     <= signed(s_tdata(DATA_WIDTH/2 - 1 downto 0));
-      dbg_expected_re <= signed(expected_tdata_i(DATA_WIDTH - 1 downto DATA_WIDTH/2));
-      dbg_expected_im <= signed(expected_tdata_i(DATA_WIDTH/2 - 1 downto 0));
-
-      check_within_tolerance(s_tdata, expected_tdata_i);
+      if RAW_DUMP_FILE /= "" then
+        -- Data is checked after the simulation by run.py
+        write_raw_dump_entry(raw_dump, s_tdata, s_tlast, expected_tdata_i, m_tlast);
+        if m_tlast = '1' then
+          flush(raw_dump);
+        end if;
+      else
+        dbg_recv_re     <= signed(s_tdata(DATA_WIDTH - 1 downto DATA_WIDTH/2));
+        dbg_recv_im     <= signed(s_tdata(DATA_WIDTH/2 - 1 downto 0));
+        dbg_expected_re <= signed(expected_tdata_i(DATA_WIDTH - 1 downto DATA_WIDTH/2));
+        dbg_expected_im <= signed(expected_tdata_i(DATA_WIDTH/2 - 1 downto 0));
+
+        check_within_tolerance(s_tdata, expected_tdata_i);
+      end if;
 
       if s_tlast = '1' then
         outfile.close;
       end if;
 
-      if s_tlast /= m_tlast then
+      if RAW_DUMP_FILE = "" and s_tlast /= m_tlast then
         notify(
           sformat(
             "TLAST error in frame %d, word %d: Expected %r but got %r",
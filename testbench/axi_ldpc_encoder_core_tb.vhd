@@ -52,7 +52,9 @@ entity axi_ldpc_encoder_core_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     NUMBER_OF_TEST_FRAMES : integer := 8;
-    SEED                  : integer);
+    SEED                  : integer;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_ldpc_encoder_core_tb;
 
 architecture axi_ldpc_encoder_core_tb of axi_ldpc_encoder_core_tb is
@@ -207,6 +209,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{
     constant self             : actor_t       := new_actor("main");
     constant logger           : logger_t      := get_logger("main");
@@ -254,7 +270,7 @@ begin
         read_file( net, file_checker, data_path & "/ldpc_output_packed.bin");
 
         msg := new_msg(sender => self);
-        push(msg, data_path & "/ldpc_table.bin");
+        push(msg, get_ldpc_table_path(config));
         send(net, ldpc_table_write, msg);
 
         -- Update the expected TID
@@ -285,7 +301,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
     hide(get_logger("file_reader_t(file_reader)"), display_handler, (trace, debug), True);
     hide(get_logger("ldpc_table_write"), display_handler, (trace, debug), True);
     hide(get_logger("axi_file_reader_u"), display_handler, (trace, debug), True);
@@ -390,39 +410,23 @@ begin
     variable msg    : msg_t;
 
     procedure write_table ( constant path : string ) is
-      file file_handler  : text;
-      variable lineno    : integer := 0;
-      variable L         : line;
-      variable fields    : lines_t;
-      variable offset    : integer;
-      variable is_next   : std_logic;
-      variable bit_index : integer;
+      file file_handler  : ldpc_table_file_t;
+      variable header    : ldpc_table_header_t;
+      variable entry     : ldpc_table_entry_t := (offset => 0, is_next => '0', bit_index => 0);
     begin
       info(logger, sformat("Writing table from '%s'", path));
       file_open(file_handler, path, read_mode);
-      while not endfile(file_handler) loop
-        readline(file_handler, L);
-        trace(logger, sformat("[%d, %s] %s", fo(lineno), fo(endfile(file_handler)), L.all));
-        lineno := lineno + 1;
-        if L.all(1) = '#' then
-          trace(logger, sformat("Ignoring %s", L.all));
-          next;
-        end if;
+      read_ldpc_table_header(file_handler, header);
 
-        fields := split(L.all, ",");
-        trace(logger, sformat("fields(0).all = '%s'", fields(0).all));
-        read(fields.all(0), offset);
-        trace(logger, sformat("fields(1).all = '%s'", fields(1).all));
-        read(fields.all(1), is_next);
-        trace(logger, sformat("fields(2).all = '%s'", fields(2).all));
-        read(fields.all(2), bit_index);
-        trace(logger, sformat("Expecting offset=%d, is_next=%d, bit_index=%d", fo(offset), fo(is_next), fo(bit_index)));
-
-        axi_table.offset    <= to_unsigned(offset, axi_table.offset'length);
-        axi_table.bit_index <= to_unsigned(bit_index, axi_table.bit_index'length);
-        axi_table.is_next   <= is_next;
+      for i in 0 to header.length - 1 loop
+        read_ldpc_table_entry(file_handler, entry);
+        trace(logger, sformat("Writing offset=%d, is_next=%d, bit_index=%d", fo(entry.offset), fo(entry.is_next), fo(entry.bit_index)));
+
+        axi_table.offset    <= to_unsigned(entry.offset, axi_table.offset'length);
+        axi_table.bit_index <= to_unsigned(entry.bit_index, axi_table.bit_index'length);
+        axi_table.is_next   <= entry.is_next;
         axi_table.tvalid    <= '1';
-        if endfile(file_handler) then
+        if i = header.length - 1 then
           axi_table.tlast     <= '1';
         else
           axi_table.tlast     <= '0';
@@ -434,7 +438,6 @@ begin
         axi_table.bit_index <= (others => 'U');
         axi_table.is_next   <= 'U';
         axi_table.tvalid    <= '0';
-        axi_table.tvalid    <= '0';
 
       end loop;
 
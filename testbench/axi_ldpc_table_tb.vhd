@@ -58,7 +58,9 @@ entity axi_ldpc_table_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     SEED                  : integer;
-    NUMBER_OF_TEST_FRAMES : integer := 8);
+    NUMBER_OF_TEST_FRAMES : integer := 8;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_ldpc_table_tb;
 
 architecture axi_ldpc_table_tb of axi_ldpc_table_tb is
@@ -106,6 +108,8 @@ architecture axi_ldpc_table_tb of axi_ldpc_table_tb is
   signal axi_slave_next     : std_logic;
   signal axi_slave_tuser    : std_logic_vector(numbits(max(DVB_N_LDPC)) - 1 downto 0);
 
+  signal error_cnt          : std_logic_vector(7 downto 0) := (others => '0');
+
 begin
 
   -------------------
@@ -168,6 +172,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{
     constant self             : actor_t          := new_actor("main");
     constant logger           : logger_t         := get_logger("main");
@@ -217,7 +235,7 @@ begin
         debug(logger, "Setting up frame #" & to_string(i));
 
         msg := new_msg(sender => self);
-        push(msg, data_path & "/ldpc_table.bin");
+        push(msg, get_ldpc_table_path(config));
         send(net, ldpc_table_check, msg);
 
         axi_bfm_write(net,
@@ -238,8 +256,12 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
-    show(get_logger("ldpc_table_check"), display_handler, debug, True);
+    if VERBOSE then
+      show(display_handler, debug);
+      show(get_logger("ldpc_table_check"), display_handler, debug, True);
+    else
+      hide(display_handler, info);
+    end if;
 
 
     while test_suite loop
@@ -301,54 +323,48 @@ begin
     variable msg    : msg_t;
 
     procedure check_filename ( constant path : string ) is
-      file file_handler  : text;
-      variable lineno    : integer := 0;
-      variable L         : line;
-      variable fields    : lines_t;
-      variable offset    : integer;
-      variable is_next   : std_logic;
-      variable bit_index : integer;
+      file file_handler  : ldpc_table_file_t;
+      variable header    : ldpc_table_header_t;
+      variable entry     : ldpc_table_entry_t := (offset => 0, is_next => '0', bit_index => 0);
     begin
       info(logger, sformat("Reading '%s'", path));
       file_open(file_handler, path, read_mode);
-      while not endfile(file_handler) loop
-        readline(file_handler, L);
-        trace(logger, sformat("[%d, %s] %s", fo(lineno), fo(endfile(file_handler)), L.all));
-        lineno := lineno + 1;
-        if L.all(1) = '#' then
-          trace(logger, sformat("Ignoring %s", L.all));
-          next;
-        end if;
-
-        fields := split(L.all, ",");
-        trace(logger, sformat("fields(0).all = '%s'", fields(0).all));
-        read(fields.all(0), offset);
-        trace(logger, sformat("fields(1).all = '%s'", fields(1).all));
-        read(fields.all(1), is_next);
-        trace(logger, sformat("fields(2).all = '%s'", fields(2).all));
-        read(fields.all(2), bit_index);
-        trace(logger, sformat("Expecting offset=%d, is_next=%d, bit_index=%d", fo(offset), fo(is_next), fo(bit_index)));
+      read_ldpc_table_header(file_handler, header);
+      debug(
+        logger,
+        sformat(
+          "Table has %d entries (frame type=%s, code rate=%s)",
+          fo(header.length),
+          frame_type_t'image(header.frame_type),
+          code_rate_t'image(header.code_rate)));
+
+      for i in 0 to header.length - 1 loop
+        read_ldpc_table_entry(file_handler, entry);
+        trace(logger, sformat("Expecting offset=%d, is_next=%d, bit_index=%d", fo(entry.offset), fo(entry.is_next), fo(entry.bit_index)));
 
         wait until axi_slave.tvalid = '1' and axi_slave.tready = '1' and rising_edge(clk);
 
-        if   unsigned(axi_slave_offset) /= offset
-          or unsigned(axi_slave_tuser) /= bit_index
-          or axi_slave_next /= is_next then
+        if   unsigned(axi_slave_offset) /= entry.offset
+          or unsigned(axi_slave_tuser) /= entry.bit_index
+          or axi_slave_next /= entry.is_next then
           error(
             logger,
             sformat(
               "Expected (%d, %d, %d), got (%d, %d, %d)",
-              fo(offset),
-              fo(is_next),
-              fo(bit_index),
+              fo(entry.offset),
+              fo(entry.is_next),
+              fo(entry.bit_index),
               fo(axi_slave_offset),
               fo(axi_slave_next),
               fo(axi_slave_tuser)));
+          error_cnt <= std_logic_vector(unsigned(error_cnt) + 1);
         end if;
 
-        if endfile(file_handler) then
+        if i = header.length - 1 then
           check_equal(axi_slave.tlast, '1', "TLAST error, expected '1' but got '0'");
-          exit;
+          if axi_slave.tlast /= '1' then
+            error_cnt <= std_logic_vector(unsigned(error_cnt) + 1);
+          end if;
         end if;
       end loop;
 
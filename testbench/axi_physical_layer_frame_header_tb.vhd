@@ -48,7 +48,9 @@ entity axi_physical_layer_header_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     NUMBER_OF_TEST_FRAMES : integer := 8;
-    SEED                  : integer);
+    SEED                  : integer;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_physical_layer_header_tb;
 
 architecture axi_physical_layer_header_tb of axi_physical_layer_header_tb is
@@ -161,6 +163,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{
     constant self        : actor_t          := new_actor("main");
     constant logger      : logger_t         := get_logger("main");
@@ -236,7 +252,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
     hide(
       logger           => get_logger("axi_stream_bfm_t(cfg)"),
       log_handler      => display_handler,
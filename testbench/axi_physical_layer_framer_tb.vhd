@@ -52,7 +52,10 @@ entity axi_physical_layer_framer_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     NUMBER_OF_TEST_FRAMES : integer := 8;
-    SEED                  : integer);
+    SEED                  : integer;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True;
+    RAW_DUMP              : boolean := False);
 end axi_physical_layer_framer_tb;
 
 architecture axi_physical_layer_framer_tb of axi_physical_layer_framer_tb is
@@ -80,6 +83,7 @@ architecture axi_physical_layer_framer_tb of axi_physical_layer_framer_tb is
   signal m_data_valid       : boolean;
 
   signal axi_slave          : axi_stream_bus_t(tdata(TDATA_WIDTH - 1 downto 0), tuser(ENCODED_CONFIG_WIDTH - 1 downto 0));
+  signal error_cnt          : std_logic_vector(7 downto 0);
   signal s_data_valid       : boolean;
 
   signal expected_tdata     : std_logic_vector(TDATA_WIDTH - 1 downto 0);
@@ -149,7 +153,8 @@ begin
       TOLERANCE           => 4,
       SWAP_BYTE_ENDIANESS => False,
       ERROR_CNT_WIDTH     => 8,
-      REPORT_SEVERITY     => Error)
+      REPORT_SEVERITY     => Error,
+      RAW_DUMP_FILE       => get_raw_dump_path(RUNNER_CFG, "ref_data_u", RAW_DUMP))
     port map (
       -- Usual ports
       clk                => clk,
@@ -157,7 +162,7 @@ begin
       -- Config and status
       tdata_error_cnt    => open,
       tlast_error_cnt    => open,
-      error_cnt          => open,
+      error_cnt          => error_cnt,
       -- Debug stuff
       expected_tdata     => expected_tdata,
       expected_tlast     => expected_tlast,
@@ -184,6 +189,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process
     constant self         : actor_t       := new_actor("main");
     constant logger       : logger_t      := get_logger("main");
@@ -257,7 +276,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
 
     while test_suite loop
       rst <= '1';
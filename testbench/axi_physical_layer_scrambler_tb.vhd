@@ -52,7 +52,9 @@ entity axi_physical_layer_scrambler_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string;
     SEED                  : integer;
-    NUMBER_OF_TEST_FRAMES : integer := 3);
+    NUMBER_OF_TEST_FRAMES : integer := 3;
+    FAIL_FAST             : boolean := False;
+    VERBOSE               : boolean := True);
 end axi_physical_layer_scrambler_tb;
 
 architecture axi_physical_layer_scrambler_tb of axi_physical_layer_scrambler_tb is
@@ -85,6 +87,7 @@ architecture axi_physical_layer_scrambler_tb of axi_physical_layer_scrambler_tb
 
   signal expected_tdata     : std_logic_vector(TDATA_WIDTH - 1 downto 0);
   signal expected_tlast     : std_logic;
+  signal error_cnt          : std_logic_vector(7 downto 0) := (others => '0');
 
   signal dbg_input          : complex;
   signal dbg_recv           : complex;
@@ -186,6 +189,20 @@ begin
   ---------------
   -- Processes --
   ---------------
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => axi_slave.tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process
     constant self         : actor_t       := new_actor("main");
     constant logger       : logger_t      := get_logger("main");
@@ -256,7 +273,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
 
     tid_rand_gen.InitSeed(SEED);
 
@@ -401,6 +422,7 @@ begin
           real'image(expected_r.re), real'image(expected_r.im),
           real'image(expected_p.mag), real'image(expected_p.arg)
         ));
+      error_cnt <= std_logic_vector(unsigned(error_cnt) + 1);
    end if;
 
     word_cnt := word_cnt + 1;
@@ -79,6 +79,102 @@ package dvb_sim_utils_pkg is
 
   function get_checker_data_ratio ( constant constellation : in constellation_t) return string;
 
+  -- LDPC tables depend only on frame type and code rate, so run.py writes them
+  -- to gnuradio_data/ldpc_tables/<FRAME TYPE>_<CODE RATE>.bin, next to the
+  -- configs' data directories
+  function get_ldpc_table_path ( constant config : config_t ) return string;
+
+  -- LDPC table files written by run.py. Files have a 12 byte
+  -- header ("LDPC", format version, frame_type_t'pos, code_rate_t'pos, a
+  -- reserved byte and the number of entries as a little endian uint32)
+  -- followed by 3 bytes for each entry: the offset as a little endian uint16
+  -- and a flags byte where bit 0 is the next/last coefficient flag
+  type ldpc_table_file_t is file of character;
+
+  type ldpc_table_header_t is record
+    frame_type : frame_type_t;
+    code_rate  : code_rate_t;
+    length     : natural;
+  end record;
+
+  type ldpc_table_entry_t is record
+    offset    : natural;
+    is_next   : std_logic;
+    bit_index : natural;
+  end record;
+
+  procedure read_ldpc_table_header (
+    file     handler : ldpc_table_file_t;
+    variable header  : out ldpc_table_header_t);
+
+  -- Reads the next entry into entry. The bit index is not stored in the file,
+  -- so it's derived from the previous value of entry and should be
+  -- initialized to 0 before reading the first entry
+  procedure read_ldpc_table_entry (
+    file     handler : ldpc_table_file_t;
+    variable entry   : inout ldpc_table_entry_t);
+
+  -- Files with real values written by run.py (modulation tables and polyphase
+  -- filter coefficients). Files have a 12 byte header ("REAL", format
+  -- version, 3 reserved bytes and the number of values as a little endian
+  -- uint32) followed by the values as little endian IEEE 754 doubles
+  type real_table_file_t is file of character;
+
+  -- Reads all values of a real table file. Files in the previous format (one
+  -- decimal value per line) are still read, but a deprecation warning is
+  -- logged
+  impure function read_real_table ( constant path : string ) return real_vector;
+
+  -- Results of each config of simulations that test multiple configs are
+  -- written to this file (one "<config index>,<pass|fail>,<simulation time in
+  -- ns>,<errors>" line per config), so that run.py can report them
+  -- individually
+  impure function get_config_results_path ( constant runner_cfg : string ) return string;
+
+  -- Writes the result of each config to get_config_results_path as its frames
+  -- are checked. Configs are assumed to be checked in order, each one with
+  -- frames_per_config frames, and to fail if error_cnt changes while checking
+  -- them. If fail_fast is set, the simulation is stopped after the first
+  -- config that fails. Never returns, should be called from its own process
+  procedure track_config_results (
+    constant runner_cfg        : string;
+    constant configs           : config_array_t;
+    constant frames_per_config : positive;
+    constant fail_fast         : boolean;
+    signal   clk               : in std_logic;
+    signal   tvalid            : in std_logic;
+    signal   tready            : in std_logic;
+    signal   tlast             : in std_logic;
+    signal   error_cnt         : in std_logic_vector);
+
+  -- Raw DUT output dumps written by axi_file_compare_complex when
+  -- RAW_DUMP_FILE is set and checked by misc/check_raw_dump.py after the
+  -- simulation. Files have an 8 byte header ("RAWD", format version, bytes
+  -- per I/Q component and the comparison tolerance as a little endian
+  -- uint16) followed by one entry per word: received I and Q, expected I and
+  -- Q as little endian signed integers and a flags byte where bit 0 is the
+  -- received tlast and bit 1 is the expected tlast
+  type raw_dump_file_t is file of character;
+
+  -- Path of the raw dump named name in the test's output path or an empty
+  -- string (which disables raw dumps) if enabled is False
+  impure function get_raw_dump_path (
+    constant runner_cfg : string;
+    constant name       : string;
+    constant enabled    : boolean) return string;
+
+  procedure write_raw_dump_header (
+    file     handler    : raw_dump_file_t;
+    constant data_width : positive;
+    constant tolerance  : natural);
+
+  procedure write_raw_dump_entry (
+    file     handler        : raw_dump_file_t;
+    constant received       : std_logic_vector;
+    constant received_tlast : std_logic;
+    constant expected       : std_logic_vector;
+    constant expected_tlast : std_logic);
+
 end dvb_sim_utils_pkg;
 
 package body dvb_sim_utils_pkg is
@@ -293,5 +389,354 @@ package body dvb_sim_utils_pkg is
     return "";
   end;
 
+  function get_ldpc_table_path ( constant config : config_t ) return string is
+    constant base_path : string := strip(config.base_path, chars => (1 to 1 => nul));
+  begin
+    return base_path & "/../ldpc_tables/"
+      & upper(frame_type_t'image(config.frame_type)) & "_"
+      & upper(code_rate_t'image(config.code_rate)) & ".bin";
+  end function get_ldpc_table_path;
+
+  procedure read_byte (
+    file     handler : ldpc_table_file_t;
+    variable value   : out natural) is
+    variable c : character;
+  begin
+    read(handler, c);
+    value := character'pos(c);
+  end procedure;
+
+  procedure read_ldpc_table_header (
+    file     handler : ldpc_table_file_t;
+    variable header  : out ldpc_table_header_t) is
+    constant LDPC_TABLE_MAGIC   : string := "LDPC";
+    constant LDPC_TABLE_VERSION : natural := 1;
+    variable magic              : string(1 to 4);
+    variable value              : natural;
+    variable length             : natural := 0;
+  begin
+    for i in magic'range loop
+      read(handler, magic(i));
+    end loop;
+
+    if magic /= LDPC_TABLE_MAGIC then
+      failure("LDPC table file doesn't start with " & quote(LDPC_TABLE_MAGIC) & ", got " & quote(magic));
+    end if;
+
+    read_byte(handler, value);
+    if value /= LDPC_TABLE_VERSION then
+      failure("Unsupported LDPC table file version: " & integer'image(value));
+    end if;
+
+    read_byte(handler, value);
+    header.frame_type := frame_type_t'val(value);
+    read_byte(handler, value);
+    header.code_rate := code_rate_t'val(value);
+    -- Reserved
+    read_byte(handler, value);
+
+    for i in 0 to 3 loop
+      read_byte(handler, value);
+      length := length + value * 2**(8*i);
+    end loop;
+    header.length := length;
+  end procedure;
+
+  procedure read_ldpc_table_entry (
+    file     handler : ldpc_table_file_t;
+    variable entry   : inout ldpc_table_entry_t) is
+    variable low, high, flags : natural;
+  begin
+    -- Bit index moves on after the last coefficient of the previous bit
+    if entry.is_next = '1' then
+      entry.bit_index := entry.bit_index + 1;
+    end if;
+
+    read_byte(handler, low);
+    read_byte(handler, high);
+    read_byte(handler, flags);
+
+    entry.offset := low + 256*high;
+    if flags mod 2 = 1 then
+      entry.is_next := '1';
+    else
+      entry.is_next := '0';
+    end if;
+  end procedure;
+
+  -- Converts the 8 bytes of a little endian IEEE 754 double to real
+  function to_real_float64 ( constant bytes : integer_vector(0 to 7) ) return real is
+    variable exponent : natural;
+    variable mantissa : real;
+    variable result   : real;
+  begin
+    exponent := (bytes(7) mod 128) * 16 + bytes(6) / 16;
+
+    mantissa := real(bytes(6) mod 16);
+    for i in 5 downto 0 loop
+      mantissa := mantissa * 256.0 + real(bytes(i));
+    end loop;
+
+    if exponent = 2047 then
+      failure("Infinite and NaN values are not supported");
+    elsif exponent = 0 then
+      -- Subnormal, 2.0**(-1074) can't be calculated directly
+      result := mantissa * 2.0**(-52) * 2.0**(-1022);
+    else
+      result := (1.0 + mantissa * 2.0**(-52)) * 2.0**(exponent - 1023);
+    end if;
+
+    if bytes(7) >= 128 then
+      return -result;
+    end if;
+    return result;
+  end function;
+
+  impure function read_real_table ( constant path : string ) return real_vector is
+    constant REAL_TABLE_MAGIC   : string := "REAL";
+    constant REAL_TABLE_VERSION : natural := 1;
+
+    file handler    : real_table_file_t;
+    variable status : file_open_status;
+    variable magic  : string(1 to 4);
+    variable c      : character;
+    variable value  : natural;
+    variable length : natural := 0;
+
+    impure function read_values ( constant length : natural ) return real_vector is
+      variable result : real_vector(0 to length - 1);
+      variable bytes  : integer_vector(0 to 7);
+    begin
+      for i in result'range loop
+        for j in bytes'range loop
+          read(handler, c);
+          bytes(j) := character'pos(c);
+        end loop;
+        result(i) := to_real_float64(bytes);
+      end loop;
+      file_close(handler);
+      return result;
+    end function;
+
+    impure function count_lines return natural is
+      file text_handler : text;
+      variable L        : line;
+      variable count    : natural := 0;
+    begin
+      file_open(text_handler, path, read_mode);
+      while not endfile(text_handler) loop
+        readline(text_handler, L);
+        if L'length > 0 then
+          count := count + 1;
+        end if;
+      end loop;
+      file_close(text_handler);
+      return count;
+    end function;
+
+    impure function read_text_values ( constant length : natural ) return real_vector is
+      file text_handler : text;
+      variable L        : line;
+      variable result   : real_vector(0 to length - 1);
+      variable index    : natural := 0;
+    begin
+      file_open(text_handler, path, read_mode);
+      while not endfile(text_handler) loop
+        readline(text_handler, L);
+        if L'length > 0 then
+          read(L, result(index));
+          index := index + 1;
+        end if;
+      end loop;
+      file_close(text_handler);
+      return result;
+    end function;
+
+  begin
+    file_open(status, handler, path, read_mode);
+    if status /= open_ok then
+      failure("Failed to open " & quote(path) & ": " & file_open_status'image(status));
+    end if;
+
+    for i in magic'range loop
+      if endfile(handler) then
+        magic(i) := nul;
+      else
+        read(handler, magic(i));
+      end if;
+    end loop;
+
+    if magic = REAL_TABLE_MAGIC then
+      read(handler, c);
+      if character'pos(c) /= REAL_TABLE_VERSION then
+        failure("Unsupported real table file version: " & integer'image(character'pos(c)));
+      end if;
+      -- Reserved
+      for i in 0 to 2 loop
+        read(handler, c);
+      end loop;
+
+      for i in 0 to 3 loop
+        read(handler, c);
+        value  := character'pos(c);
+        length := length + value * 2**(8*i);
+      end loop;
+
+      return read_values(length);
+    end if;
+
+    file_close(handler);
+    warning(
+      quote(path) & " has one decimal value per line, this format is deprecated " &
+      "and should be regenerated by run.py");
+    return read_text_values(count_lines);
+  end function read_real_table;
+
+  impure function get_config_results_path ( constant runner_cfg : string ) return string is
+  begin
+    return output_path(runner_cfg) & "config_results.csv";
+  end function get_config_results_path;
+
+  procedure track_config_results (
+    constant runner_cfg        : string;
+    constant configs           : config_array_t;
+    constant frames_per_config : positive;
+    constant fail_fast         : boolean;
+    signal   clk               : in std_logic;
+    signal   tvalid            : in std_logic;
+    signal   tready            : in std_logic;
+    signal   tlast             : in std_logic;
+    signal   error_cnt         : in std_logic_vector) is
+    constant path       : string := get_config_results_path(runner_cfg);
+    file     results    : text;
+    variable result     : line;
+    variable last_cnt   : std_logic_vector(error_cnt'range);
+    variable errors     : natural;
+    variable start      : time;
+  begin
+    -- Don't keep results of previous runs
+    file_open(results, path, write_mode);
+    file_close(results);
+
+    wait until rising_edge(clk);
+    last_cnt := error_cnt;
+    start    := now;
+
+    for i in configs'range loop
+      for frame in 0 to frames_per_config - 1 loop
+        wait until rising_edge(clk) and tvalid = '1' and tready = '1' and tlast = '1';
+      end loop;
+
+      -- Error counters are only updated after the last word is checked
+      wait until rising_edge(clk);
+      errors := to_integer(unsigned(error_cnt) - unsigned(last_cnt));
+
+      write(result, integer'image(i - configs'low) & ",");
+      if errors = 0 then
+        write(result, string'("pass,"));
+      else
+        write(result, string'("fail,"));
+      end if;
+      write(result, integer'image((now - start) / 1 ns) & "," & integer'image(errors));
+
+      file_open(results, path, append_mode);
+      writeline(results, result);
+      file_close(results);
+
+      if errors /= 0 then
+        warning(sformat("Config %d failed with %d errors: %s", fo(i - configs'low), fo(errors), to_string(configs(i))));
+        if fail_fast then
+          error("Stopping after the first config that failed");
+        end if;
+      end if;
+
+      last_cnt := error_cnt;
+      start    := now;
+    end loop;
+
+    wait;
+  end procedure track_config_results;
+
+  impure function get_raw_dump_path (
+    constant runner_cfg : string;
+    constant name       : string;
+    constant enabled    : boolean) return string is
+  begin
+    if not enabled then
+      return "";
+    end if;
+    return output_path(runner_cfg) & name & ".raw";
+  end function get_raw_dump_path;
+
+  -- Number of bytes each I/Q component of a data_width bits word takes in raw
+  -- dumps, rounded up to a power of 2
+  function get_raw_dump_component_bytes ( constant data_width : positive ) return positive is
+    variable bytes : positive := 1;
+  begin
+    while 8*bytes < data_width/2 loop
+      bytes := 2*bytes;
+    end loop;
+    return bytes;
+  end function;
+
+  procedure write_byte (
+    file     handler : raw_dump_file_t;
+    constant value   : natural) is
+  begin
+    write(handler, character'val(value));
+  end procedure;
+
+  procedure write_raw_dump_header (
+    file     handler    : raw_dump_file_t;
+    constant data_width : positive;
+    constant tolerance  : natural) is
+    constant RAW_DUMP_MAGIC   : string := "RAWD";
+    constant RAW_DUMP_VERSION : natural := 1;
+  begin
+    for i in RAW_DUMP_MAGIC'range loop
+      write(handler, RAW_DUMP_MAGIC(i));
+    end loop;
+    write_byte(handler, RAW_DUMP_VERSION);
+    write_byte(handler, get_raw_dump_component_bytes(data_width));
+    write_byte(handler, tolerance mod 256);
+    write_byte(handler, (tolerance / 256) mod 256);
+  end procedure;
+
+  procedure write_raw_dump_entry (
+    file     handler        : raw_dump_file_t;
+    constant received       : std_logic_vector;
+    constant received_tlast : std_logic;
+    constant expected       : std_logic_vector;
+    constant expected_tlast : std_logic) is
+    constant width : natural := received'length;
+    constant bytes : positive := get_raw_dump_component_bytes(width);
+    variable flags : natural := 0;
+
+    -- Writes v sign extended to bytes, least significant byte first
+    procedure write_component ( constant v : signed ) is
+      constant extended : signed(8*bytes - 1 downto 0) := resize(v, 8*bytes);
+    begin
+      for i in 0 to bytes - 1 loop
+        write_byte(handler, to_integer(unsigned(extended(8*i + 7 downto 8*i))));
+      end loop;
+    end procedure;
+
+    constant received_i : std_logic_vector(width - 1 downto 0) := received;
+    constant expected_i : std_logic_vector(width - 1 downto 0) := expected;
+  begin
+    write_component(signed(received_i(width - 1 downto width/2)));
+    write_component(signed(received_i(width/2 - 1 downto 0)));
+    write_component(signed(expected_i(width - 1 downto width/2)));
+    write_component(signed(expected_i(width/2 - 1 downto 0)));
+
+    if received_tlast = '1' then
+      flags := flags + 1;
+    end if;
+    if expected_tlast = '1' then
+      flags := flags + 2;
+    end if;
+    write_byte(handler, flags);
+  end procedure;
+
 
 end package body;
@@ -59,7 +59,10 @@ entity dvbs2_encoder_tb is
     RUNNER_CFG            : string;
     TEST_CFG              : string := "";
     NUMBER_OF_TEST_FRAMES : integer := 1;
-    SEED                  : integer);
+    SEED                  : integer;
+    VERBOSE               : boolean := True;
+    FAIL_FAST             : boolean := False;
+    RAW_DUMP              : boolean := False);
 end dvbs2_encoder_tb;
 
 architecture dvbs2_encoder_tb of dvbs2_encoder_tb is
@@ -141,6 +144,7 @@ architecture dvbs2_encoder_tb of dvbs2_encoder_tb is
 
   signal expected_tdata     : std_logic_vector(IQ_WIDTH - 1 downto 0);
   signal expected_tlast     : std_logic;
+  signal error_cnt          : std_logic_vector(7 downto 0);
 
   signal recv_r             : complex;
   signal expected_r         : complex;
@@ -230,7 +234,8 @@ begin
       SWAP_BYTE_ENDIANESS => False,
       ERROR_CNT_WIDTH     => 8,
       REPORT_SEVERITY     => Error,
-      DUMP_FILE_FORMAT    => "actual_output_%d.csv")  -- Leave empty to disable
+      DUMP_FILE_FORMAT    => "actual_output_%d.csv",  -- Leave empty to disable
+      RAW_DUMP_FILE       => get_raw_dump_path(RUNNER_CFG, "output_checker", RAW_DUMP))
     port map (
       -- Usual ports
       clk                => clk,
@@ -238,7 +243,7 @@ begin
       -- Config and status
       tdata_error_cnt    => open,
       tlast_error_cnt    => open,
-      error_cnt          => open,
+      error_cnt          => error_cnt,
       -- Debug stuff
       expected_tdata     => expected_tdata,
       expected_tlast     => expected_tlast,
@@ -427,7 +432,8 @@ begin
       TOLERANCE         => 64,
         ERROR_CNT_WIDTH => 8,
         REPORT_SEVERITY => Error,
-        DATA_WIDTH      => IQ_WIDTH)
+        DATA_WIDTH      => IQ_WIDTH,
+        RAW_DUMP_FILE   => get_raw_dump_path(RUNNER_CFG, "constellation_mapper", RAW_DUMP))
       port map (
         -- Usual ports
         clk                => clk,
@@ -470,6 +476,21 @@ begin
   ---------------
   -- Processes --
   ---------------
+  -- Output frames are delimited by the expected tlast, same as the output checker does
+  config_results_p : process
+  begin
+    track_config_results(
+      runner_cfg        => RUNNER_CFG,
+      configs           => configs,
+      frames_per_config => NUMBER_OF_TEST_FRAMES,
+      fail_fast         => FAIL_FAST,
+      clk               => clk,
+      tvalid            => axi_slave.tvalid,
+      tready            => axi_slave.tready,
+      tlast             => expected_tlast,
+      error_cnt         => error_cnt);
+  end process;
+
   main : process -- {{ -----------------------------------------------------------------
     constant self                 : actor_t       := new_actor("main");
     constant logger               : logger_t      := get_logger("main");
@@ -780,7 +801,11 @@ begin
   begin
 
     test_runner_setup(runner, RUNNER_CFG);
-    show(display_handler, debug);
+    if VERBOSE then
+      show(display_handler, debug);
+    else
+      hide(display_handler, info);
+    end if;
 
     axi_cfg.awvalid <= '0';
     axi_cfg.arvalid <= '0';
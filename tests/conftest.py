@@ -0,0 +1,61 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"""
+Shared fixtures for the tests of the Python side of the test flow (run.py
+and the scripts in misc and gnuradio_data)
+"""
+
+import os.path as p
+import sys
+
+import pytest
+
+ROOT = p.abspath(p.join(p.dirname(__file__), ".."))
+
+# run.py adds misc and gnuradio_data to the path itself
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+import run  # type: ignore
+
+# pylint: enable=wrong-import-position
+
+
+@pytest.fixture
+def makeConfig(tmp_path):
+    """
+    Returns a function to create TestDefinition objects whose data goes to
+    tmp_path instead of gnuradio_data
+    """
+
+    def makeConfig(frame_type, constellation, code_rate, pilots=False):
+        config = run.TestDefinition.fromConfigTuple(
+            frame_type, constellation, code_rate, pilots
+        )
+        return run.TestDefinition(
+            config.name,
+            str(tmp_path / "data" / p.basename(config.test_files_path)),
+            code_rate,
+            frame_type,
+            constellation,
+            pilots,
+        )
+
+    return makeConfig
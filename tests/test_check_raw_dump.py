@@ -0,0 +1,173 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for misc/check_raw_dump.py"
+
+import itertools
+import os.path as p
+
+import pytest
+
+import check_raw_dump  # type: ignore
+
+
+def _getComponentBytes(data_width):
+    "Same as get_raw_dump_component_bytes in testbench/dvb_sim_utils_pkg.vhd"
+    size = 1
+    while 8 * size < data_width // 2:
+        size *= 2
+    return size
+
+
+def _writeDump(path, data_width, tolerance, entries):
+    """
+    Writes a raw dump the same way write_raw_dump_header and
+    write_raw_dump_entry do. entries is a list of (received, received_tlast,
+    expected, expected_tlast), with received and expected as (I, Q) tuples
+    """
+    size = _getComponentBytes(data_width)
+    with open(path, "wb") as fd:
+        fd.write(b"RAWD" + bytes([1, size]) + tolerance.to_bytes(2, "little"))
+        for received, received_tlast, expected, expected_tlast in entries:
+            for value in (*received, *expected):
+                fd.write(value.to_bytes(size, "little", signed=True))
+            fd.write(bytes([received_tlast + 2 * expected_tlast]))
+    return str(path)
+
+
+def _isWithinTolerance(received, expected, tolerance):
+    "Python version of check_within_tolerance in axi_file_compare_complex.vhd"
+    for value, reference in zip(received, expected):
+        low, high = reference - tolerance, reference + tolerance
+        if value != reference and (value < low or value > high):
+            return False
+    return True
+
+
+@pytest.mark.parametrize("data_width", (8, 16, 32, 34))
+def test_read_sign_extends_components(tmp_path, data_width):
+    limit = 1 << (data_width // 2 - 1)
+    entries = [
+        ((-limit, limit - 1), 0, (limit - 1, -limit), 1),
+        ((-1, 0), 1, (0, -1), 0),
+    ]
+    path = _writeDump(tmp_path / "dump.raw", data_width, 300, entries)
+
+    tolerance, data = check_raw_dump.read(path)
+    assert tolerance == 300
+    assert data.dtype["received_i"].itemsize == _getComponentBytes(data_width)
+    assert [
+        (
+            (int(x["received_i"]), int(x["received_q"])),
+            int(x["flags"]) & 1,
+            (int(x["expected_i"]), int(x["expected_q"])),
+            int(x["flags"]) >> 1,
+        )
+        for x in data
+    ] == entries
+
+
+@pytest.mark.parametrize("tolerance", (0, 1, 4, 64))
+def test_tolerance_matches_vhdl(tmp_path, tolerance):
+    expected = (100, -100)
+    deltas = range(-tolerance - 2, tolerance + 3)
+    entries = [
+        ((expected[0] + delta_i, expected[1] + delta_q), 1, expected, 1)
+        for delta_i, delta_q in itertools.product(deltas, repeat=2)
+    ]
+    path = _writeDump(tmp_path / "dump.raw", 32, tolerance, entries)
+
+    report = check_raw_dump.check(path)
+    assert report["tolerance"] == tolerance
+    assert report["words"] == report["frames"] == len(entries)
+    assert report["tlast_errors"] == 0
+
+    failed = {x["frame"] for x in report["first_mismatches"]}
+    assert failed == {
+        index
+        for index, (received, _, _, _) in enumerate(entries)
+        if not _isWithinTolerance(received, expected, tolerance)
+    }
+    assert report["tdata_errors"] == report["failed_frames"] == len(failed)
+
+
+def test_tolerance_override(tmp_path):
+    entries = [((10, 0), 0, (0, 0), 0), ((0, -5), 1, (0, 0), 1)]
+    path = _writeDump(tmp_path / "dump.raw", 32, 0, entries)
+
+    assert check_raw_dump.check(path)["tdata_errors"] == 2
+    assert check_raw_dump.check(path, tolerance=5)["tdata_errors"] == 1
+    assert check_raw_dump.check(path, tolerance=10)["tdata_errors"] == 0
+
+
+def test_frames_and_tlast_errors(tmp_path):
+    # Frames are delimited by the expected tlast, the first frame has a
+    # missing tlast and the second one has both a tdata and a tlast error
+    entries = [
+        ((1, 1), 0, (1, 1), 0),
+        ((2, 2), 0, (2, 2), 1),
+        ((3, 3), 1, (3, 3), 0),
+        ((4, 4), 0, (4, 9), 0),
+        ((5, 5), 1, (5, 5), 1),
+    ]
+    path = _writeDump(tmp_path / "dump.raw", 32, 0, entries)
+
+    report = check_raw_dump.check(path)
+    assert report["frames"] == 2
+    assert report["failed_frames"] == 2
+    assert report["tdata_errors"] == 1
+    assert report["tlast_errors"] == 2
+    assert [
+        (x["frame"], x["word"], x["tdata_error"], x["tlast_error"])
+        for x in report["first_mismatches"]
+    ] == [(0, 1, False, True), (1, 0, False, True)]
+    assert report["histogram"]["q"] == [[-5, 1], [0, 4]]
+
+
+def test_evm_skips_frames_without_expected_power(tmp_path):
+    entries = [
+        ((0, 0), 0, (0, 0), 1),
+        ((3, 4), 0, (30, 40), 1),
+    ]
+    path = _writeDump(tmp_path / "dump.raw", 32, 100, entries)
+
+    evm = check_raw_dump.check(path)["evm"]
+    assert evm["frames_percent"][0] is None
+    assert evm["frames_percent"][1] == pytest.approx(90)
+    assert evm["percent"] == pytest.approx(90)
+
+
+def test_check_directory(tmp_path):
+    _writeDump(tmp_path / "good.raw", 32, 0, [((1, 2), 1, (1, 2), 1)])
+    assert check_raw_dump.checkDirectory(str(tmp_path))
+    assert p.exists(tmp_path / "good.json")
+
+    _writeDump(tmp_path / "bad.raw", 32, 0, [((1, 2), 0, (1, 2), 1)])
+    assert not check_raw_dump.checkDirectory(str(tmp_path))
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "dump.raw"
+    path.write_bytes(b"RAW")
+    with pytest.raises(ValueError):
+        check_raw_dump.read(str(path))
+
+    path.write_bytes(b"DUMP" + bytes(4))
+    with pytest.raises(ValueError):
+        check_raw_dump.read(str(path))
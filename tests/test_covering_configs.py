@@ -0,0 +1,109 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for the covering array used to pick dvbs2_encoder_tb configs"
+
+import itertools
+import random
+
+import pytest
+
+import run  # type: ignore
+
+PARAMETERS = ("frame_type", "constellation", "code_rate", "pilots")
+
+
+def _getConfigs():
+    "Same configs _getTestSuites picks dvbs2_encoder_tb configs from"
+    return sorted(
+        run._getPhysicalLayerHeaderConfigs() & run._getConstellationMapperConfigs(),
+        key=lambda x: x.name,
+    )
+
+
+def _getRandomCosts(configs, seed):
+    rng = random.Random(seed)
+    return {config: rng.uniform(1, 100) for config in configs}
+
+
+def _getCombinations(configs, strength):
+    "Values of every strength parameters that appear together in configs"
+    return {
+        (names, tuple(getattr(config, x) for x in names))
+        for config in configs
+        for names in itertools.combinations(PARAMETERS, strength)
+    }
+
+
+@pytest.mark.parametrize("strength", (1, 2, 3))
+@pytest.mark.parametrize("seed", (0, 1, 2))
+def test_covers_all_combinations(strength, seed):
+    configs = _getConfigs()
+    selected = run._getCoveringConfigs(
+        configs, _getRandomCosts(configs, seed), strength=strength, seed=seed
+    )
+
+    assert len(set(selected)) == len(selected)
+    assert set(selected) <= set(configs)
+    assert _getCombinations(selected, strength) == _getCombinations(configs, strength)
+
+
+def test_pairwise_coverage_is_close_to_the_lower_bound():
+    configs = _getConfigs()
+    selected = run._getCoveringConfigs(configs, _getRandomCosts(configs, 0))
+
+    # Every value pair of the pair of parameters with the most of them needs
+    # its own config
+    lower_bound = max(
+        len({tuple(getattr(config, x) for x in names) for config in configs})
+        for names in itertools.combinations(PARAMETERS, 2)
+    )
+    assert len(selected) <= 1.25 * lower_bound
+
+
+def test_covering_configs_only_depend_on_seed():
+    configs = _getConfigs()
+    expected = run._getCoveringConfigs(configs, _getRandomCosts(configs, 0), seed=3)
+
+    # Shards may have different history files or none at all
+    for seed in range(1, 5):
+        shuffled = random.Random(seed).sample(configs, len(configs))
+        assert (
+            run._getCoveringConfigs(shuffled, _getRandomCosts(configs, seed), seed=3)
+            == expected
+        )
+
+
+def test_time_budget_adds_configs_within_budget():
+    configs = _getConfigs()
+    costs = _getRandomCosts(configs, 0)
+    covering = run._getCoveringConfigs(configs, costs)
+    budget = sum(costs[x] for x in covering) + 500
+
+    selected = run._getCoveringConfigs(configs, costs, time_budget=budget)
+    assert selected[: len(covering)] == covering
+    assert len(selected) > len(covering)
+    assert sum(costs[x] for x in selected) <= budget
+
+
+def test_large_time_budget_selects_all_configs():
+    configs = _getConfigs()
+    costs = _getRandomCosts(configs, 0)
+    selected = run._getCoveringConfigs(configs, costs, time_budget=sum(costs.values()))
+    assert sorted(selected, key=lambda x: x.name) == configs
@@ -0,0 +1,107 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for the binary LDPC tables written by run.py"
+
+import numpy  # type: ignore
+import pytest
+
+import dvbs2_encoder_model  # type: ignore
+import run  # type: ignore
+from run import CodeRate, FrameType  # type: ignore
+
+
+def _readLdpcTable(path):
+    "Reads a table like read_ldpc_table_header and read_ldpc_table_entry do"
+    with open(path, "rb") as fd:
+        header = run.LDPC_TABLE_HEADER.unpack(fd.read(run.LDPC_TABLE_HEADER.size))
+        return header, numpy.fromfile(fd, dtype=run.LDPC_TABLE_ENTRY)
+
+
+@pytest.fixture(autouse=True)
+def tablesPath(monkeypatch, tmp_path):
+    monkeypatch.setattr(run, "LDPC_TABLES_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "frame_type, code_rate",
+    (
+        (FrameType.FECFRAME_SHORT, CodeRate.C1_4),
+        (FrameType.FECFRAME_SHORT, CodeRate.C8_9),
+        (FrameType.FECFRAME_NORMAL, CodeRate.C3_5),
+        (FrameType.FECFRAME_NORMAL, CodeRate.C9_10),
+    ),
+)
+def test_table_matches_model(frame_type, code_rate):
+    (path,) = run._populateLdpcTable(frame_type, code_rate)
+    assert run._isLdpcTableValid(path)
+
+    header, entries = _readLdpcTable(path)
+    magic, version, frame_type_pos, code_rate_pos, _, length = header
+    assert magic == run.LDPC_TABLE_MAGIC
+    assert version == run.LDPC_TABLE_VERSION
+    assert frame_type_pos == list(FrameType).index(frame_type) + 1
+    assert code_rate_pos == list(CodeRate).index(code_rate) + 1
+    assert length == len(entries)
+
+    offsets, is_last, _ = dvbs2_encoder_model.getLdpcTable(
+        frame_type.name, code_rate.name
+    )
+    numpy.testing.assert_array_equal(entries["offset"], offsets)
+    numpy.testing.assert_array_equal(entries["flags"], is_last)
+
+
+def test_text_table_has_one_line_per_bit():
+    frame_type, code_rate = FrameType.FECFRAME_SHORT, CodeRate.C1_4
+    bin_path, text_path = run._populateLdpcTable(frame_type, code_rate, True)
+
+    _, entries = _readLdpcTable(bin_path)
+    with open(text_path, "r") as fd:
+        lines = fd.read().split("\n")
+
+    _, _, bit_index = dvbs2_encoder_model.getLdpcTable(frame_type.name, code_rate.name)
+    assert len(lines) == bit_index[-1] + 1
+    # Each line lists the (word, offset) pairs of a bit, words cover the
+    # whole binary table
+    pairs = [
+        [int(x) for x in pair.split(",")]
+        for line in lines
+        for pair in line.split("||")[1].split("|")
+        if pair.strip()
+    ]
+    assert [word for word, _ in pairs] == list(range(len(entries)))
+    assert [offset for _, offset in pairs] == list(entries["offset"])
+
+
+def test_valid_table_is_not_rewritten():
+    args = (FrameType.FECFRAME_SHORT, CodeRate.C1_2)
+    assert run._populateLdpcTable(*args) is not None
+    assert run._populateLdpcTable(*args) is None
+
+
+def test_invalid_table_is_rewritten(tablesPath):
+    args = (FrameType.FECFRAME_SHORT, CodeRate.C1_2)
+    path = run._getLdpcTablePath(*args)
+    with open(path, "w") as fd:
+        fd.write("1, 2, 3\n")
+
+    assert not run._isLdpcTableValid(path)
+    assert run._populateLdpcTable(*args) == [path]
+    assert run._isLdpcTableValid(path)
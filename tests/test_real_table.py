@@ -0,0 +1,136 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for the real tables read by read_real_table in the testbenches"
+
+import logging
+import os.path as p
+import struct
+import sys
+
+import numpy  # type: ignore
+
+import dvbs2_encoder_model  # type: ignore
+import run  # type: ignore
+from run import CodeRate, ConstellationType, FrameType  # type: ignore
+
+VALUES = (
+    0.0,
+    -0.0,
+    1.0,
+    -1.5,
+    0.1,
+    numpy.pi,
+    -1e-300,
+    5e-324,
+    sys.float_info.max,
+    0.7071067811865476,
+)
+
+
+def _toRealFloat64(data):
+    "Python version of to_real_float64 in testbench/dvb_sim_utils_pkg.vhd"
+    exponent = (data[7] % 128) * 16 + data[6] // 16
+
+    mantissa = float(data[6] % 16)
+    for i in range(5, -1, -1):
+        mantissa = mantissa * 256.0 + float(data[i])
+
+    assert exponent != 2047, "Infinite and NaN values are not supported"
+    if exponent == 0:
+        result = mantissa * 2.0**-52 * 2.0**-1022
+    else:
+        result = (1.0 + mantissa * 2.0**-52) * 2.0 ** (exponent - 1023)
+
+    return -result if data[7] >= 128 else result
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "table.bin")
+    dvbs2_encoder_model.writeRealTable(VALUES, path)
+
+    assert dvbs2_encoder_model.isRealTable(path)
+    numpy.testing.assert_array_equal(dvbs2_encoder_model.readRealTable(path), VALUES)
+
+
+def test_vhdl_reader_decodes_values(tmp_path):
+    path = str(tmp_path / "table.bin")
+    dvbs2_encoder_model.writeRealTable(VALUES, path)
+
+    with open(path, "rb") as fd:
+        data = fd.read()
+
+    header = dvbs2_encoder_model.REAL_TABLE_HEADER
+    assert data[:4] == b"REAL"
+    assert data[4] == 1
+    (length,) = struct.unpack_from("<I", data, 8)
+    assert length == len(VALUES)
+    assert len(data) == header.size + 8 * length
+
+    assert [
+        _toRealFloat64(data[offset : offset + 8])
+        for offset in range(header.size, len(data), 8)
+    ] == list(VALUES)
+
+
+def test_multidimensional_data_is_flattened(tmp_path):
+    path = str(tmp_path / "table.bin")
+    data = numpy.arange(12, dtype=numpy.float64).reshape(3, 4)
+    dvbs2_encoder_model.writeRealTable(data, path)
+    numpy.testing.assert_array_equal(
+        dvbs2_encoder_model.readRealTable(path), data.ravel()
+    )
+
+
+def test_text_tables_are_still_read(tmp_path, caplog):
+    path = tmp_path / "table.bin"
+    path.write_text("0.5\n-0.25\n1e-3\n")
+
+    assert not dvbs2_encoder_model.isRealTable(str(path))
+    with caplog.at_level(logging.WARNING):
+        values = dvbs2_encoder_model.readRealTable(str(path))
+
+    numpy.testing.assert_array_equal(values, (0.5, -0.25, 1e-3))
+    assert "deprecated" in caplog.text
+
+
+def test_coefficients_are_scaled(tmp_path):
+    path = str(tmp_path / "polyphase_coefficients.bin")
+    dvbs2_encoder_model.writeCoefficientsToFile([1.0, -0.5, 0.25], path)
+    numpy.testing.assert_array_equal(
+        dvbs2_encoder_model.readRealTable(path), (0.5, -0.25, 0.125)
+    )
+
+
+def test_modulation_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(run, "MODULATION_TABLES_PATH", str(tmp_path))
+    args = (FrameType.FECFRAME_SHORT, ConstellationType.MOD_16APSK, CodeRate.C2_3)
+
+    (path,) = run._createModulationTable(*args)
+    assert p.dirname(path) == str(tmp_path)
+    numpy.testing.assert_array_equal(
+        dvbs2_encoder_model.readRealTable(path),
+        numpy.ravel(run._getModulationTable(*args)),
+    )
+
+    # Tables in the current format are kept, text ones are replaced
+    assert run._createModulationTable(*args) is None
+    with open(path, "w") as fd:
+        fd.write("0.0\n")
+    assert run._createModulationTable(*args) == [path]
@@ -0,0 +1,138 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for run.ReferenceDataCache"
+
+import os
+import os.path as p
+
+import pytest
+
+import run  # type: ignore
+from run import CodeRate, ConstellationType, FrameType  # type: ignore
+
+
+@pytest.fixture
+def config(makeConfig):
+    return makeConfig(
+        FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_2
+    )
+
+
+def _writeData(config, files):
+    os.makedirs(config.test_files_path, exist_ok=True)
+    for filename, contents in files.items():
+        with open(p.join(config.test_files_path, filename), "wb") as fd:
+            fd.write(contents)
+
+
+def _addEntry(cache_dir, name, size, mtime):
+    entry = cache_dir / name
+    entry.mkdir()
+    (entry / "data.bin").write_bytes(bytes(size))
+    os.utime(entry, (mtime, mtime))
+    return entry
+
+
+def test_key_ignores_pilots(makeConfig):
+    cache = run.ReferenceDataCache(use_gnuradio=False, seed=0)
+    args = (FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_2)
+    assert cache.getKey(makeConfig(*args, pilots=False)) == cache.getKey(
+        makeConfig(*args, pilots=True)
+    )
+
+
+def test_key_depends_on_config_seed_and_frames(monkeypatch, config, makeConfig):
+    cache = run.ReferenceDataCache(use_gnuradio=False, seed=0)
+    key = cache.getKey(config)
+
+    other = makeConfig(
+        FrameType.FECFRAME_SHORT, ConstellationType.MOD_QPSK, CodeRate.C1_3
+    )
+    assert cache.getKey(other) != key
+
+    assert run.ReferenceDataCache(use_gnuradio=False, seed=1).getKey(config) != key
+
+    monkeypatch.setattr(run, "REFERENCE_DATA_FRAMES", run.REFERENCE_DATA_FRAMES + 1)
+    assert cache.getKey(config) != key
+
+
+def test_key_depends_on_generator(config):
+    assert run.ReferenceDataCache(use_gnuradio=False, seed=0).getKey(
+        config
+    ) != run.ReferenceDataCache(use_gnuradio=True, seed=0).getKey(config)
+
+
+def test_store_and_fetch(tmp_path, config):
+    cache_dir = tmp_path / "cache"
+    cache = run.ReferenceDataCache(use_gnuradio=False, seed=0, cache_dir=cache_dir)
+
+    assert not cache.isFresh(config)
+    assert not cache.fetch(config)
+
+    _writeData(config, {"data.bin": b"data", "ldpc_table.bin": b"table"})
+    cache.store(config)
+    assert cache.isFresh(config)
+
+    entry = cache_dir / cache.getKey(config)
+    assert sorted(os.listdir(entry)) == ["data.bin"]
+
+    # A different workspace gets the data from the cache
+    for filename in os.listdir(config.test_files_path):
+        os.remove(p.join(config.test_files_path, filename))
+    assert cache.fetch(config)
+    assert cache.isFresh(config)
+    with open(p.join(config.test_files_path, "data.bin"), "rb") as fd:
+        assert fd.read() == b"data"
+
+    # Data generated with a different seed is stale
+    assert not run.ReferenceDataCache(
+        use_gnuradio=False, seed=1, cache_dir=cache_dir
+    ).isFresh(config)
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    oldest = _addEntry(cache_dir, "a", 100, 1000)
+    newest = _addEntry(cache_dir, "b", 100, 3000)
+    middle = _addEntry(cache_dir, "c", 100, 2000)
+    # Entries being stored are not evicted
+    temp = _addEntry(cache_dir, ".tmp_d", 100, 0)
+
+    run.ReferenceDataCache(
+        use_gnuradio=False, seed=0, cache_dir=cache_dir, max_size=250
+    ).evict()
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists() and temp.exists()
+
+    run.ReferenceDataCache(
+        use_gnuradio=False, seed=0, cache_dir=cache_dir, max_size=100
+    ).evict()
+    assert not middle.exists()
+    assert newest.exists()
+
+
+def test_evict_without_max_size_keeps_everything(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    entry = _addEntry(cache_dir, "a", 100, 1000)
+
+    run.ReferenceDataCache(use_gnuradio=False, seed=0, cache_dir=cache_dir).evict()
+    assert entry.exists()
@@ -0,0 +1,136 @@
+#
+# DVB FPGA
+#
+# Copyright 2019-2022 by suoto <andre820@gmail.com>
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+#
+# You may redistribute and modify this source and make products using it under
+# the terms of the CERN-OHL-W v2 (https://ohwr.org/cern_ohl_w_v2.txt).
+#
+# This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY, INCLUDING
+# OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A PARTICULAR PURPOSE.
+# Please see the CERN-OHL-W v2 for applicable conditions.
+#
+# Source location: https://github.com/phase4ground/dvb_fpga
+#
+# As per CERN-OHL-W v2 section 4.1, should You produce hardware based on this
+# source, You must maintain the Source Location visible on the external case of
+# the DVB Encoder or other products you make using this source.
+"Tests for splitting tests between machines with --shard"
+
+import argparse
+import random
+
+import pytest
+
+import run  # type: ignore
+from run import ConstellationType  # type: ignore
+
+
+class _History:  # pylint: disable=too-few-public-methods
+    "Stands in for run.SimulationHistory with fixed random costs"
+
+    def __init__(self, seed):
+        self._rng = random.Random(seed)
+        self._costs = {}
+
+    def getCosts(self, testbench, configs):
+        return {
+            config: self._costs.setdefault(
+                (testbench, config.name), self._rng.uniform(1, 100)
+            )
+            for config in configs
+        }
+
+
+def _getSuites():
+    return [
+        (
+            "axi_bch_encoder_tb",
+            list(
+                run._getConfigs(
+                    constellations=(ConstellationType.MOD_8PSK,), pilots=False
+                )
+            ),
+            False,
+        ),
+        ("axi_baseband_scrambler_tb", list(run._getConfigs()), True),
+    ]
+
+
+def _getShards(suites, count, history=None):
+    return [
+        run._shardTestSuites(suites, index, count, history)
+        for index in range(1, count + 1)
+    ]
+
+
+@pytest.mark.parametrize("count", (1, 2, 3, 7))
+@pytest.mark.parametrize("history", (None, _History(0)))
+def test_shards_partition_configs(count, history):
+    suites = _getSuites()
+    shards = _getShards(suites, count, history)
+
+    for position, (testbench, configs, individual_config_runs) in enumerate(suites):
+        sharded = [shard[position] for shard in shards]
+        assert all(x[0] == testbench for x in sharded)
+        assert all(x[2] == individual_config_runs for x in sharded)
+
+        # Every config is in exactly one shard and keeps its relative order
+        merged = [config for _, configs, _ in sharded for config in configs]
+        assert sorted(merged) == sorted(configs)
+        for _, shard_configs, _ in sharded:
+            assert shard_configs == [x for x in configs if x in shard_configs]
+
+
+@pytest.mark.parametrize("history", (None, _History(1)))
+def test_shards_dont_depend_on_the_order_of_configs(history):
+    suites = _getSuites()
+    shuffled = [
+        (testbench, random.Random(0).sample(configs, len(configs)), flag)
+        for testbench, configs, flag in suites
+    ]
+
+    for shard, other in zip(
+        _getShards(suites, 4, history), _getShards(shuffled, 4, history)
+    ):
+        for (_, configs, _), (_, other_configs, _) in zip(shard, other):
+            assert sorted(configs) == sorted(other_configs)
+
+
+def test_shards_are_balanced():
+    suites = _getSuites()
+    history = _History(2)
+    costs = {
+        (testbench, config): cost
+        for testbench, configs, _ in suites
+        for config, cost in history.getCosts(testbench, configs).items()
+    }
+
+    totals = [
+        sum(costs[(testbench, x)] for testbench, configs, _ in shard for x in configs)
+        for shard in _getShards(suites, 5, history)
+    ]
+    # Longest processing time first is never off by more than one item
+    assert max(totals) - min(totals) <= max(costs.values())
+
+
+def test_more_shards_than_configs():
+    config = next(run._getConfigs())
+    suites = [("axi_bch_encoder_tb", [config], False)]
+    shards = _getShards(suites, 3)
+    assert [configs for ((_, configs, _),) in shards] == [[config], [], []]
+
+
+@pytest.mark.parametrize(
+    "value, expected", (("1/1", (1, 1)), ("2/3", (2, 3)), ("3/3", (3, 3)))
+)
+def test_parse_shard(value, expected):
+    assert run._parseShard(value) == expected
+
+
+@pytest.mark.parametrize("value", ("0/2", "3/2", "1", "a/b", "1/2/3"))
+def test_parse_shard_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        run._parseShard(value)